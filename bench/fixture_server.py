@@ -0,0 +1,265 @@
+# bench/fixture_server.py
+# 오프라인 fixture 서버: 로그인 없이 봇을 돌려볼 수 있도록 네이버 페이지 구조를 흉내 낸 HTML을 로컬에서 제공
+# - 봇이 쓰는 셀렉터(config.SELECTORS)와 같은 구조로 페이지를 생성 (결과는 매번 동일)
+# - bench/fixtures/<이름>.html 이 있으면 생성 대신 저장된 스냅샷을 그대로 제공
+#   (blog_home / theme_post / news / post_view : 실제 페이지를 '다른 이름으로 저장'한 파일)
+# - POST /generate : AI백엔드=http 용 댓글 생성 스텁 (요청 {prompt, post} -> 응답 {text, tokens})
+import os
+import html
+import json
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+NICKNAMES = ["하늘여행", "책읽는밤", "오늘의요리", "캠핑러버", "코딩하는곰", "달빛정원", "주말농부",
+             "카페투어", "러닝메이트", "사진한컷", "육아일기", "맛집헌터", "영화수다", "식물집사"]
+
+LIKE_SCRIPT = """
+<script>
+document.addEventListener('click', e => {
+    const btn = e.target.closest('.u_likeit_list_btn');
+    if (btn) btn.setAttribute('aria-pressed', 'true');
+});
+</script>
+"""
+
+# 알림 카드는 스크롤이 바닥 근처에 닿을 때마다 한 묶음씩 추가 (모바일 무한 스크롤 흉내)
+NEWS_SCRIPT = """
+<script>
+const pending = Array.from(document.querySelectorAll('#pending li'));
+const list = document.getElementById('noti_list');
+function loadMore() {
+    pending.splice(0, %(batch)d).forEach(li => list.appendChild(li));
+    if (!pending.length) document.getElementById('footer').style.display = 'block';
+}
+loadMore();
+window.addEventListener('scroll', () => {
+    if (pending.length && window.innerHeight + window.scrollY >= document.body.scrollHeight - 300) loadMore();
+});
+</script>
+"""
+
+def _page(title, body):
+    return (f"<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+            "<style>body{font-family:sans-serif;margin:0}li{list-style:none}"
+            ".item_inner,.info_post{height:260px;border-bottom:1px solid #ddd;padding:10px}"
+            ".u_likeit_list_btn{display:inline-block;width:80px;height:30px;background:#eee}"
+            ".item__INKiv{height:90px;border-bottom:1px solid #eee}</style>"
+            f"</head><body>{body}</body></html>")
+
+class FixtureSite:
+    """fixture 데이터 (페이지 수/게시글 수 고정, seed가 같으면 항상 같은 내용)"""
+    def __init__(self, feed_pages=3, feed_items=10, theme_pages=2, theme_items=20,
+                 noti_cards=120, noti_batch=20, liked_every=4, seed=17):
+        self.feed_pages = feed_pages
+        self.feed_items = feed_items
+        self.theme_pages = theme_pages
+        self.theme_items = theme_items
+        self.noti_cards = noti_cards
+        self.noti_batch = noti_batch
+        self.liked_every = liked_every
+        self.seed = seed
+
+    def _nick(self, n):
+        return f"{NICKNAMES[n % len(NICKNAMES)]}{n // len(NICKNAMES) or ''}"
+
+    @property
+    def unliked_feed_items(self):
+        """공감 가능한(미공감) 피드 게시글 총수 (공감 벤치마크 목표치)"""
+        total = self.feed_pages * self.feed_items
+        return total - len(range(0, total, self.liked_every))
+
+    def blog_home(self, page):
+        items = []
+        if 1 <= page <= self.feed_pages:
+            for i in range(self.feed_items):
+                n = (page - 1) * self.feed_items + i
+                blog_id = f"fixture{n:04d}"
+                liked = "true" if n % self.liked_every == 0 else "false"
+                items.append(
+                    f"<div class='item_inner'>"
+                    f"<a class='author' href='/blog/{blog_id}'><em class='name_author'>{self._nick(n)}</em></a>"
+                    f"<a class='desc_inner' href='/blog/{blog_id}/1000{n}'>게시글 {n} 미리보기</a>"
+                    f"<span class='reply' onclick=\"window.open('/blog/{blog_id}')\">댓글</span>"
+                    f"<div class='u_likeit_list_module'><a class='u_likeit_list_btn' aria-pressed='{liked}'>공감</a></div>"
+                    f"</div>")
+        return _page("BlogHome", "<div id='feed'>" + "".join(items) + "</div>" + LIKE_SCRIPT)
+
+    def theme_post(self, page):
+        rng = random.Random(self.seed * 1000 + page)
+        items = []
+        if 1 <= page <= self.theme_pages:
+            for i in range(self.theme_items):
+                n = (page - 1) * self.theme_items + i
+                items.append(
+                    f"<div class='info_post'>"
+                    f"<div class='writer_info'><span class='name_author'>{self._nick(n)}</span></div>"
+                    f"<a class='desc_inner' href='/blog/theme{n:04d}'>주제 게시글 {n}</a>"
+                    f"<span class='like'>공감 <em>{rng.randint(0, 60):,}</em></span>"
+                    f"<span class='reply'>댓글 <em>{rng.randint(0, 40):,}</em></span>"
+                    f"</div>")
+        return _page("ThemePost", "".join(items))
+
+    def news(self):
+        rng = random.Random(self.seed)
+        icons = [("icon_like__FHrQX", "공감했습니다"), ("icon_comment__a6XpX", "댓글을 남겼습니다"),
+                 ("icon_reply__i_ssm", "답글을 남겼습니다")]
+        cards = []
+        for n in range(self.noti_cards):
+            icon, text = icons[rng.randrange(len(icons))]
+            minutes = n * 3 + 1
+            date = f"{minutes}분 전" if minutes < 60 else f"{minutes // 60}시간 전"
+            cards.append(
+                f"<li class='item__INKiv'><i class='{icon}'></i>"
+                f"<strong class='text_green__kHPOw'>{self._nick(rng.randrange(40))}</strong> 님이 {text}"
+                f"<p class='title__KPI3G'>게시글 {rng.randrange(200)}</p>"
+                f"<span class='date__Xq1Ab'>{date}</span></li>")
+        body = ("<ul id='noti_list'></ul><ul id='pending' style='display:none'>" + "".join(cards) + "</ul>"
+                "<div id='footer' class='scroll_top__YuIw9' style='display:none'><button>맨 위로</button></div>"
+                + NEWS_SCRIPT % {'batch': self.noti_batch})
+        return _page("News", body)
+
+    def blog_frame(self, blog_id):
+        return _page(blog_id, f"<iframe id='mainFrame' name='mainFrame' src='/blog/{blog_id}/PostView' "
+                              "style='width:100%;height:800px;border:0'></iframe>")
+
+    def post_view(self, blog_id):
+        paragraph = f"{blog_id} 블로그의 fixture 본문입니다. 벤치마크에서 본문 추출 비용을 재기 위한 문장입니다. "
+        body = (f"<div class='se-title-text'>{blog_id}의 오늘 기록</div>"
+                f"<div class='se-main-container'>{paragraph * 6}</div>"
+                "<div class='u_cbox_write_wrap'>"
+                "<div class='u_cbox_text u_cbox_text_mention' contenteditable='true' style='min-height:40px'></div>"
+                "<button class='u_cbox_btn_upload'>등록</button></div>")
+        return _page("PostView", body)
+
+    def generate_comment(self, prompt, post):
+        """AI 댓글 스텁 응답 (게시글 제목 기반 고정 문장, 토큰 수는 글자 수로 근사)"""
+        title = ""
+        for line in post.splitlines():
+            if line.startswith("제목:"):
+                title = line[len("제목:"):].strip()
+                break
+        text = f"'{title}' 잘 읽었어요! 좋은 글 감사합니다 :)" if title else "좋은 글 잘 읽고 갑니다 :)"
+        return {"text": text, "tokens": (len(prompt) + len(post)) // 2}
+
+class _Handler(BaseHTTPRequestHandler):
+    site = None  # FixtureServer가 서버별로 지정
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        page = int((query.get("currentPage") or ["1"])[0])
+        parts = [p for p in url.path.split("/") if p]
+
+        if url.path == "/section/BlogHome.naver":
+            body = self._snapshot("blog_home", page, self.site.feed_pages) or self.site.blog_home(page)
+        elif url.path == "/section/ThemePost.naver":
+            body = self._snapshot("theme_post", page, self.site.theme_pages) or self.site.theme_post(page)
+        elif url.path == "/mblog/News.naver":
+            body = self._snapshot("news") or self.site.news()
+        elif len(parts) >= 2 and parts[0] == "blog":
+            if parts[-1] == "PostView":
+                body = self._snapshot("post_view") or self.site.post_view(parts[1])
+            else:
+                body = self.site.blog_frame(parts[1])
+        elif url.path in ("/main", "/login"):
+            body = _page("fixture", "<h1>fixture</h1>")
+        else:
+            self.send_error(404)
+            return
+
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _snapshot(name, page=1, last_page=1):
+        """저장된 스냅샷이 있으면 반환 (목록형은 last_page 이후 빈 페이지)"""
+        path = os.path.join(FIXTURE_DIR, f"{name}.html")
+        if not os.path.exists(path):
+            return None
+        if page > last_page:
+            return _page(name, "")
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/generate":
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length).decode("utf-8") or "{}")
+        except (ValueError, UnicodeDecodeError):
+            self.send_error(400)
+            return
+        data = json.dumps(self.site.generate_comment(request.get("prompt") or "", request.get("post") or ""),
+                          ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # 요청 로그 생략 (측정 출력만 남김)
+
+class FixtureServer:
+    """
+    로컬 fixture 서버 (with 문으로 사용, port=0이면 빈 포트 자동 선택)
+    - naver_urls(): config.NAVER_URLS 대신 쓸 주소 묶음
+    """
+    def __init__(self, site=None, host="127.0.0.1", port=0):
+        self.site = site or FixtureSite()
+        handler = type("FixtureHandler", (_Handler,), {"site": self.site})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def naver_urls(self):
+        base = self.base_url
+        return {
+            "section": f"{base}/section",
+            "mobile_blog": f"{base}/mblog",
+            "blog": f"{base}/blog",
+            "main": f"{base}/main",
+            "login": f"{base}/login",
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="FixtureServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == "__main__":
+    import time
+    with FixtureServer(port=8766) as server:
+        print(f"🧪 fixture 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+        for key, url in server.naver_urls().items():
+            print(f"   {key:12s} {url}")
+        print(f"   {'ai':12s} {server.base_url}/generate (AI백엔드=http)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,100 @@
+# bench/replay_bench.py
+# 기록 재생 벤치마크/회귀 검사: NAVER_BOT_RECORD=1 로 저장한 기록을 브라우저 없이 반복 재생하여
+# 봇 제어 흐름 비용(초당 재생 횟수)과 WebDriver 왕복 수 변화를 확인
+#
+# 사용법 (저장소 루트에서):  python bench/replay_bench.py user_data/reports/recording_like_task_....json.gz [--runs 200] [--lenient]
+# - 기록보다 왕복이 늘거나 순서가 바뀌면 불일치로 보고하고 종료 코드 1 반환
+# - 스마트 관리 기록은 함께 저장된 DB 사본을 매 재생마다 새로 복사해서 사용
+# - AI 댓글 결과와 현재 시각은 기록 값을 사용하므로 API 키/네트워크 없이도 기록과 같은 흐름으로 재생
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "system"))
+
+import config
+import utils
+from driver_replay import ReplayDriver, load_recording
+from bot_class.db_manager import BlogDB
+
+def run_bot(driver, task, params):
+    """ActionWorker.run 과 같은 방식으로 봇 실행 (GUI 없이)"""
+    if task == "like_task":
+        from bot_class.blog_likes_neighbor import BlogLikesNeighbor
+        BlogLikesNeighbor(driver).run(params['cnt'], params['pg'])
+    elif task == "add_task":
+        from bot_class.blog_add_neighbor import BlogAddNeighbor
+        BlogAddNeighbor(driver).run(params['main_id'], params['sub_id'], params['cnt'], params['pg'])
+    elif task == "smart_neighbor_management_task":
+        from bot_class.blog_smart_neighbor_management import BlogSmartNeighborManagement
+        BlogSmartNeighborManagement(driver).run(params)
+    else:
+        raise ValueError(f"재생할 수 없는 작업입니다: {task}")
+
+def main():
+    parser = argparse.ArgumentParser(description="WebDriver 기록 재생 벤치마크")
+    parser.add_argument("recording", help="recording_*.json.gz 파일")
+    parser.add_argument("--runs", type=int, default=100, help="재생 횟수")
+    parser.add_argument("--lenient", action="store_true", help="불일치 시 최대 50개 앞까지 찾아 이어서 재생")
+    args = parser.parse_args()
+    if args.runs < 1:
+        parser.error("--runs 는 1 이상이어야 합니다.")
+
+    recording = load_recording(args.recording)
+    meta = recording['meta']
+    snapshot = None
+    if meta.get('db_snapshot'):
+        snapshot = os.path.join(os.path.dirname(os.path.abspath(args.recording)), meta['db_snapshot'])
+
+    temp_dir = tempfile.mkdtemp(prefix="naver_replay_")
+    utils.set_delay_scale(0)
+    driver = ReplayDriver(recording, strict=not args.lenient)
+    print(f"📼 {meta['task']} 기록 재생 ({meta['created_at']}, 명령 {len(recording['commands'])}개) x {args.runs}회")
+
+    elapsed = 0.0
+    report = None
+    try:
+        for i in range(args.runs):
+            # 매 재생마다 기록 시작 시점과 같은 DB 상태에서 출발
+            BlogDB.close()
+            config.path_db = os.path.join(temp_dir, f"replay_{i}.db")
+            if snapshot:
+                shutil.copyfile(snapshot, config.path_db)
+            driver.rewind()
+
+            start = time.perf_counter()
+            with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+                try:
+                    run_bot(driver, meta['task'], meta['params'])
+                except Exception as e:
+                    print(f"재생 중 예외: {e}")
+            elapsed += time.perf_counter() - start
+
+            report = driver.replay_report()
+            if report['mismatches'] or report['remaining'] or report['inputs_remaining']:
+                print(f"\n❌ {i + 1}회차 재생이 기록과 다릅니다.")
+                break
+            if os.path.exists(config.path_db):
+                BlogDB.close()
+                os.remove(config.path_db)
+    finally:
+        BlogDB.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    runs_done = i + 1
+    print(f"   재생 {runs_done}회 | 회당 {elapsed / runs_done * 1000:.2f}ms | 초당 {runs_done / elapsed if elapsed else 0:.0f}회")
+    print(f"   회당 왕복 {report['served']}회 | 남은 기록 {report['remaining']} | 건너뜀 {report['skipped']} | "
+          f"입력 차이 {report['extra_keys']} | 남은 AI 입력 {report['inputs_remaining']}")
+    for mismatch in report['mismatches'][:5]:
+        print(f"   ⚠️ 위치 {mismatch['at']}: 요청 {mismatch['requested']} / 기록 {mismatch['expected']}")
+    if report['remaining']:
+        print("   ⚠️ 기록보다 왕복이 줄었습니다. (의도한 최적화라면 새로 기록하세요)")
+    sys.exit(1 if report['mismatches'] or report['remaining'] or report['inputs_remaining'] else 0)
+
+if __name__ == "__main__":
+    main()
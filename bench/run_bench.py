@@ -0,0 +1,240 @@
+# bench/run_bench.py
+# 파싱/계획 벤치마크: fixture 서버 + 헤드리스 Chrome으로 실제 봇 클래스를 실행하여
+# 페이지별 추출 시간, WebDriver 왕복 횟수, 계획(planner) 비용을 측정
+#
+# 사용법 (저장소 루트에서):  python bench/run_bench.py [--repeat 5] [--json 결과.json] [--show-browser]
+# - 사람 흉내 대기(smart_sleep 등)는 0배로 줄여 순수 실행 비용만 측정
+# - 실제 사용자 DB/설정 대신 임시 DB를 사용 (로그인/네트워크 불필요)
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "system"))
+
+import config
+import utils
+from fixture_server import FixtureServer, FixtureSite
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+class RoundTripCounter:
+    """driver.execute를 감싸 WebDriver 명령 왕복 횟수를 명령별로 집계 (요소 메서드도 같은 경로를 지남)"""
+    def __init__(self, driver):
+        self.driver = driver
+        self.counts = {}
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    def _counting_execute(self, driver_command, params=None):
+        self.counts[driver_command] = self.counts.get(driver_command, 0) + 1
+        return self._execute(driver_command, params)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    @contextlib.contextmanager
+    def measure(self, result):
+        """구간 소요 시간(ms)과 왕복 횟수를 result dict에 기록"""
+        before = dict(self.counts)
+        start = time.perf_counter()
+        try:
+            yield result
+        finally:
+            result['ms'] = round((time.perf_counter() - start) * 1000, 2)
+            diff = {k: v - before.get(k, 0) for k, v in self.counts.items() if v != before.get(k, 0)}
+            result['round_trips'] = sum(diff.values())
+            result['commands'] = diff
+
+def create_driver(show_browser=False):
+    options = Options()
+    if not show_browser:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1200,900")
+    options.add_argument(f"user-agent={config.USER_AGENT}")
+    return webdriver.Chrome(options=options)
+
+@contextlib.contextmanager
+def quiet():
+    """봇 로그 출력 숨김 (측정 결과만 출력)"""
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+# ==========================================================
+# 개별 벤치마크 (각 함수는 결과 dict 목록 반환)
+# ==========================================================
+def bench_feed_snapshot(driver, counter, site, repeat):
+    """BlogHome 피드 스냅샷 추출 (페이지별, repeat회 평균)"""
+    from bot_class.feed_snapshot import capture_feed_snapshot
+    results = []
+    for page in range(1, site.feed_pages + 1):
+        driver.get(f"{config.NAVER_URLS['section']}/BlogHome.naver?currentPage={page}")
+        runs = []
+        for _ in range(repeat):
+            with counter.measure({}) as r:
+                items = len(capture_feed_snapshot(driver))
+            runs.append(r)
+        results.append(_average(f"feed_snapshot p{page}", runs, items=items))
+    return results
+
+def bench_theme_list(driver, counter, site, repeat):
+    """ThemePost 목록 분석 (컨테이너 조회 + 게시글별 닉네임/공감/댓글 추출)"""
+    from bot_class.blog_add_neighbor import BlogAddNeighbor
+    bot = BlogAddNeighbor(driver)
+    results = []
+    for page in range(1, site.theme_pages + 1):
+        with quiet():
+            bot._load_page(1, 0, page)
+        runs = []
+        for _ in range(repeat):
+            with counter.measure({}) as r, quiet():
+                containers = bot._get_blog_containers()
+                infos = [bot._analyze_blog_info(c) for c in containers]
+            runs.append(r)
+        results.append(_average(f"theme_list p{page}", runs, items=len(infos)))
+    return results
+
+def bench_likes_run(driver, counter, site):
+    """공감 봇 전체 실행 (미공감 게시글을 모두 공감할 때까지)"""
+    from bot_class.blog_likes_neighbor import BlogLikesNeighbor
+    target = site.unliked_feed_items
+    with counter.measure({'name': "likes_run", 'items': target}) as r, quiet():
+        BlogLikesNeighbor(driver).run(target, start_page=1)
+    r['per_item_round_trips'] = round(r['round_trips'] / target, 1) if target else 0
+    return [r]
+
+def bench_notification_scan(driver, counter, site):
+    """알림 센터 1단계 분석 (무한 스크롤 수확 + DB 기록 + 랭킹 산출)"""
+    from bot_class.blog_smart_neighbor_management import BlogSmartNeighborManagement
+    bot = BlogSmartNeighborManagement(driver)
+    harvest_calls = []
+    original = bot._harvest_new_cards
+
+    def timed_harvest():
+        start = time.perf_counter()
+        cards, bottom = original()
+        harvest_calls.append((time.perf_counter() - start) * 1000)
+        return cards, bottom
+    bot._harvest_new_cards = timed_harvest
+
+    with counter.measure({'name': "phase1_scan", 'items': site.noti_cards}) as r, quiet():
+        ok = bot._phase_1_analysis()
+    r['ok'] = ok
+    r['harvest_calls'] = len(harvest_calls)
+    r['harvest_avg_ms'] = round(sum(harvest_calls) / len(harvest_calls), 2) if harvest_calls else 0
+    return [r]
+
+def bench_planner(site, repeat):
+    """2단계 계획(_plan_page_actions) 순수 계산 비용 (WebDriver 호출 없음, 이웃 수별)"""
+    from bot_class.blog_smart_neighbor_management import BlogSmartNeighborManagement
+    bot = BlogSmartNeighborManagement(None)
+    snapshot = [{'index': i, 'nickname': site._nick(i), 'blog_id': f"fixture{i:04d}", 'url': '',
+                 'liked': False, 'item': None, 'like_btn': None} for i in range(site.feed_items)]
+    results = []
+    for neighbors in (100, 1000, 10000):
+        bot.neighbor_policy = {
+            site._nick(n): {'c': n % 3, 'r': n % 2, 'l': n % 5,
+                            'action': ("AI_COMMENT", "NORMAL_COMMENT", "LIKE_ONLY")[n % 3]}
+            for n in range(neighbors)
+        }
+        bot.comment_cooldowns = {f"fixture{n:04d}": "2000-01-01" if n % 4 else "9999-12-31"
+                                 for n in range(min(neighbors, site.feed_items))}
+        iterations = repeat * 100
+        with quiet():
+            start = time.perf_counter()
+            for _ in range(iterations):
+                bot._plan_page_actions(snapshot)
+            elapsed = time.perf_counter() - start
+        results.append({'name': f"planner n={neighbors}", 'items': len(snapshot), 'round_trips': 0,
+                        'ms': round(elapsed * 1000 / iterations, 3)})
+    return results
+
+def bench_comment_visit(driver, counter, site):
+    """일반 댓글 1건 (블로그 새 창 -> mainFrame -> 입력/등록 -> 창 닫기)"""
+    from bot_class.feed_snapshot import capture_feed_snapshot
+    from bot_class.blog_smart_neighbor_management import BlogSmartNeighborManagement
+    bot = BlogSmartNeighborManagement(driver)
+    driver.get(f"{config.NAVER_URLS['section']}/BlogHome.naver?currentPage=1")
+    entry = capture_feed_snapshot(driver)[1]
+    with counter.measure({'name': "comment_visit", 'items': 1}) as r, quiet():
+        ok = bot._execute_comment_logic(entry['item'], entry['blog_id'], entry['nickname'],
+                                        ["fixture 댓글입니다"], "NORMAL_COMMENT")
+    r['ok'] = ok
+    return [r]
+
+def _average(name, runs, **extra):
+    return dict(extra, name=name,
+                ms=round(sum(r['ms'] for r in runs) / len(runs), 2),
+                round_trips=runs[-1]['round_trips'],
+                commands=runs[-1]['commands'])
+
+# ==========================================================
+def print_report(results):
+    print("\n" + "=" * 78)
+    print(f" {'벤치마크':<26}{'항목 수':>8}{'시간(ms)':>12}{'왕복':>8}   비고")
+    print("-" * 78)
+    for r in results:
+        note = []
+        if 'harvest_calls' in r:
+            note.append(f"수확 {r['harvest_calls']}회 / 평균 {r['harvest_avg_ms']}ms")
+        if 'per_item_round_trips' in r:
+            note.append(f"건당 왕복 {r['per_item_round_trips']}")
+        if 'ok' in r and not r['ok']:
+            note.append("⚠️ 실패")
+        print(f" {r['name']:<26}{r.get('items', ''):>8}{r['ms']:>12}{r['round_trips']:>8}   {' | '.join(note)}")
+    print("=" * 78)
+
+def main():
+    parser = argparse.ArgumentParser(description="fixture 서버 기반 봇 파싱/계획 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="추출 벤치마크 반복 횟수")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 대신 브라우저 창 표시")
+    args = parser.parse_args()
+
+    # 실제 사용자 DB를 건드리지 않도록 임시 DB 사용 + 사람 흉내 대기 제거
+    temp_dir = tempfile.mkdtemp(prefix="naver_bench_")
+    config.path_db = os.path.join(temp_dir, "bench.db")
+    config.SMART_NEIGHBOR_CONFIG["conditions"]["AI백엔드"] = "template"
+    utils.set_delay_scale(0)
+
+    from bot_class.db_manager import BlogDB
+    site = FixtureSite()
+    results = []
+    try:
+        with FixtureServer(site) as server:
+            config.NAVER_URLS.update(server.naver_urls())
+            print(f"🧪 fixture 서버: {server.base_url}")
+            results += bench_planner(site, args.repeat)
+
+            driver = create_driver(args.show_browser)
+            try:
+                counter = RoundTripCounter(driver)
+                results += bench_feed_snapshot(driver, counter, site, args.repeat)
+                results += bench_theme_list(driver, counter, site, args.repeat)
+                results += bench_notification_scan(driver, counter, site)
+                results += bench_comment_visit(driver, counter, site)
+                results += bench_likes_run(driver, counter, site)
+            finally:
+                driver.quit()
+    finally:
+        BlogDB.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print_report(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'created_at': datetime.now().isoformat(timespec='seconds'), 'results': results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,17 @@
 import sys
 import os
+import json
+import time
+import random
+import hashlib
+import threading
+import urllib.request
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+import config
+from bot_class.db_manager import BlogDB
+from run_trace import span
 
 # [중요] google-genai 라이브러리 임포트
 try:
@@ -10,53 +22,244 @@ except ImportError:
     HAS_GEMINI = False
     print("⚠️ [오류] 'google-genai' 라이브러리가 설치되지 않았거나 경로가 꼬였습니다.")
 
-class GeminiHelper:
+GEMINI_MODEL = 'gemini-2.5-flash-lite'
+
+# ==========================================================
+# 댓글 생성 백엔드: generate(prompt, post_content) -> (댓글, 사용 토큰 수)
+# ==========================================================
+class CommentBackend(ABC):
+    name = "base"
+    cacheable = True        # 생성 결과를 DB 캐시에 저장할지 (로컬 생성은 저장 불필요)
+
+    @abstractmethod
+    def generate(self, full_prompt, post_content):
+        """댓글 1건 생성 -> (댓글, 사용 토큰 수)"""
+
+class GeminiBackend(CommentBackend):
+    name = f"gemini:{GEMINI_MODEL}"
     # 클래스 변수로 클라이언트를 관리 (중복 연결 방지)
-    _client = None 
+    _client = None
 
     def __init__(self, api_key):
-        self.api_key = api_key
-        
-        # 라이브러리가 없으면 초기화 중단
-        if not HAS_GEMINI:
+        # 라이브러리가 없거나 클라이언트가 이미 있으면 연결 생략
+        if not HAS_GEMINI or GeminiBackend._client is not None or not api_key:
             return
+        try:
+            # [신규 방식] Client 객체 생성
+            GeminiBackend._client = genai.Client(api_key=api_key)
+            print("✅ Gemini Client 연결 성공!")
+        except Exception as e:
+            print(f"⚠️ Gemini 클라이언트 설정 오류: {e}")
 
-        # 클라이언트가 설정되지 않았을 때만 연결
-        if GeminiHelper._client is None and self.api_key:
-            try:
-                # [신규 방식] Client 객체 생성
-                GeminiHelper._client = genai.Client(api_key=self.api_key)
-                print("✅ Gemini Client 연결 성공!")
-            except Exception as e:
-                print(f"⚠️ Gemini 클라이언트 설정 오류: {e}")
+    @property
+    def available(self):
+        return HAS_GEMINI and GeminiBackend._client is not None
+
+    def generate(self, full_prompt, post_content):
+        # [신규 방식] 모델 호출
+        response = GeminiBackend._client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=full_prompt
+        )
+        usage = getattr(response, 'usage_metadata', None)
+        tokens = getattr(usage, 'total_token_count', 0) or 0
+        return (response.text or "").strip(), tokens
+
+class TemplateBackend(CommentBackend):
+    """네트워크 없이 제목을 넣은 문장 템플릿으로 댓글 생성 (오프라인 테스트/비상용)"""
+    name = "template"
+    cacheable = False
+    available = True
+    # 전용 난수 (템플릿 선택이 봇 흐름용 전역 random 순서를 바꾸지 않도록)
+    _random = random.Random()
+    TEMPLATES = [
+        "'{title}' 포스팅 잘 보고 갑니다! 덕분에 많이 배웠어요 :)",
+        "{title} 내용 정리가 깔끔해서 편하게 읽었어요. 감사합니다!",
+        "{title} 관련해서 궁금했는데 도움이 많이 됐어요ㅎㅎ 잘 보고 갑니다!",
+    ]
+
+    def generate(self, full_prompt, post_content):
+        title = ""
+        for line in post_content.splitlines():
+            if line.startswith("제목:"):
+                title = line[len("제목:"):].strip()
+                break
+        if not title or title == "제목 없음":
+            return "", 0
+        return self._random.choice(self.TEMPLATES).format(title=title), 0
+
+class HttpStubBackend(CommentBackend):
+    """로컬 HTTP 스텁 서버 호출 (요청: {prompt, post}, 응답: {text, tokens})"""
+    name = "http"
+    available = True
+
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+
+    def generate(self, full_prompt, post_content):
+        body = json.dumps({"prompt": full_prompt, "post": post_content}, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            data = json.loads(response.read().decode('utf-8'))
+        return (data.get("text") or "").strip(), int(data.get("tokens") or 0)
+
+class CircuitBreaker:
+    """
+    연속 실패/지연이 기준 횟수에 도달하면 일정 시간 차단 (차단 중에는 즉시 일반 댓글로 전환)
+    - 차단 시간이 지나면 1회 시험 호출을 허용하고, 성공하면 정상 복귀
+    """
+    def __init__(self):
+        self.failures = 0
+        self.open_until = 0.0
+        self.half_open = False  # 차단 해제 직후: 시험 호출 1회 실패 시 바로 재차단
+
+    def allow(self):
+        return time.time() >= self.open_until
+
+    def record(self, ok, threshold, cooldown):
+        if ok:
+            self.failures = 0
+            self.half_open = False
+            return False
+        self.failures += 1
+        if self.half_open or self.failures >= threshold:
+            self.open_until = time.time() + cooldown
+            self.failures = 0
+            self.half_open = True
+            return True
+        return False
+
+class GeminiHelper:
+    """댓글 생성 진입점 (설정의 'AI백엔드'에 따라 백엔드 선택, 캐시/제한시간/차단기 적용)"""
+    # 호출 스레드: 제한시간이 지나면 결과를 기다리지 않고 포기 (응답이 늦게 와도 작업은 진행)
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="comment-backend")
+    _breaker = CircuitBreaker()
+    _lock = threading.Lock()
+    # 댓글 캐시 적중/미스 횟수 (프로그램 실행 동안 누적)
+    cache_stats = {'hit': 0, 'miss': 0}
+    # 백엔드별 호출 지표 (호출/실패/시간초과/지연 합계/최대 지연/토큰)
+    metrics = {}
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.backend = self.create_backend(api_key)
+
+    @staticmethod
+    def create_backend(api_key=None):
+        cond = config.SMART_NEIGHBOR_CONFIG["conditions"]
+        kind = cond["AI백엔드"]
+        if kind == "template":
+            return TemplateBackend()
+        if kind == "http":
+            return HttpStubBackend(cond["AI테스트서버주소"], cond["AI응답제한시간"])
+        return GeminiBackend(api_key)
+
+    @staticmethod
+    def needs_api_key():
+        """현재 설정된 백엔드가 API 키를 요구하는지"""
+        return config.SMART_NEIGHBOR_CONFIG["conditions"]["AI백엔드"] not in ("template", "http")
+
+    @staticmethod
+    def cache_key(backend_name, base_prompt, post_content):
+        """백엔드/모델 + 프롬프트 + 게시글(제목/본문 발췌) 내용 기반 캐시 키"""
+        return hashlib.sha256("\x1f".join((backend_name, base_prompt, post_content)).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def get_cache_stats(cls):
+        """캐시 적중/미스 횟수 + 현재 저장 개수"""
+        return dict(cls.cache_stats, size=BlogDB().get_comment_cache_size())
+
+    @classmethod
+    def get_metrics(cls):
+        """백엔드별 지표 사본 (평균 지연 포함)"""
+        with cls._lock:
+            result = {}
+            for name, m in cls.metrics.items():
+                completed = m['calls'] - m['timeouts']
+                result[name] = dict(m, avg_latency=round(m['latency_sum'] / completed, 2) if completed else 0.0)
+            return result
+
+    @classmethod
+    def _record(cls, name, latency, tokens=0, failed=False, timed_out=False):
+        with cls._lock:
+            m = cls.metrics.setdefault(name, {'calls': 0, 'failures': 0, 'timeouts': 0,
+                                              'latency_sum': 0.0, 'max_latency': 0.0, 'tokens': 0})
+            m['calls'] += 1
+            m['failures'] += failed
+            m['timeouts'] += timed_out
+            if not timed_out:
+                m['latency_sum'] += latency
+            m['max_latency'] = max(m['max_latency'], latency)
+            m['tokens'] += tokens
 
     def generate_comment(self, post_content, user_prompt):
         """
-        블로그 본문과 프롬프트를 받아 댓글 생성
+        블로그 본문과 프롬프트를 받아 댓글 생성 (실패/시간초과/차단 중이면 None -> 호출 측에서 일반 댓글 사용)
+        - 같은 프롬프트/게시글로 생성한 댓글이 캐시에 있으면 백엔드 호출 없이 재사용
+        - 게시글당 최대 대기 시간은 'AI응답제한시간'(초)
         """
-        # 라이브러리 없음 or 클라이언트 없음 or 본문 없음 -> 종료
-        if not HAS_GEMINI or GeminiHelper._client is None or not post_content:
+        backend = self.backend
+        # 백엔드 사용 불가 or 본문 없음 -> 종료
+        if not backend.available or not post_content:
             return None
 
         # 프롬프트 설정
         base_prompt = user_prompt if user_prompt else "당신은 따뜻한 블로그 이웃입니다. 본문을 읽고 다정한 댓글을 1~2문장으로 써주세요."
         full_prompt = f"{base_prompt}\n\n[게시글 본문]\n{post_content}"
 
+        cond = config.SMART_NEIGHBOR_CONFIG["conditions"]
+        ttl_seconds = cond["AI캐시유효시간"] * 3600
+        key = self.cache_key(backend.name, base_prompt, post_content) if backend.cacheable and ttl_seconds > 0 else None
+        if key:
+            try:
+                cached = BlogDB().get_cached_comment(key, ttl_seconds)
+            except Exception as e:
+                print(f"⚠️ AI 댓글 캐시 조회 실패: {e}")
+                cached = None
+            if cached:
+                GeminiHelper.cache_stats['hit'] += 1
+                print(f"♻️ 이전에 생성한 AI 댓글을 재사용합니다. (캐시 적중)")
+                return cached
+            GeminiHelper.cache_stats['miss'] += 1
+
+        if not GeminiHelper._breaker.allow():
+            remain = int(GeminiHelper._breaker.open_until - time.time())
+            print(f"⛔ AI 응답 지연/실패가 반복되어 차단 중입니다. ({remain}초 후 재시도)")
+            return None
+
+        deadline = cond["AI응답제한시간"]
+        slow_limit = cond["AI느린응답기준"]
+        print(full_prompt)
+        print(f"📍 AI가 댓글 생성 중입니다... ({backend.name}, 최대 {deadline}초)")
+
+        start = time.perf_counter()
+        comment, tokens, ok = None, 0, False
         try:
-            print(full_prompt)
-            print(f"📍 AI가 댓글 생성 중입니다...")
-            
-            # [신규 방식] 모델 호출
-            response = GeminiHelper._client.models.generate_content(
-                model='gemini-2.5-flash-lite',
-                contents=full_prompt
-            )
-            
-            if response.text:
-                return response.text.strip()
-            else:
-                return None
-            
+            with span("ai.generate", "ai", {'backend': backend.name}):
+                future = GeminiHelper._executor.submit(backend.generate, full_prompt, post_content)
+                comment, tokens = future.result(timeout=deadline)
+            latency = time.perf_counter() - start
+            self._record(backend.name, latency, tokens, failed=not comment)
+            ok = bool(comment) and latency <= slow_limit
+            if latency > slow_limit:
+                print(f"🐢 AI 응답 지연: {latency:.1f}초")
+        except FutureTimeout:
+            future.cancel()
+            self._record(backend.name, time.perf_counter() - start, timed_out=True)
+            print(f"⏱️ AI 응답 제한시간({deadline}초) 초과 -> 일반 댓글로 진행")
         except Exception as e:
+            self._record(backend.name, time.perf_counter() - start, failed=True)
             print(f"❌ AI 댓글 생성 실패: {e}")
-            return None
\ No newline at end of file
+
+        if GeminiHelper._breaker.record(ok, cond["AI차단기준횟수"], cond["AI차단시간"]):
+            print(f"⛔ AI 호출을 {cond['AI차단시간']}초 동안 차단하고 일반 댓글을 사용합니다.")
+
+        if not comment:
+            return None
+        if key:
+            try:
+                BlogDB().put_cached_comment(key, comment, ttl_seconds, cond["AI캐시최대개수"])
+            except Exception as e:
+                print(f"⚠️ AI 댓글 캐시 저장 실패: {e}")
+        return comment
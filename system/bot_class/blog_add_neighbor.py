@@ -3,17 +3,21 @@ import os
 import random
 import re
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 import config
-from utils import smart_sleep, smart_click, human_typing
+from utils import smart_sleep, smart_click, human_typing, CancellableWait
 from utils import human_scroll_to_ratio
+from bot_class.run_journal import journal_phase
+from driver_profiler import profile_phase
+from browser_governor import child_window, checkpoint
+from run_trace import traced
+from bot_events import LikeDone, CommentDone, NeighborRequested, PageScanned, Error, emit_event
 
 class BlogAddNeighbor:
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, 5)
+        self.wait = CancellableWait(self.driver, 5)
         self.worker = None
 
     def run(self, active_directory_seq, directory_no, target_count, start_page=1):
@@ -23,7 +27,7 @@ class BlogAddNeighbor:
         # [수정] ADD_NEIGHBOR_CONFIG 참조
         conf = config.ADD_NEIGHBOR_CONFIG
         max_likes, max_comments = self._load_conditions(conf)
-        fail_limit = conf["conditions"].get("최대실패횟수", 10)
+        fail_limit = conf["conditions"]["최대실패횟수"]
         
         current_success = 0
         consecutive_failures = 0
@@ -37,15 +41,20 @@ class BlogAddNeighbor:
 
             if self._should_stop_due_to_failures(consecutive_failures, fail_limit):
                 break
+
+            # 페이지 경계: 진행 위치 기록 + 남은 창 정리 (메모리 한도 초과 시 브라우저 재시작 후 이 페이지부터)
+            checkpoint(self, page=page, done=current_success)
             
-            if not self._load_page(active_directory_seq, directory_no, page):
+            with journal_phase(self.worker, "page_load"), profile_phase(self.driver, "add.page_load"):
+                page_ready = self._load_page(active_directory_seq, directory_no, page)
+            if not page_ready:
                 break
             
-            containers = self._get_blog_containers()
+            with profile_phase(self.driver, "add.list"):
+                containers = self._get_blog_containers()
             if not containers:
                 break
-            
-            main_window = self.driver.current_window_handle
+            emit_event(self.worker, PageScanned("add", page, len(containers)))
             
             for container in containers:
                 # [추가 작업 2] 블로그 개별 처리 전 중단 신호 체크
@@ -55,16 +64,18 @@ class BlogAddNeighbor:
                 if self._should_stop_processing(current_success, target_count, consecutive_failures, fail_limit):
                     break
                 
-                blog_info = self._analyze_blog_info(container)
+                with profile_phase(self.driver, "add.list"):
+                    blog_info = self._analyze_blog_info(container)
                 self._print_blog_info(blog_info, current_success, target_count, consecutive_failures)
                 
                 if self._check_conditions(blog_info, max_likes, max_comments):
-                    result = self._process_blog(container, main_window)
+                    with journal_phase(self.worker, "blog_visit"), profile_phase(self.driver, "add.visit"):
+                        result = self._process_blog(container)
                 else:
                     result = "ALREADY"
                 
                 current_success, consecutive_failures, should_exit = self._handle_result(
-                    result, current_success, consecutive_failures
+                    result, current_success, consecutive_failures, blog_info['nickname'], target_count
                 )
                 
                 # 이웃 추가 제한에 도달한 경우 즉시 종료
@@ -85,8 +96,8 @@ class BlogAddNeighbor:
         """작업 조건 로드"""
         # [수정] ADD_NEIGHBOR_CONFIG 참조
         cond = conf["conditions"]
-        max_l = cond.get("최대공감수제한", 100)
-        max_c = cond.get("최대댓글수제한", 10)
+        max_l = cond["최대공감수제한"]
+        max_c = cond["최대댓글수제한"]
         print(f"   (필터 조건: 공감 {max_l}개 이하 AND 댓글 {max_c}개 이하인 글만 방문)")
         return max_l, max_c
     
@@ -99,13 +110,13 @@ class BlogAddNeighbor:
     
     def _load_page(self, active_directory_seq, directory_no, page):
         """페이지 로딩"""
-        url = f"https://section.blog.naver.com/ThemePost.naver?directoryNo={directory_no}&activeDirectorySeq={active_directory_seq}&currentPage={page}"
+        url = f"{config.NAVER_URLS['section']}/ThemePost.naver?directoryNo={directory_no}&activeDirectorySeq={active_directory_seq}&currentPage={page}"
         try:
             self.driver.get(url)
             # [수정] reason 필수 및 ADD_NEIGHBOR_CONFIG 참조
-            smart_sleep(config.ADD_NEIGHBOR_CONFIG["delays"].get("목록페이지로딩", (1.0, 2.5)), f"{page}페이지 주제별 목록 로딩 대기")
+            smart_sleep(config.ADD_NEIGHBOR_CONFIG["delays"]["목록페이지로딩"], f"{page}페이지 주제별 목록 로딩 대기")
             return True
-        except:
+        except Exception:
             print("❌ 페이지 로딩 실패")
             return False
     
@@ -147,7 +158,7 @@ class BlogAddNeighbor:
         try:
             parent_element.find_element(By.CSS_SELECTOR, selector)
             return True
-        except:
+        except Exception:
             return False
     
     def _print_blog_info(self, blog_info, current_success, target_count, consecutive_failures):
@@ -167,12 +178,12 @@ class BlogAddNeighbor:
             print(f"   > ⏭️ 조건 미달(인기 블로그 등)로 스킵합니다.")
             return False
     
-    def _process_blog(self, container, main_window):
+    def _process_blog(self, container):
         """블로그 방문 및 처리"""
         try:
             selector = config.SELECTORS["theme_post_links"]
             link_element = container.find_element(By.CSS_SELECTOR, selector)
-            result = self._process_one_blog(link_element, main_window)
+            result = self._process_one_blog(link_element)
             
             # 이웃 추가 제한에 도달한 경우 즉시 종료
             if result == "LIMIT_REACHED":
@@ -183,25 +194,26 @@ class BlogAddNeighbor:
             print(f"   > ⚠️ 링크 클릭 불가 또는 찾기 실패 ({e})")
             return "FAIL"
     
-    def _handle_result(self, result, current_success, consecutive_failures):
+    def _handle_result(self, result, current_success, consecutive_failures, nickname="", target_count=0):
         """결과 처리 및 상태 업데이트"""
         conf_delay = config.ADD_NEIGHBOR_CONFIG["delays"]
         if result == "LIMIT_REACHED":
+            emit_event(self.worker, Error("add", "limit_reached", "하루 이웃 추가 한도 도달"))
             # 이웃 추가 제한에 도달 - 즉시 종료를 위해 특별한 값 반환
             return current_success, consecutive_failures, True  # (success, failures, should_exit)
         elif result == "SUCCESS":
             current_success += 1
             consecutive_failures = 0
-            print(f"   > 🎉 이웃 신청 완료!")
+            emit_event(self.worker, NeighborRequested(nickname, current_success, target_count))
             # [수정] reason 필수 및 ADD_NEIGHBOR_CONFIG 참조
-            smart_sleep(conf_delay.get("블로그간대기", (0.2, 0.5)), "신청 성공 후 다음 블로그 방문 전 대기")
+            smart_sleep(conf_delay["블로그간대기"], "신청 성공 후 다음 블로그 방문 전 대기")
         elif result == "ALREADY":
             consecutive_failures = 0
         else:  # FAIL
             consecutive_failures += 1
-            print(f"   > ⚠️ 실패 처리되었습니다.")
+            emit_event(self.worker, Error("add", "request_failed", f"{nickname} 이웃 신청 실패 처리"))
             # [수정] reason 필수 및 ADD_NEIGHBOR_CONFIG 참조
-            smart_sleep(conf_delay.get("재시도대기", (0.5, 1.0)), "실패 후 안정화를 위한 재시도 대기")
+            smart_sleep(conf_delay["재시도대기"], "실패 후 안정화를 위한 재시도 대기")
         
         return current_success, consecutive_failures, False  # (success, failures, should_exit)
     
@@ -234,59 +246,45 @@ class BlogAddNeighbor:
         try:
             child = parent_element.find_element(By.CSS_SELECTOR, selector)
             return child.text.strip()
-        except:
+        except Exception:
             return default_text
 
     def _parse_number(self, text):
         try:
             nums = re.findall(r'\d+', text.replace(',', ''))
             return int(nums[0]) if nums else 0
-        except:
+        except Exception:
             return 0
 
     # [수정] 결과 처리 로직 개선: 공감/댓글 실패가 서이추 성공 결과에 영향을 주지 않도록 변경
-    def _process_one_blog(self, link_element, main_window):
+    @traced("post.add_neighbor", "action")
+    def _process_one_blog(self, link_element):
         conf_delay = config.ADD_NEIGHBOR_CONFIG["delays"]
         try:
-            # 링크 클릭 및 새 창 전환
-            smart_click(self.driver, link_element)
-            # [수정] reason 필수 및 ADD_NEIGHBOR_CONFIG 참조
-            smart_sleep(conf_delay.get("팝업창대기", (1.0, 2.0)), "블로그 상세 페이지 로딩 대기")
-            
-            if len(self.driver.window_handles) == 1:
-                return "FAIL"
-            
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-            
-            # 1. 서로이웃 신청 흐름 실행
-            result_status = self._try_add_neighbor_flow()
-            
-            # 2. 서이추 성공 시에만 공감/댓글 시도 (실패해도 서이추 결과는 유지)
-            if result_status == "SUCCESS":
-                try:
-                    self._add_like_and_comment()
-                except Exception as e:
-                    print(f"   > [댓글 오류 무시] {e}")
-            
-            # 3. 창 닫기 및 복귀
-            try:
-                if self.driver.current_window_handle != main_window:
-                    self.driver.close()
-            except:
-                pass
+            # 블로그 창은 구간을 벗어나면(예외 포함) 닫히고 목록 창으로 복귀
+            with child_window(self.driver) as windows:
+                # 링크 클릭 및 새 창 전환
+                smart_click(self.driver, link_element)
+                # [수정] reason 필수 및 ADD_NEIGHBOR_CONFIG 참조
+                smart_sleep(conf_delay["팝업창대기"], "블로그 상세 페이지 로딩 대기")
+
+                if not windows.switch_to_new():
+                    return "FAIL"
+
+                # 1. 서로이웃 신청 흐름 실행
+                result_status = self._try_add_neighbor_flow()
 
-            self.driver.switch_to.window(main_window)
-            return result_status
+                # 2. 서이추 성공 시에만 공감/댓글 시도 (실패해도 서이추 결과는 유지)
+                if result_status == "SUCCESS":
+                    try:
+                        with profile_phase(self.driver, "add.like_comment"):
+                            self._add_like_and_comment()
+                    except Exception as e:
+                        print(f"   > [댓글 오류 무시] {e}")
+                return result_status
 
         except Exception as e:
             print(f"   > [치명적 오류] {e}")
-            # 창 닫기 시도
-            try:
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                self.driver.switch_to.window(main_window)
-            except:
-                pass
             return "FAIL"
 
     def _try_add_neighbor_flow(self):
@@ -308,49 +306,37 @@ class BlogAddNeighbor:
                 print(f"   > [패스] 이미 '서로이웃' 상태입니다.")
                 return "ALREADY"
 
-            # 3. 버튼 클릭
-            blog_window = self.driver.current_window_handle
-            smart_click(self.driver, btn)
-            # [수정] reason 필수 및 전용 딜레이 참조
-            smart_sleep(conf_delay.get("팝업창대기", (1.0, 2.0)), "이웃 신청 팝업 대기")
-            
-            # 4. 알림창(Alert) 확인 - 이미 신청 중인 경우 등
-            try:
-                alert = self.driver.switch_to.alert
-                alert_text = alert.text
-                alert.accept()
-                
-                # 이웃 추가 제한 메시지 체크
-                if self._check_limit_reached(alert_text):
-                    return "LIMIT_REACHED"
-                
-                if "진행" in alert_text or "이미 신청" in alert_text:
-                    print(f"   > [패스] 이미 신청을 보낸 상태입니다. (알림: {alert_text})")
-                    return "ALREADY"
-                else:
-                    print(f"   > [알림] 경고창 발생: {alert_text}")
+            # 3. 버튼 클릭 (팝업 창은 구간을 벗어나면 닫히고 블로그 창으로 복귀)
+            with child_window(self.driver) as popup:
+                smart_click(self.driver, btn)
+                # [수정] reason 필수 및 전용 딜레이 참조
+                smart_sleep(conf_delay["팝업창대기"], "이웃 신청 팝업 대기")
+
+                # 4. 알림창(Alert) 확인 - 이미 신청 중인 경우 등
+                try:
+                    alert = self.driver.switch_to.alert
+                    alert_text = alert.text
+                    alert.accept()
+
+                    # 이웃 추가 제한 메시지 체크
+                    if self._check_limit_reached(alert_text):
+                        return "LIMIT_REACHED"
+
+                    if "진행" in alert_text or "이미 신청" in alert_text:
+                        print(f"   > [패스] 이미 신청을 보낸 상태입니다. (알림: {alert_text})")
+                        return "ALREADY"
+                    else:
+                        print(f"   > [알림] 경고창 발생: {alert_text}")
+                        return "FAIL"
+                except Exception:
+                    pass # 알림 없으면 정상 진행
+
+                # 5. 팝업창 핸들링
+                if not popup.switch_to_new():
+                    print("   > [실패] 팝업창이 뜨지 않았습니다.")
                     return "FAIL"
-            except:
-                pass # 알림 없으면 정상 진행
-
-            # 5. 팝업창 핸들링
-            all_windows = self.driver.window_handles
-            if len(all_windows) > 2: 
-                self.driver.switch_to.window(all_windows[-1])
-                final_result = self._handle_popup_steps()
-                
-                # 팝업 닫기
-                try: self.driver.close() 
-                except: pass
-                
-                # 블로그 창 복귀
-                try: self.driver.switch_to.window(blog_window)
-                except: pass
-                
-                return final_result
-            else:
-                print("   > [실패] 팝업창이 뜨지 않았습니다.")
-                return "FAIL"
+                with profile_phase(self.driver, "add.popup"):
+                    return self._handle_popup_steps()
 
         except Exception as e:
             print(f"   > [에러] 로직 수행 중 오류: {e}")
@@ -366,7 +352,7 @@ class BlogAddNeighbor:
                 return "LIMIT_REACHED"
             
             # [수정] reason 필수 및 전용 딜레이 참조
-            smart_sleep(conf_delay.get("팝업초기대기", (0.2, 0.5)), "팝업창 내용 로딩 대기")
+            smart_sleep(conf_delay["팝업초기대기"], "팝업창 내용 로딩 대기")
 
             # [Step 1] 서로이웃 라디오 버튼 선택
             try:
@@ -374,8 +360,8 @@ class BlogAddNeighbor:
                 radio_mutual = self.driver.find_element(By.CSS_SELECTOR, selector)
                 smart_click(self.driver, radio_mutual)
                 # [수정] reason 필수 및 전용 딜레이 참조
-                smart_sleep(conf_delay.get("팝업작업대기", (0.2, 0.5)), "서로이웃 라디오 버튼 클릭 후 대기")
-            except:
+                smart_sleep(conf_delay["팝업작업대기"], "서로이웃 라디오 버튼 클릭 후 대기")
+            except Exception:
                 print("   > [패스] '서로이웃' 신청 옵션이 없습니다. (이웃만 가능)")
                 return "ALREADY"
 
@@ -389,7 +375,7 @@ class BlogAddNeighbor:
                         if not self.driver.find_elements(By.CSS_SELECTOR, config.SELECTORS["popup_message_input"]):
                             smart_click(self.driver, btn)
                             # [수정] reason 필수 및 전용 딜레이 참조
-                            smart_sleep(conf_delay.get("메시지창전환대기", (1.5, 2.0)), "메시지 입력폼 전환 대기")
+                            smart_sleep(conf_delay["메시지창전환대기"], "메시지 입력폼 전환 대기")
                             
                             # '다음' 클릭 후 알림창 체크
                             try:
@@ -401,9 +387,9 @@ class BlogAddNeighbor:
                                 if "진행" in txt or "신청" in txt:
                                     print(f"   > [패스] 이미 신청 진행 중입니다.")
                                     return "ALREADY"
-                            except: pass
+                            except Exception: pass
                         break
-            except: pass
+            except Exception: pass
 
             # [Step 3] 메시지 입력 (human_typing 적용)
             try:
@@ -413,8 +399,8 @@ class BlogAddNeighbor:
                 rand_msg = random.choice(config.ADD_NEIGHBOR_CONFIG["messages"])
                 print(f"   > 💬 서이추 메시지 타이핑: {rand_msg}")
                 human_typing(msg_input, rand_msg) 
-                smart_sleep(conf_delay.get("메시지입력후대기", (0.2, 0.5)), "메시지 작성 후 검토 대기")
-            except: 
+                smart_sleep(conf_delay["메시지입력후대기"], "메시지 작성 후 검토 대기")
+            except Exception: 
                 print("   > [실패] 메시지 입력창을 찾을 수 없습니다.")
                 return "FAIL"
 
@@ -427,7 +413,7 @@ class BlogAddNeighbor:
                     if btn.is_displayed():
                         smart_click(self.driver, btn)
                         clicked = True
-                        smart_sleep(conf_delay.get("전송후대기", (1.0, 2.0)), "최종 신청 전송 완료 대기")
+                        smart_sleep(conf_delay["전송후대기"], "최종 신청 전송 완료 대기")
                         try:
                             alert = self.driver.switch_to.alert
                             alert_text = alert.text
@@ -435,9 +421,9 @@ class BlogAddNeighbor:
                                 alert.accept()
                                 return "LIMIT_REACHED"
                             alert.accept()
-                        except: pass
+                        except Exception: pass
                         break
-            except: pass
+            except Exception: pass
             
             if not clicked: 
                 print("   > [실패] 전송 버튼을 누르지 못했습니다.")
@@ -451,11 +437,11 @@ class BlogAddNeighbor:
 
     def _find_element_safe(self, selector):
         try: return self.driver.find_element(By.CSS_SELECTOR, selector)
-        except:
+        except Exception:
             try:
                 self.driver.switch_to.frame("mainFrame")
                 return self.driver.find_element(By.CSS_SELECTOR, selector)
-            except: return None
+            except Exception: return None
     
     def _add_like_and_comment(self):
         """공감 및 댓글 일괄 처리 (human_typing 적용)"""
@@ -464,16 +450,16 @@ class BlogAddNeighbor:
         
         try:
             self.driver.switch_to.default_content()
-            WebDriverWait(self.driver, 5).until(EC.frame_to_be_available_and_switch_to_it((By.ID, "mainFrame")))
+            CancellableWait(self.driver, 5).until(EC.frame_to_be_available_and_switch_to_it((By.ID, "mainFrame")))
             
             # 스크롤 수행
-            scroll_ratio = conf_delay.get("스크롤최대비율", 0.5)
+            scroll_ratio = conf_delay["스크롤최대비율"]
             human_scroll_to_ratio(self.driver, scroll_ratio)
-            smart_sleep(conf_delay.get("스크롤대기", (0.5, 1.0)), "공감/댓글 영역 노출을 위한 스크롤 대기")
+            smart_sleep(conf_delay["스크롤대기"], "공감/댓글 영역 노출을 위한 스크롤 대기")
 
             try:
                 container = self.driver.find_element(By.CSS_SELECTOR, config.SELECTORS["floating_container"])
-            except:
+            except Exception:
                 container = self.driver.find_element(By.CSS_SELECTOR, config.SELECTORS["static_container"])
 
             # --- [STEP A] 공감하기 ---
@@ -481,10 +467,10 @@ class BlogAddNeighbor:
                 like_btn = container.find_element(By.CSS_SELECTOR, config.SELECTORS["like_button_face"])
                 btn_class = like_btn.get_attribute("class") or ""
                 if "off" in btn_class.split():
-                    smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"].get("클릭전대기", (0.1, 0.3)), "공감 클릭 전 대기")
+                    smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"]["클릭전대기"], "공감 클릭 전 대기")
                     smart_click(self.driver, like_btn)
-                    print("   > 👍 공감 완료")
-                    smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"].get("작업간대기", (0.2, 0.5)), "공감 완료 후 휴식")
+                    emit_event(self.worker, LikeDone("add"))
+                    smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"]["작업간대기"], "공감 완료 후 휴식")
                 else:
                     print("   > [패스] 이미 공감함")
             except Exception as e:
@@ -495,8 +481,8 @@ class BlogAddNeighbor:
                 comment_btn = container.find_element(By.CSS_SELECTOR, config.SELECTORS["post_view_comment_button"])
                 smart_click(self.driver, comment_btn)
                 input_sel = config.SELECTORS["comment_text_area"]
-                WebDriverWait(self.driver, 5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, input_sel)))
-                smart_sleep(conf_delay.get("댓글창대기", (1.5, 2.0)), "댓글 입력창 가시성 대기")
+                CancellableWait(self.driver, 5).until(EC.visibility_of_element_located((By.CSS_SELECTOR, input_sel)))
+                smart_sleep(conf_delay["댓글창대기"], "댓글 입력창 가시성 대기")
 
                 # 실제 입력창 타이핑
                 comment_input = self.driver.find_element(By.CSS_SELECTOR, input_sel)
@@ -506,11 +492,11 @@ class BlogAddNeighbor:
                 print(f"   > 💬 댓글 타이핑: {comment_msg}")
                 human_typing(comment_input, comment_msg) 
                 
-                smart_sleep(conf_delay.get("메시지입력후대기", (0.2, 0.5)), "댓글 입력 완료 후 대기")
+                smart_sleep(conf_delay["메시지입력후대기"], "댓글 입력 완료 후 대기")
                 submit_btn = self.driver.find_element(By.CSS_SELECTOR, config.SELECTORS["comment_submit_button"])
                 smart_click(self.driver, submit_btn)
-                print("   > ✅ 댓글 등록 완료")
-                smart_sleep(conf_delay.get("목록페이지로딩", (1.0, 2.5)), "댓글 등록 완료 후 안정화 대기")
+                emit_event(self.worker, CommentDone("add", "NORMAL"))
+                smart_sleep(conf_delay["목록페이지로딩"], "댓글 등록 완료 후 안정화 대기")
             except Exception as e:
                 print(f"   > [댓글 실패] {e}")
 
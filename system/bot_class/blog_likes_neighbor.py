@@ -2,23 +2,30 @@
 import sys
 import os
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
 import config
-from utils import smart_sleep, smart_click, human_scroll_element
+from utils import smart_sleep, smart_click, human_scroll_element, CancellableWait
+from bot_class.feed_snapshot import capture_feed_snapshot
+from bot_class.run_journal import journal_phase
+from driver_profiler import profile_phase
+from browser_governor import checkpoint
+from run_trace import traced
+from bot_events import LikeDone, PageScanned, Error, emit_event
 
 class BlogLikesNeighbor:
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, 15)
+        self.wait = CancellableWait(self.driver, 15)
 
     # [수정] start_page 인자 추가
     def run(self, target_count, start_page=1):
         """메인 실행 함수"""
         # [수정] 시작 페이지로 바로 이동
-        if not self._go_to_blog_main(start_page):
+        with journal_phase(getattr(self, 'worker', None), "page_load"), profile_phase(self.driver, "like.page_load"):
+            page_ready = self._go_to_blog_main(start_page)
+        if not page_ready:
             print("❌ 블로그 홈 진입 실패")
             return
 
@@ -29,7 +36,7 @@ class BlogLikesNeighbor:
         
         # [수정] LIKES_NEIGHBOR_CONFIG 참조
         conf = config.LIKES_NEIGHBOR_CONFIG
-        fail_limit = conf["conditions"].get("최대실패횟수", 5)
+        fail_limit = conf["conditions"]["최대실패횟수"]
         fail_streak = 0 
 
         while clicked_total < target_count:
@@ -43,27 +50,31 @@ class BlogLikesNeighbor:
                 break
 
             print(f"\n📄 {current_page}페이지 탐색 중...")
-            # [수정] reason 필수 및 config 참조
-            smart_sleep(conf["delays"].get("페이지로딩", (1.0, 2.5)), f"{current_page}페이지 피드 데이터 로딩 대기")
+            with profile_phase(self.driver, "like.snapshot"):
+                # [수정] reason 필수 및 config 참조
+                smart_sleep(conf["delays"]["페이지로딩"], f"{current_page}페이지 피드 데이터 로딩 대기")
 
-            selector = config.SELECTORS["feed_like_buttons"]
-            buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                # 페이지 전체 게시글을 스크립트 1회로 스냅샷 (공감 상태 포함)
+                snapshot = capture_feed_snapshot(self.driver)
+            entries = [e for e in snapshot if e['like_btn'] is not None]
             
-            if not buttons:
+            if not entries:
                 print(" > [알림] 공감 버튼을 찾을 수 없습니다.")
                 # 페이지 로딩 직후 버튼이 없는 경우, 다음 페이지로 넘어가보기
                 # (마지막 페이지인지 체크 로직은 버튼 유무로 간접 판단)
                 if fail_streak < 2: # 한두 번은 봐줌
                      print(" > 페이지를 스킵하고 다음 페이지로 이동합니다.")
                      current_page += 1
-                     self._move_next_page_direct(current_page)
+                     checkpoint(self, page=current_page, done=clicked_total)
+                     with journal_phase(getattr(self, 'worker', None), "page_load"), profile_phase(self.driver, "like.page_load"):
+                         self._move_next_page_direct(current_page)
                      continue
                 else:
                      break
 
-            print(f" > 발견된 버튼: {len(buttons)}개")
+            emit_event(getattr(self, 'worker', None), PageScanned("like", current_page, len(entries)))
 
-            for btn in buttons:
+            for entry in entries:
                 # [추가 작업 2] 버튼 반복 중 중단 신호 체크
                 if hasattr(self, 'worker') and self.worker.is_stopped:
                     return
@@ -77,12 +88,15 @@ class BlogLikesNeighbor:
                 # 개별 버튼에 대해 최대 3회까지 시도 (Backoff 적용)
                 process_success = False
                 for attempt in range(1, 4):
-                    result = self._process_like_button(btn)
+                    # 첫 시도는 스냅샷의 공감 상태를 그대로 사용 (재시도 시에만 실제 상태 재확인)
+                    known_state = entry['liked'] if attempt == 1 else None
+                    with journal_phase(getattr(self, 'worker', None), "like_click"), profile_phase(self.driver, "like.click"):
+                        result = self._process_like_button(entry['like_btn'], known_state)
                     
                     if result == "SUCCESS":
                         clicked_total += 1
                         fail_streak = 0
-                        print(f" > [{clicked_total}/{target_count}] ❤️ 공감 완료")
+                        emit_event(getattr(self, 'worker', None), LikeDone("like", entry['nickname'], clicked_total, target_count))
                         process_success = True
                         break # 리트라이 루프 탈출
                         
@@ -94,27 +108,29 @@ class BlogLikesNeighbor:
                     else: # FAIL or ERROR
                         # 실패 시 점점 길게 대기 (1초 -> 2초 -> 3초)
                         backoff = float(attempt)
-                        print(f"   > [재시도] 클릭 미반영... {attempt}회차 대기 ({backoff}초)")
+                        print(f"   > [재시도] 클릭 미반영... {attempt}회차")
                         
-                        # 중단 체크가 가능한 분할 대기
-                        for _ in range(int(backoff * 2)):
-                            if hasattr(self, 'worker') and self.worker.is_stopped: return
-                            import time
-                            time.sleep(0.5)
+                        # 중단 가능한 대기 (중단 요청 시 TaskCancelled, 대기 배율/계측 반영)
+                        smart_sleep((backoff, backoff), "클릭 재시도 대기")
                 
                 # 3회 시도 후에도 최종 실패한 경우
                 if not process_success:
                     fail_streak += 1
-                    print(f" > [실패] 3회 시도 모두 실패 ({fail_streak}/{fail_limit})")
+                    emit_event(getattr(self, 'worker', None),
+                               Error("like", "click_failed", f"3회 시도 모두 실패 ({fail_streak}/{fail_limit})"))
                 else:
                     # 최종 성공(또는 이미 공감) 시에만 다음 작업을 위한 휴식
-                    smart_sleep(conf["delays"].get("작업간대기", (0.2, 0.5)), "다음 공감 버튼 클릭 전 휴식")
+                    smart_sleep(conf["delays"]["작업간대기"], "다음 공감 버튼 클릭 전 휴식")
             
             # 페이지 이동 로직
             if clicked_total < target_count and fail_streak < fail_limit:
                 current_page += 1
+                # 페이지 경계: 진행 위치 기록 + 남은 창 정리 (메모리 한도 초과 시 브라우저 재시작 후 이 페이지부터)
+                checkpoint(self, page=current_page, done=clicked_total)
                 # [수정] 기존 버튼 클릭 방식 대신 URL 이동 방식(direct) 사용 권장
-                if not self._move_next_page_direct(current_page):
+                with journal_phase(getattr(self, 'worker', None), "page_load"), profile_phase(self.driver, "like.page_load"):
+                    moved = self._move_next_page_direct(current_page)
+                if not moved:
                     print(" > 더 이상 페이지가 없습니다.")
                     break
             else:
@@ -125,7 +141,7 @@ class BlogLikesNeighbor:
     # [수정] page_num을 받아 URL로 직접 이동
     def _go_to_blog_main(self, page_num=1):
         try:
-            url = f"https://section.blog.naver.com/BlogHome.naver?currentPage={page_num}"
+            url = f"{config.NAVER_URLS['section']}/BlogHome.naver?currentPage={page_num}"
             self.driver.get(url)
             self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
@@ -135,24 +151,33 @@ class BlogLikesNeighbor:
                 # 공감 버튼이 나타날 때까지 최대 5초 대기
                 selector = config.SELECTORS["feed_like_buttons"]
                 self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-            except:
+            except Exception:
                 # 버튼이 없어도 페이지는 로드된 것으로 간주 (추가 대기만)
                 # [수정] reason 필수 및 config 참조
-                smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"].get("페이지로딩", (1.0, 2.5)), "첫 페이지 콘텐츠 완전히 로드될 때까지 대기")
+                smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"]["페이지로딩"], "첫 페이지 콘텐츠 완전히 로드될 때까지 대기")
             
             return True
-        except:
+        except Exception:
             return False
 
-    def _process_like_button(self, btn):
+    @traced("post.like", "action")
+    def _process_like_button(self, btn, known_state=None):
         conf_delay = config.LIKES_NEIGHBOR_CONFIG["delays"]
         try:
+            # 스냅샷에서 이미 공감한 글로 확인되면 스크롤/대기 없이 바로 패스
+            if known_state:
+                return "ALREADY"
+
             human_scroll_element(self.driver, btn)
             # [수정] reason 필수 및 config 참조
-            smart_sleep(conf_delay.get("클릭전대기", (0.1, 0.3)), "공감 버튼 클릭 전 실제 사람처럼 대기")
+            smart_sleep(conf_delay["클릭전대기"], "공감 버튼 클릭 전 실제 사람처럼 대기")
 
             # 클릭하기 전 상태 저장 (방금 공감한 것과 원래 공감했던 것 구별)
-            initial_state = btn.get_attribute("aria-pressed") == "true"
+            # 스냅샷 상태를 알고 있으면 재조회하지 않음
+            if known_state is None:
+                initial_state = btn.get_attribute("aria-pressed") == "true"
+            else:
+                initial_state = known_state
             
             # 진짜 이미 공감했던 글 (처음부터 true였던 경우)
             if initial_state:
@@ -166,7 +191,7 @@ class BlogLikesNeighbor:
             # (이 경우는 방금 공감한 것이므로 로그 없이 처리됨)
             for _ in range(3):
                 # [수정] reason 필수 및 config 참조
-                smart_sleep(conf_delay.get("확인대기", (0.3, 0.5)), "공감 처리 결과가 서버에 반영되는지 확인 중")
+                smart_sleep(conf_delay["확인대기"], "공감 처리 결과가 서버에 반영되는지 확인 중")
                 current_state = btn.get_attribute("aria-pressed") == "true"
                 if current_state:
                     # 원래 false였고 지금 true가 되었으므로 방금 공감 성공
@@ -180,10 +205,10 @@ class BlogLikesNeighbor:
     # [수정] URL 파라미터로 페이지 이동 (안정성 향상)
     def _move_next_page_direct(self, page_num):
         try:
-            url = f"https://section.blog.naver.com/BlogHome.naver?currentPage={page_num}"
+            url = f"{config.NAVER_URLS['section']}/BlogHome.naver?currentPage={page_num}"
             self.driver.get(url)
             # [수정] reason 필수 및 config 참조
-            smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"].get("페이지이동", (1.0, 2.5)), f"{page_num}페이지로 직접 이동 후 대기")
+            smart_sleep(config.LIKES_NEIGHBOR_CONFIG["delays"]["페이지이동"], f"{page_num}페이지로 직접 이동 후 대기")
             return True
-        except:
+        except Exception:
             return False
\ No newline at end of file
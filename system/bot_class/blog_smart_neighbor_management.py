@@ -3,23 +3,72 @@ import time
 import random
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from ai_helper import GeminiHelper
-from bot_class.db_manager import BlogDB
+from bot_class.db_manager import BlogDB, ACT_CODES, fingerprint
+from bot_class.feed_snapshot import capture_feed_snapshot
+from bot_class.run_journal import journal_phase
+from driver_profiler import profile_phase
+from driver_replay import replayable
+from browser_governor import child_window, checkpoint
+from run_trace import traced
+from bot_events import LikeDone, CommentDone, PageScanned, Error, emit_event
 import config
-from utils import human_scroll_distance, human_scroll_element, smart_sleep, smart_click, human_typing
+from utils import (human_scroll_distance, human_scroll_element, smart_sleep, smart_click, human_typing,
+                   CancellableWait, current_time)
+
+# 알림 카드 수확 스크립트: 처리한 카드는 data 속성으로 표시하여 다음 호출에서 제외
+# 반환: { cards: [{nick, date, type, title}], bottom: '맨 위로' 버튼 노출 여부 }
+NOTI_HARVEST_SCRIPT = """
+const [cardSel, iconLike, iconReply, iconComment, titleSel] = arguments;
+const cards = [];
+document.querySelectorAll(cardSel).forEach(card => {
+    if (card.dataset.botScanned) return;
+    card.dataset.botScanned = '1';
+    const dateEl = card.querySelector("span[class*='date']");
+    const nickEl = card.querySelector('strong');
+    const titleEl = card.querySelector(titleSel) || card.querySelector("p[class*='title']");
+    let type = '';
+    if (card.querySelector(iconLike)) type = '공감';
+    else if (card.querySelector(iconReply)) type = '답글';
+    else if (card.querySelector(iconComment)) type = '댓글';
+    else {
+        const text = card.innerText || '';
+        if (text.includes('공감')) type = '공감';
+        else if (text.includes('댓글')) type = '댓글';
+        else if (text.includes('답글')) type = '답글';
+    }
+    cards.push({
+        nick: nickEl ? nickEl.innerText.trim() : '',
+        date: dateEl ? dateEl.innerText.trim() : '',
+        title: titleEl ? titleEl.innerText.trim() : '',
+        type: type
+    });
+});
+const footer = document.querySelector("div[class*='scroll_top']");
+return { cards: cards, bottom: !!(footer && footer.offsetParent !== null) };
+"""
+
+# 증분 스캔 기준점으로 보관할 최신 알림 카드 지문 수
+SCAN_FINGERPRINT_KEEP = 30
+# 기준점 도달로 판단하는 연속 일치 카드 수 (지문 1건 일치는 같은 이웃의 반복 활동일 수 있음)
+HEAD_RUN_MATCH = 3
 
 class BlogSmartNeighborManagement:
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, 15)
+        self.wait = CancellableWait(self.driver, 15)
         self.worker = None
         self.db = BlogDB()
         self.temp_neighbor_stats = {}
-        # cached_ranking_map: 1단계 분석 후 랭킹 정보를 담아두는 곳
-        self.cached_ranking_map = {} 
+        # neighbor_policy: 1단계 종료 시 구성하는 이웃별 행동 등급 인덱스 (닉네임 -> 통계/등급, 댓글 쿨다운은 comment_cooldowns)
+        self.neighbor_policy = {}
+        # comment_cooldowns: blog_id -> 댓글 쿨다운 만료일 ('YYYY-MM-DD')
+        self.comment_cooldowns = {}
+        self.comments_done = 0    # Phase 2 진행 상황 (이벤트로 GUI 진행바에 전달)
+        self.comment_target = 0
+        self.policy_interval_days = 3
 
     def check_stopped(self):
         """작업 중단 여부 확인"""
@@ -32,7 +81,7 @@ class BlogSmartNeighborManagement:
         네이버 알림 시간 텍스트를 현재 시스템 시간(캐나다/한국) 기준 datetime으로 변환
         - 날짜 포맷(YYYY.MM.DD)은 24시간 경과로 간주하여 None 반환
         """
-        now = datetime.now()
+        now = current_time(self.driver)
         txt = time_text.strip()
         
         try:
@@ -58,64 +107,75 @@ class BlogSmartNeighborManagement:
             
             # '어제'는 나오지 않는다는 전제하에 로직 제거, 그 외 알 수 없는 포맷은 None
             return None
-        except:
+        except Exception:
             return None
 
     def run(self, params=None):
-        """스마트 이웃 관리 메인 루프 (Phase 1 -> Phase 2)"""
-        config.sync_all_configs()
-        
-        # [Phase 1] 알림 분석 및 DB 동기화
-        if not self._phase_1_analysis():
-            return
+        """스마트 이웃 관리 메인 루프 (Phase 1 -> Phase 2) - 설정은 GUI가 시작 직전에 동기화"""
+        # [Phase 1] 알림 분석 및 DB 동기화 (통계가 충분히 최신이면 생략하고 저장된 랭킹 사용)
+        if self._is_stats_fresh():
+            elapsed_min = int((current_time(self.driver) - self.db.get_last_scan_time()).total_seconds() // 60)
+            print(f"\n⏩ [1단계 생략] 마지막 알림 수집이 {elapsed_min}분 전이므로 저장된 랭킹으로 바로 시작합니다.")
+            with profile_phase(self.driver, "phase1.save"):
+                self._refresh_rankings()
+        else:
+            with journal_phase(self.worker, "analysis"), profile_phase(self.driver, "phase1.scan"):
+                analysed = self._phase_1_analysis()
+            if not analysed:
+                return
 
         if self.check_stopped(): 
             return
         
         # [Phase 2] 스마트 답방 실행
-        self._phase_2_action(params)
+        with journal_phase(self.worker, "action"), profile_phase(self.driver, "phase2"):
+            self._phase_2_action(params)
 
+    @traced("phase1.analysis", "phase")
     def _phase_1_analysis(self):
-        """[Phase 1] 알림 분석 (Strict Time Cutoff 적용)"""
+        """[Phase 1] 알림 분석 (카드 지문 기준점 도달 시 즉시 종료, 기준점이 없으면 Strict Time Cutoff)"""
         try:
             # 설정값 로드
-            cond = config.SMART_NEIGHBOR_CONFIG.get("conditions", {})
+            cond = config.SMART_NEIGHBOR_CONFIG["conditions"]
             
             # 1. 마지막 스캔 시간 로드
             last_scan_time = self.db.get_last_scan_time()
-            current_scan_start_time = datetime.now() # 이번 스캔 시작 시간
+            current_scan_start_time = current_time(self.driver) # 이번 스캔 시작 시간
+
+            # 2. 이전 스캔의 최신 카드 지문 (high-water mark) 로드
+            known_marks = self.db.get_scan_fingerprints()
+            head_marks = [] # 이번 스캔에서 본 최신 카드 지문 (다음 스캔의 기준점)
+            # 기준점 연속 일치 추적: 보류 중인 카드 / 마지막으로 일치한 기준점 위치
+            run_cards, run_end = [], None
+            head_run_needed = min(HEAD_RUN_MATCH, len(known_marks))
             
-            print(f"\n🕒 [기준 시각] {last_scan_time.strftime('%Y-%m-%d %H:%M:%S')} 이후 알림만 수집합니다.")
+            if known_marks:
+                print(f"\n🕒 [기준점] 이전 스캔의 최신 알림 {len(known_marks)}건과 순서대로 이어지는 지점에서 수집을 종료합니다.")
+            else:
+                print(f"\n🕒 [기준 시각] {last_scan_time.strftime('%Y-%m-%d %H:%M:%S')} 이후 알림만 수집합니다.")
 
-            self.driver.get("https://m.blog.naver.com/News.naver")
+            self.driver.get(f"{config.NAVER_URLS['mobile_blog']}/News.naver")
             smart_sleep((2.0, 3.0), "알림 페이지 로딩")
 
-            new_stats = {}
+            new_events = []
             is_scan_finished = False
             consecutive_empty_count = 0
-            processed_count = 0
 
             print(f"\n📡 [1단계] 데이터 증분 수집 시작...")
 
             while not is_scan_finished: 
                 if self.check_stopped(): return False
                 
-                # 1. 전체 카드 로드
-                all_cards = self.driver.find_elements(By.CSS_SELECTOR, "li[class*='item']")
-                
-                # 2. 증분 처리
-                new_batch = all_cards[processed_count:]
+                # 1. 스크립트 1회 호출로 새 카드만 JSON으로 수확 (카드별 왕복 제거)
+                new_batch, at_bottom = self._harvest_new_cards()
 
                 # --- [분기 A] 새로운 배치가 없을 때 (스크롤 또는 종료 판단) ---
                 if not new_batch:
                     # (1) UI 바닥 체크
-                    try:
-                        footer = self.driver.find_elements(By.CSS_SELECTOR, "div[class*='scroll_top']")
-                        if footer and footer[0].is_displayed():
-                            print(f"\n🛑 [종료 사유] '맨 위로' 버튼(UI) 발견 -> 페이지 바닥 도착")
-                            is_scan_finished = True
-                            break
-                    except: pass
+                    if at_bottom:
+                        print(f"\n🛑 [종료 사유] '맨 위로' 버튼(UI) 발견 -> 페이지 바닥 도착")
+                        is_scan_finished = True
+                        break
 
                     # (2) 연속 실패 카운트
                     consecutive_empty_count += 1
@@ -125,113 +185,226 @@ class BlogSmartNeighborManagement:
                         break
 
                     # (3) 스크롤 시도
-                    scroll_dist = cond.get("스크롤보폭", 500)
-                    load_delay = cond.get("데이터수집스크롤간격", (0.5, 0.8))
+                    scroll_dist = cond["스크롤보폭"]
+                    load_delay = cond["데이터수집스크롤간격"]
                     
                     human_scroll_distance(self.driver, scroll_dist)
                     smart_sleep(load_delay, "데이터 로딩 대기")
                     continue
 
-                # --- [분기 B] 새로운 배치가 있을 때 ---
+                # --- [분기 B] 새로운 배치가 있을 때 (메모리 내 파싱) ---
                 consecutive_empty_count = 0 
 
                 for card in new_batch:
-                    processed_count += 1
-                    
                     # 1. 시간 텍스트 추출
-                    try:
-                        time_el = card.find_element(By.CSS_SELECTOR, "span[class*='date']")
-                        time_txt = time_el.text.strip()
-                    except:
+                    time_txt = card.get('date', '')
+                    if not time_txt:
                         continue
 
                     # 2. 시간 파싱
                     item_time = self._parse_relative_time(time_txt)
+                    if item_time is None:
+                        # 파싱 실패 시 안전하게 건너뛰거나 종료 (여기선 종료하여 안전 추구)
+                        print(f"   🛑 [종료] 시간 형식 인식 불가 ({time_txt}) -> 안전 종료")
+                        is_scan_finished = True
+                        break
 
-                    if item_time is not None:
-                        # [핵심] Strict Cutoff 로직
-                        # 알림 시간이 마지막 스캔 시간보다 같거나 과거면 -> 이미 처리한 데이터(혹은 날짜 변환으로 인한 과거 처리) -> 종료
-                        if item_time <= last_scan_time:
-                            print(f"   🛑 [종료] 마지막 작업 시점 도달 ({time_txt}) -> 중복 방지")
+                    nick = card.get('nick', '')
+                    act_type = card.get('type', '')
+                    title = card.get('title', '')
+                    card_info = (nick, act_type, title, item_time, time_txt)
+
+                    # 3. 카드 지문 (닉네임 + 유형 + 제목) + 대략적 날짜
+                    card_fp = fingerprint(nick, act_type, title) if nick and act_type else None
+                    card_day = item_time.date().toordinal()
+                    if card_fp is not None and len(head_marks) < SCAN_FINGERPRINT_KEEP:
+                        head_marks.append([card_fp, card_day])
+
+                    if known_marks:
+                        # [핵심] 같은 이웃이 같은 글에 다시 남긴 새 알림도 지문이 같으므로 지문 1건 일치로는 종료하지 않음
+                        # -> 이전 기준점 순서대로 연속 일치하거나, 일치 + 마지막 스캔 이전 시각일 때만 종료
+                        match = None
+                        if card_fp is not None:
+                            expect = run_end + 1 if run_end is not None else 0
+                            match = self._match_head_mark(known_marks, card_fp, card_day, expect)
+                        if match is not None:
+                            if run_end is not None and match == run_end + 1:
+                                run_cards.append(card_info)
+                            else:
+                                for held in run_cards:
+                                    self._collect_card(held, new_events)
+                                run_cards = [card_info]
+                            run_end = match
+                            if len(run_cards) >= head_run_needed or item_time <= last_scan_time:
+                                print(f"   🛑 [종료] 이전 스캔 기준점 도달 ({nick}/{act_type} - {time_txt}) -> 중복 방지")
+                                run_cards = []
+                                is_scan_finished = True
+                                break
+                            continue
+
+                        # 기준점과 이어지지 않으면 보류했던 카드도 새 알림으로 수집
+                        for held in run_cards:
+                            self._collect_card(held, new_events)
+                        run_cards, run_end = [], None
+
+                        # 안전장치: 기준점 카드가 삭제된 경우 등, 마지막 스캔보다 하루 이상 오래된 알림이면 종료
+                        if item_time < last_scan_time - timedelta(days=1):
+                            print(f"   🛑 [종료] 마지막 작업 시점 이전 알림 도달 ({time_txt}) -> 중복 방지")
                             is_scan_finished = True
                             break
-                    else:
-                        # 파싱 실패 시 안전하게 건너뛰거나 종료 (여기선 종료하여 안전 추구)
-                        print(f"   🛑 [종료] 시간 형식 인식 불가 ({time_txt}) -> 안전 종료")
+                    elif item_time <= last_scan_time:
+                        # [기준점 없음] Strict Cutoff 로직
+                        # 알림 시간이 마지막 스캔 시간보다 같거나 과거면 -> 이미 처리한 데이터(혹은 날짜 변환으로 인한 과거 처리) -> 종료
+                        print(f"   🛑 [종료] 마지막 작업 시점 도달 ({time_txt}) -> 중복 방지")
                         is_scan_finished = True
                         break
                     
-                    # 3. 데이터 수집
-                    try:
-                        text_content = card.text
-                        act_type = ""
-                        if "공감" in text_content: act_type = "공감"
-                        elif "댓글" in text_content: act_type = "댓글"
-                        elif "답글" in text_content: act_type = "답글"
-
-                        nick_el = card.find_element(By.TAG_NAME, "strong")
-                        nick = nick_el.text.strip()
-                        
-                        if nick and act_type:
-                            if nick not in new_stats:
-                                new_stats[nick] = {'like': 0, 'comment': 0, 'reply': 0}
-                            
-                            if act_type == "댓글": new_stats[nick]['comment'] += 1
-                            elif act_type == "답글": new_stats[nick]['reply'] += 1
-                            elif act_type == "공감": new_stats[nick]['like'] += 1
-                            
-                            print(f"   > [수집] {nick} ({act_type}) - {time_txt}")
-                    except Exception as e:
-                        continue
+                    # 4. 데이터 수집
+                    self._collect_card(card_info, new_events)
 
                 if is_scan_finished:
                     break
 
+            # 기준점과 일부만 이어진 채 목록이 끝났으면 보류 카드도 새 알림으로 수집
+            for held in run_cards:
+                self._collect_card(held, new_events)
+
             # --- [데이터 정리 및 저장] ---
-            if new_stats:
-                self.db.update_neighbor_stats_only(new_stats)
-                print(f"\n ✅ {len(new_stats)}명의 새로운 활동 데이터 저장 완료")
-            else:
-                print(f"\n ✅ 새로운 활동이 없습니다.")
+            with profile_phase(self.driver, "phase1.save"):
+                if new_events:
+                    self.db.record_neighbor_events(new_events)
+                    print(f"\n ✅ {len({e[0] for e in new_events})}명의 새로운 활동 데이터 저장 완료")
+                else:
+                    print(f"\n ✅ 새로운 활동이 없습니다.")
 
-            # 마지막 스캔 시간 갱신
-            self.db.update_last_scan_time(current_scan_start_time)
+                # 마지막 스캔 시간 + 최신 카드 지문(다음 스캔 기준점) 갱신
+                self.db.update_last_scan_time(current_scan_start_time)
+                if head_marks:
+                    self.db.update_scan_fingerprints(head_marks)
 
-            # 랭킹 산출 및 캐싱
-            self._cache_and_emit_rankings()
+                self._refresh_rankings()
             
             return True
 
         except Exception as e:
-            print(f"⚠️ [1단계 오류] {e}")
+            emit_event(self.worker, Error("smart", "phase1_failed", f"[1단계 오류] {e}"))
             return False
 
+    def _is_stats_fresh(self):
+        """마지막 알림 수집 후 '알림갱신주기'(분)가 지나지 않았는지 확인 (0이면 항상 새로 수집)"""
+        fresh_minutes = config.SMART_NEIGHBOR_CONFIG["conditions"]["알림갱신주기"]
+        if not fresh_minutes or fresh_minutes <= 0:
+            return False
+        return current_time(self.driver) - self.db.get_last_scan_time() < timedelta(minutes=fresh_minutes)
+
+    def _refresh_rankings(self):
+        """랭킹 산출 및 GUI 전송 + 2단계에서 사용할 이웃 정책 인덱스 구성 (페이지 계획은 dict 조회만 수행)"""
+        self._cache_and_emit_rankings()
+        self._build_policy_index()
+
+    def _match_head_mark(self, known_marks, card_fp, card_day, expect):
+        """
+        이전 스캔 기준점 목록에서 카드 위치 찾기 (상대 시간 표기 오차를 고려해 날짜는 ±1일 허용)
+        - expect(직전 일치 다음 위치)가 맞으면 우선 반환, 아니면 처음 일치하는 위치 / 없으면 None
+        """
+        def same(index):
+            fp, day = known_marks[index]
+            return fp == card_fp and abs(card_day - day) <= 1
+        if expect < len(known_marks) and same(expect):
+            return expect
+        return next((i for i in range(len(known_marks)) if same(i)), None)
+
+    def _collect_card(self, card_info, new_events):
+        """새 알림 카드 1건을 이번 스캔 이벤트에 추가"""
+        nick, act_type, title, item_time, time_txt = card_info
+        if not nick or act_type not in ACT_CODES:
+            return
+
+        # 원본 이벤트 보존 (닉네임/유형/시각/제목 지문) -> 통계는 DB 트리거가 집계
+        new_events.append((
+            nick, ACT_CODES[act_type], int(item_time.timestamp()),
+            fingerprint(title) if title else None
+        ))
+
+        print(f"   > [수집] {nick} ({act_type}) - {time_txt}")
+
+    def _harvest_new_cards(self):
+        """알림 카드 중 아직 읽지 않은 카드만 한 번의 스크립트 호출로 수확 -> (카드 목록, 바닥 도달 여부)"""
+        sel = config.SELECTORS
+        try:
+            result = self.driver.execute_script(
+                NOTI_HARVEST_SCRIPT,
+                "li[class*='item']", sel["icon_like"], sel["icon_reply"], sel["icon_comment"], sel["noti_title"]
+            ) or {}
+        except Exception as e:
+            print(f"   (⚠️ 알림 카드 수집 실패 : {e})")
+            return [], False
+        return result.get('cards') or [], bool(result.get('bottom'))
+
     def _cache_and_emit_rankings(self):
-        """DB 통계를 메모리에 캐싱하고 GUI로 전송"""
-        stats = self.db.get_all_neighbor_stats()
-        raw_ui_list = []
-        self.cached_ranking_map = {}
-
-        for s in stats:
-            score = (s['total_comments'] * 10) + (s['total_reply'] * 3) + (s['total_likes'] * 1)
-            self.cached_ranking_map[s['nickname']] = {
-                'c': s['total_comments'], 
-                'r': s['total_reply'], 
-                'l': s['total_likes'],
-                'score': score
-            }
-            raw_ui_list.append((s['nickname'], {
-                'comment': s['total_comments'], 
-                'reply': s['total_reply'], 
-                'like': s['total_likes'], 
-                'score': score
+        """DB가 유지하는 점수 인덱스 순서대로 랭킹을 읽어 GUI로 전송 (파이썬 재계산/정렬 없음)"""
+        weights = config.SMART_NEIGHBOR_CONFIG["weights"]
+        # 가중치가 바뀐 경우에만 DB에서 1회 재산출, 평소에는 트리거가 증분 유지
+        if self.db.set_ranking_weights(weights['댓글점수'], weights['답글점수'], weights['공감점수']):
+            print("   ℹ️ [랭킹] 가중치 변경 감지 -> 점수 재산출")
+        self.db.apply_score_decay(weights['점수반감기'])
+
+        # 랭킹기간(일)이 지정되면 이벤트 로그에서 해당 기간만 집계 (재스크롤 불필요)
+        since_ts = self._ranking_window_start()
+        if since_ts is None:
+            rows = self.db.get_top_rankings()
+        else:
+            rows = self.db.get_window_rankings(since_ts)
+
+        ui_list = []
+        for nickname, c, r, l, score in rows:
+            ui_list.append((nickname, {
+                'comment': c, 
+                'reply': r, 
+                'like': l, 
+                'score': int(score) if score == int(score) else round(score, 1)
             }))
         
-        ui_list = sorted(raw_ui_list, key=lambda x: x[1]['score'], reverse=True)
         if self.worker: 
             try: self.worker.ranking_signal.emit(ui_list)
-            except: pass
+            except Exception: pass
+
+    def _ranking_window_start(self):
+        """랭킹기간(일) 설정 시 집계 시작 시각(epoch 초), 0 또는 미설정이면 None (전체 누적)"""
+        window_days = config.SMART_NEIGHBOR_CONFIG["conditions"]["랭킹기간"]
+        if not window_days or window_days <= 0:
+            return None
+        return int((current_time(self.driver) - timedelta(days=window_days)).timestamp())
+
+    def _build_policy_index(self):
+        """[정책] 이웃별 행동 등급(AI_COMMENT/NORMAL_COMMENT/LIKE_ONLY)과 댓글 쿨다운을 메모리에 구성"""
+        interval_days = config.SMART_NEIGHBOR_CONFIG["conditions"]["댓글주기"]
+        rows, cooldowns = self.db.get_neighbor_policy(interval_days, self._ranking_window_start())
+
+        self.neighbor_policy = {}
+        for nickname, c, r, l in rows:
+            if c > 0: action = "AI_COMMENT"
+            elif r > 0: action = "NORMAL_COMMENT"
+            else: action = "LIKE_ONLY"
+            self.neighbor_policy[nickname] = {
+                'c': c, 'r': r, 'l': l,
+                'action': action
+            }
+        self.comment_cooldowns = cooldowns
+        self.policy_interval_days = interval_days
 
+    def _is_comment_cooldown(self, blog_id, today_str):
+        """댓글 주기 이내인지 확인 (blog_id 기준 기록만 사용)"""
+        cooldown_until = self.comment_cooldowns.get(blog_id)
+        return cooldown_until is not None and today_str < cooldown_until
+
+    def _mark_commented(self, blog_id, nickname):
+        """댓글 성공 시 DB 저장 + 메모리 정책 인덱스의 쿨다운 즉시 갱신"""
+        self.db.save_comment_success(blog_id, nickname)
+        cooldown_until = (current_time(self.driver).date() + timedelta(days=self.policy_interval_days)).isoformat()
+        self.comment_cooldowns[blog_id] = cooldown_until
+
+    @traced("phase2.action", "phase")
     def _phase_2_action(self, params):
         """[Phase 2] 스마트 답방 실행 (기존 run 함수 로직 이동)"""
         try:
@@ -243,236 +416,254 @@ class BlogSmartNeighborManagement:
             print(f"\n🚀 [2단계] 스마트 답방 시작 (목표 댓글: {target_comment_cnt}건)")
             
             current_page = start_page
-            total_comments_done = 0 
+            self.comments_done = 0
+            self.comment_target = target_comment_cnt
             
-            while total_comments_done < target_comment_cnt:
+            while self.comments_done < target_comment_cnt:
                 if self.check_stopped(): 
                     break
 
-                url = f"https://section.blog.naver.com/BlogHome.naver?currentPage={current_page}"
-                self.driver.get(url)
-                
-                # 기존 설정값 사용
-                p_loading = conf.get("delays", {}).get("페이지로딩", (2.0, 3.5))
-                smart_sleep(p_loading if isinstance(p_loading, tuple) else (2.0, 3.5), f"{current_page}페이지 로딩")
-                
-                items = self.driver.find_elements(By.CSS_SELECTOR, config.SELECTORS["feed_item_inner"])
-                if not items:
+                # 페이지 경계: 진행 위치 기록 + 남은 창 정리 (메모리 한도 초과 시 브라우저 재시작 후 이 페이지부터)
+                checkpoint(self, page=current_page, done=self.comments_done)
+
+                with profile_phase(self.driver, "phase2.page_load"):
+                    url = f"{config.NAVER_URLS['section']}/BlogHome.naver?currentPage={current_page}"
+                    self.driver.get(url)
+
+                    # 기존 설정값 사용
+                    smart_sleep(conf["delays"]["페이지로딩"], f"{current_page}페이지 로딩")
+
+                    # 페이지 전체를 스크립트 1회로 스냅샷 (계획/실행 모두 이 스냅샷을 공유)
+                    snapshot = capture_feed_snapshot(self.driver)
+                if not snapshot:
                     print(f"⚠️ {current_page}페이지에 게시글이 없습니다. 작업을 종료합니다.")
                     break
+                emit_event(self.worker, PageScanned("smart", current_page, len(snapshot)))
 
                 # [Plan] 행동 계획 수립
-                action_plan = self._plan_page_actions(items)
+                with profile_phase(self.driver, "phase2.plan"):
+                    action_plan = self._plan_page_actions(snapshot)
                 
                 # [Execute] 계획 실행
-                comments_in_page = self._execute_page_actions(action_plan)
-                total_comments_done += comments_in_page
+                self._execute_page_actions(action_plan, snapshot)
                 
-                print(f"   👉 현재 진행: 댓글달기 {total_comments_done}/{target_comment_cnt} 완료")
+                print(f"   👉 현재 진행: 댓글달기 {self.comments_done}/{target_comment_cnt} 완료")
                 
                 current_page += 1
+
+                # [선택] 답방 도중 통계가 오래되면 페이지 사이에 알림 증분만 갱신 (다음 페이지는 URL로 재진입)
+                if conf["conditions"]["페이지간알림갱신"] and not self._is_stats_fresh():
+                    print(f"\n🔄 [알림 갱신] 알림 통계가 오래되어 증분 수집 후 {current_page}페이지부터 이어갑니다.")
+                    with journal_phase(self.worker, "analysis"), profile_phase(self.driver, "phase1.scan"):
+                        self._phase_1_analysis()
+                    if self.check_stopped():
+                        break
+
                 smart_sleep((1.0, 1.5), "다음 페이지 이동 대기")
 
-            print(f"\n✨ 목표 달성! 스마트 답방 종료 (총 댓글 {total_comments_done}건)")
+            print(f"\n✨ 목표 달성! 스마트 답방 종료 (총 댓글 {self.comments_done}건)")
+            stats = GeminiHelper.cache_stats
+            if stats['hit'] or stats['miss']:
+                print(f"   🧠 AI 댓글 캐시: 적중 {stats['hit']}회 / 신규 생성 {stats['miss']}회")
+            for name, m in GeminiHelper.get_metrics().items():
+                print(f"   📈 AI 백엔드 [{name}] 호출 {m['calls']}회 | 실패 {m['failures']} | 시간초과 {m['timeouts']} | "
+                      f"평균 {m['avg_latency']}초 / 최대 {m['max_latency']:.1f}초 | 토큰 {m['tokens']}")
 
         except Exception as e:
-            print(f"⚠️ [2단계 오류] {e}")
+            emit_event(self.worker, Error("smart", "phase2_failed", f"[2단계 오류] {e}"))
 
-    def _plan_page_actions(self, items):
-        """피드 내 게시글 분석 및 우선순위 계획 수립"""
+    def _plan_page_actions(self, snapshot):
+        """피드 스냅샷 분석 및 우선순위 계획 수립 (WebDriver 호출 없음)"""
         plan_list = []
-        sel = config.SELECTORS
-        interval_days = config.SMART_NEIGHBOR_CONFIG["conditions"].get("댓글주기", 3)
+        interval_days = self.policy_interval_days
+        use_gemini = config.GEMINI_CONFIG["USE_GEMINI"]
+        today_str = current_time(self.driver).date().isoformat()
         
         print(f"\n📋 [Action Plan] 페이지 분석 (우선순위 가이드)")
         print("-" * 85)
 
-        for idx, item in enumerate(items):
+        for entry in snapshot:
             try:
-                nickname = item.find_element(By.CSS_SELECTOR, sel["feed_nickname"]).text.strip()
-                author_el = item.find_element(By.CSS_SELECTOR, sel["feed_author_link"])
-                blog_id = author_el.get_attribute("href").split('/')[-1]
+                idx, nickname, blog_id = entry['index'], entry['nickname'], entry['blog_id']
+                if not nickname or not blog_id:
+                    continue
                 
-                rank_data = self.cached_ranking_map.get(nickname)
+                policy = self.neighbor_policy.get(nickname)
                 action_type = "SKIP"
                 
-                if rank_data:
-                    stats_str = f"{nickname}(댓{rank_data['c']}/답{rank_data['r']}/공{rank_data['l']})"
+                if policy:
+                    stats_str = f"{nickname}(댓{policy['c']}/답{policy['r']}/공{policy['l']})"
+                    action_type = policy['action']
                     
-                    if rank_data.get('c', 0) > 0:
-                        if self.db.can_I_comment(blog_id, interval_days):
-                            action_type = "AI_COMMENT" if config.GEMINI_CONFIG.get("USE_GEMINI") else "NORMAL_COMMENT"
-                        else: 
+                    if action_type != "LIKE_ONLY":
+                        if self._is_comment_cooldown(blog_id, today_str):
                             print(f"   > [이미 댓글 작성] {nickname}의 게시글은 이미 {interval_days}일 이내에 댓글을 작성했습니다.")
                             action_type = "LIKE_ONLY"
-                    elif rank_data.get('r', 0) > 0:
-                        if self.db.can_I_comment(blog_id, interval_days):
+                        elif action_type == "AI_COMMENT" and not use_gemini:
                             action_type = "NORMAL_COMMENT"
-                        else: 
-                            print(f"   > [이미 댓글 작성] {nickname}의 게시글은 이미 {interval_days}일 이내에 댓글을 작성했습니다.")
-                            action_type = "LIKE_ONLY"
-                    else: action_type = "LIKE_ONLY"
                 else:
                     stats_str = f"{nickname}(데이터없음)"
                     action_type = "LIKE_ONLY"
                 
                 print(f" - {stats_str.ljust(30)} : {action_type}")
                 plan_list.append({'index': idx, 'nickname': nickname, 'blog_id': blog_id, 'action': action_type})
-            except: 
+            except Exception: 
                 continue
         print("-" * 85)
         return plan_list
 
-    def _execute_page_actions(self, plan_list):
-        """계획된 피드 작업 실행"""
-        sel = config.SELECTORS
+    def _execute_page_actions(self, plan_list, snapshot):
+        """계획된 피드 작업 실행 (스냅샷의 요소 참조 재사용, 재조회 없음)"""
         success_comments = 0
-        comment_msgs = config.SMART_NEIGHBOR_CONFIG.get("messages", ["잘 보고 갑니다!"])
-        items = self.driver.find_elements(By.CSS_SELECTOR, sel["feed_item_inner"])
+        comment_msgs = config.SMART_NEIGHBOR_CONFIG["messages"] or ["잘 보고 갑니다!"]
 
         for plan in plan_list:
             if self.check_stopped(): 
                 break
             idx, action, nick = plan['index'], plan['action'], plan['nickname']
-            try: 
-                # 인덱스 유효성 체크
-                if idx < len(items):
-                    current_item = items[idx]
-                else:
-                    continue
-            except: 
+            # 인덱스 유효성 체크
+            if idx is None or idx >= len(snapshot):
                 continue
+            entry = snapshot[idx]
 
             if action in ["AI_COMMENT", "NORMAL_COMMENT"]:
-                if self._execute_comment_logic(current_item, plan['blog_id'], nick, comment_msgs, action):
+                with profile_phase(self.driver, "phase2.comment"):
+                    commented = self._execute_comment_logic(entry['item'], plan['blog_id'], nick, comment_msgs, action)
+                if commented:
                     success_comments += 1
                 else:
-                    if self._execute_like_logic(current_item):
-                        print(f"✅ [스마트관리] 공감 성공 ❤️ ({nick})")
+                    with profile_phase(self.driver, "phase2.like"):
+                        if self._execute_like_logic(entry):
+                            emit_event(self.worker, LikeDone("smart", nick))
             elif action == "LIKE_ONLY":
-                if self._execute_like_logic(current_item):
-                    print(f"✅ [스마트관리] 공감 성공 ❤️ ({nick})")
+                with profile_phase(self.driver, "phase2.like"):
+                    if self._execute_like_logic(entry):
+                        emit_event(self.worker, LikeDone("smart", nick))
             
-            time.sleep(random.uniform(0.5, 1.0))
+            smart_sleep((0.5, 1.0), None)
         return success_comments
 
+    @traced("post.comment", "action")
     def _execute_comment_logic(self, item_el, blog_id, nickname, messages, requested_action):
         """댓글 작성 상세 로직 (AI 실패 시 일반 댓글 전환 포함)"""
         try:
             sel = config.SELECTORS
             use_ai = (requested_action == "AI_COMMENT")
             
-            # 1. 블로그 진입 (댓글 아이콘 클릭 또는 새 창 열기)
-            try:
-                reply_btn = item_el.find_element(By.CSS_SELECTOR, sel["feed_reply_icon"])
-                smart_click(self.driver, reply_btn)
-            except:
-                self.driver.execute_script(f"window.open('https://blog.naver.com/{blog_id}');")
-
-            smart_sleep((2.0, 3.0), f"@{nickname} 블로그 진입")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-
-            # 2. 메인 프레임 전환 및 입력 영역 확인
-            try:
-                self.wait.until(EC.frame_to_be_available_and_switch_to_it((By.ID, "mainFrame")))
-                input_area = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, sel["comment_input_area"])))
-
-                msg = ""
-                # 3. AI 댓글 생성 프로세스
-                if use_ai:
-                    api_key = config.GEMINI_CONFIG.get("GEMINI_API_KEY")
-                    if not api_key:
-                        print(f"   ℹ️ [전환] API 키 누락 -> 일반 댓글로 진행")
-                        use_ai = False
-                    else:
-                        # 데이터 추출 단계 (개별 예외 처리로 안정성 확보)
-                        try:
-                            # 제목 추출 시도
-                            try:
-                                title_text = self.driver.find_element(By.CSS_SELECTOR, ".se-title-text").text.strip()
-                            except:
-                                title_text = "제목 없음"
-
-                            # 본문 추출 시도 (.se-main-container 가 없는 경우 대비)
+            # 블로그 창은 구간을 벗어나면(예외 포함) 닫히고 피드 창으로 복귀
+            with child_window(self.driver) as windows:
+                # 1. 블로그 진입 (댓글 아이콘 클릭 또는 새 창 열기)
+                try:
+                    reply_btn = item_el.find_element(By.CSS_SELECTOR, sel["feed_reply_icon"])
+                    smart_click(self.driver, reply_btn)
+                except Exception:
+                    self.driver.execute_script("window.open(arguments[0]);", f"{config.NAVER_URLS['blog']}/{blog_id}")
+
+                smart_sleep((2.0, 3.0), f"@{nickname} 블로그 진입")
+                if not windows.switch_to_new():
+                    emit_event(self.worker, Error("smart", "comment_failed", f"{nickname} 블로그 창이 열리지 않았습니다."))
+                    return False
+
+                # 2. 메인 프레임 전환 및 입력 영역 확인
+                try:
+                    self.wait.until(EC.frame_to_be_available_and_switch_to_it((By.ID, "mainFrame")))
+                    input_area = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, sel["comment_input_area"])))
+
+                    msg = ""
+                    # 3. AI 댓글 생성 프로세스
+                    if use_ai:
+                        api_key = config.GEMINI_CONFIG["GEMINI_API_KEY"].strip()
+                        # AI 사용 가능 여부/생성 결과는 기록 재생 시 기록된 값을 그대로 사용 (설정/네트워크와 무관하게 같은 흐름)
+                        if not replayable(self.driver, "ai_ready",
+                                          lambda: bool(api_key) or not GeminiHelper.needs_api_key()):
+                            print(f"   ℹ️ [전환] API 키 누락 -> 일반 댓글로 진행")
+                            use_ai = False
+                        else:
+                            # 데이터 추출 단계 (개별 예외 처리로 안정성 확보)
                             try:
-                                full_text = self.driver.find_element(By.CSS_SELECTOR, ".se-main-container").text.strip()
-                            except:
-                                full_text = ""
-
-                            # 본문 내용이 너무 적거나 추출에 실패한 경우
-                            if len(full_text) < 50:
-                                print(f"   ℹ️ [전환] 추출된 본문 정보 부족 -> 일반 댓글로 진행")
-                                use_ai = False
-                            else:
-                                # 토큰 절약을 위해 제목 + 본문 앞부분만 조합
-                                post_data = f"제목: {title_text}\n본문 요약: {full_text[:300]}"
-
-                                msg = GeminiHelper(api_key).generate_comment(
-                                    post_data, 
-                                    config.GEMINI_CONFIG.get("GEMINI_PROMPT", "")
-                                )
-                                
-                                if not msg:
-                                    print(f"   ℹ️ [전환] AI 응답 생성 실패 -> 일반 댓글로 진행")
+                                # 제목 추출 시도
+                                try:
+                                    title_text = self.driver.find_element(By.CSS_SELECTOR, ".se-title-text").text.strip()
+                                except Exception:
+                                    title_text = "제목 없음"
+
+                                # 본문 추출 시도 (.se-main-container 가 없는 경우 대비)
+                                try:
+                                    full_text = self.driver.find_element(By.CSS_SELECTOR, ".se-main-container").text.strip()
+                                except Exception:
+                                    full_text = ""
+
+                                # 본문 내용이 너무 적거나 추출에 실패한 경우
+                                if len(full_text) < 50:
+                                    print(f"   ℹ️ [전환] 추출된 본문 정보 부족 -> 일반 댓글로 진행")
                                     use_ai = False
-                        except Exception as e:
-                            print(f"   ℹ️ [전환] 데이터 분석 중 오류({e}) -> 일반 댓글로 진행")
-                            use_ai = False
+                                else:
+                                    # 토큰 절약을 위해 제목 + 본문 앞부분만 조합
+                                    post_data = f"제목: {title_text}\n본문 요약: {full_text[:300]}"
+
+                                    msg = replayable(self.driver, "ai_comment", lambda: GeminiHelper(api_key).generate_comment(
+                                        post_data, 
+                                        config.GEMINI_CONFIG["GEMINI_PROMPT"]
+                                    ))
+                                
+                                    if not msg:
+                                        print(f"   ℹ️ [전환] AI 응답 생성 실패 -> 일반 댓글로 진행")
+                                        use_ai = False
+                            except Exception as e:
+                                print(f"   ℹ️ [전환] 데이터 분석 중 오류({e}) -> 일반 댓글로 진행")
+                                use_ai = False
                 
-                # 4. 최종 메시지 확정 (AI 실패 시 리스트에서 랜덤 선택)
-                if not msg: 
-                    msg = random.choice(messages)
-                    use_ai = False
-
-                # ==========================================================
-                # [수정] 이모지 제거 (BMP 오류 방지)
-                # 크롬 드라이버 충돌 방지를 위해 이모지를 제거합니다.
-                # ==========================================================
-                msg = ''.join(c for c in msg if c <= '\uFFFF')
+                    # 4. 최종 메시지 확정 (AI 실패 시 리스트에서 랜덤 선택)
+                    if not msg: 
+                        msg = random.choice(messages)
+                        use_ai = False
+
+                    # ==========================================================
+                    # [수정] 이모지 제거 (BMP 오류 방지)
+                    # 크롬 드라이버 충돌 방지를 위해 이모지를 제거합니다.
+                    # ==========================================================
+                    msg = ''.join(c for c in msg if c <= '\uFFFF')
                 
-                # 만약 이모지를 다 지웠더니 내용이 비어버리면 기본 메시지 사용
-                if not msg.strip():
-                    msg = random.choice(messages)
-                # ==========================================================
-
-                # 5. 댓글 입력 및 전송
-                smart_click(self.driver, input_area)
-                human_typing(input_area, msg)
+                    # 만약 이모지를 다 지웠더니 내용이 비어버리면 기본 메시지 사용
+                    if not msg.strip():
+                        msg = random.choice(messages)
+                    # ==========================================================
+
+                    # 5. 댓글 입력 및 전송
+                    smart_click(self.driver, input_area)
+                    human_typing(input_area, msg)
                 
-                submit_btn = self.driver.find_element(By.CSS_SELECTOR, sel["comment_submit_button"])
-                smart_click(self.driver, submit_btn)
+                    submit_btn = self.driver.find_element(By.CSS_SELECTOR, sel["comment_submit_button"])
+                    smart_click(self.driver, submit_btn)
                 
-                print(f"✅ [스마트관리] {'AI' if use_ai else '일반'}댓글 성공 ({nickname})")
-                print(f"   💬 내용: {msg}")
+                    self.comments_done += 1
+                    emit_event(self.worker, CommentDone("smart", "AI" if use_ai else "NORMAL", nickname, msg,
+                                                        self.comments_done, self.comment_target))
 
-                self.db.save_comment_success(blog_id, nickname)
-                smart_sleep((1.5, 2.5), "등록 완료 대기")
+                    self._mark_commented(blog_id, nickname)
+                    smart_sleep((1.5, 2.5), "등록 완료 대기")
                 
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
-                return True
-
-            except Exception as e:
-                print(f"   ⚠️ 내부 처리 오류: {nickname} 블로그 작업 실패 ({e})")
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
-                return False
+                    return True
+
+                except Exception as e:
+                    emit_event(self.worker, Error("smart", "comment_failed", f"{nickname} 블로그 작업 실패 ({e})"))
+                    return False
 
         except Exception as e:
-            print(f"   ❌ 시스템 오류: {e}")
+            emit_event(self.worker, Error("smart", "system_error", str(e)))
             return False
 
-    def _execute_like_logic(self, item_el):
-        """공감 클릭 로직"""
+    @traced("post.like", "action")
+    def _execute_like_logic(self, entry):
+        """공감 클릭 로직 (스냅샷의 공감 상태로 판단, 클릭할 때만 요소 사용)"""
         try:
-            sel = config.SELECTORS
-            like_btn = item_el.find_element(By.CSS_SELECTOR, sel["feed_like_buttons"])
-            if like_btn.get_attribute("aria-pressed") == "true": 
+            like_btn = entry.get('like_btn')
+            if not like_btn or entry.get('liked'): 
                 return False
             human_scroll_element(self.driver, like_btn)
             smart_sleep((0.1, 0.3), "공감 버튼 클릭 전 실제 사람처럼 대기")
             smart_click(self.driver, like_btn)
+            entry['liked'] = True
             return True
-        except: 
+        except Exception: 
             return False
\ No newline at end of file
@@ -1,19 +1,108 @@
 import sqlite3
 import os
+import json
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 import config
+from run_trace import span
+
+# 알림 이벤트 활동 유형 코드 (neighbor_events.act)
+ACT_LIKE = 0
+ACT_COMMENT = 1
+ACT_REPLY = 2
+ACT_CODES = {"공감": ACT_LIKE, "댓글": ACT_COMMENT, "답글": ACT_REPLY}
+
+def fingerprint(*parts):
+    """문자열 조합의 안정적인 64비트 지문 (SQLite INTEGER에 그대로 저장 가능한 부호 있는 정수)"""
+    digest = hashlib.blake2b("\x1f".join(str(p) for p in parts).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
 
 class BlogDB:
+    # 클래스 변수로 연결을 관리 (GUI 스레드와 ActionWorker 스레드가 하나의 연결을 공유)
+    _conn = None
+    _lock = threading.RLock()
+
     def __init__(self):
         # 실행 파일 위치 기준 DB 경로 설정
         self.db_path = config.path_db
-        self._init_db()
+
+        # 연결이 없을 때만 최초 1회 연결 + 스키마 점검 (이후 BlogDB()는 비용 없음)
+        with BlogDB._lock:
+            if BlogDB._conn is None:
+                BlogDB._conn = self._connect()
+                self._init_db()
+
+    def _connect(self):
+        """장기 연결 생성 (WAL 모드 + 튜닝된 PRAGMA)"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=10,
+            check_same_thread=False,  # 스레드 간 공유 (동시 접근은 _lock으로 직렬화)
+            cached_statements=256     # 동일 SQL 문자열은 준비된 구문을 재사용
+        )
+        conn.execute("PRAGMA journal_mode=WAL")     # 읽기/쓰기 동시 진행, 커밋마다 전체 fsync 방지
+        conn.execute("PRAGMA synchronous=NORMAL")   # WAL에서는 NORMAL로도 데이터 안전성 유지
+        conn.execute("PRAGMA busy_timeout=5000")    # 외부 프로세스 잠금 시 즉시 실패 대신 대기
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-8000")     # 약 8MB 페이지 캐시
+        return conn
+
+    # 현재 가중치로 전체 점수 재산출 (가중치 변경/마이그레이션 시에만 사용)
+    _RESCORE_SQL = '''
+        UPDATE neighbor_stats SET score =
+            total_comments * (SELECT w_comment FROM ranking_weights WHERE id = 1) +
+            total_reply * (SELECT w_reply FROM ranking_weights WHERE id = 1) +
+            total_likes * (SELECT w_like FROM ranking_weights WHERE id = 1)
+    '''
+
+    # 특정 시점(:since) 이후 이벤트만으로 집계한 통계 (neighbor_stats와 같은 컬럼 구성)
+    _WINDOW_STATS_SQL = '''
+        SELECT n.nickname AS nickname,
+               SUM(e.act = 0) AS total_likes,
+               SUM(e.act = 1) AS total_comments,
+               SUM(e.act = 2) AS total_reply
+        FROM neighbor_events e JOIN neighbor_names n ON n.id = e.name_id
+        WHERE e.ts >= :since
+        GROUP BY e.name_id
+    '''
+
+    @contextmanager
+    def _transaction(self):
+        """공유 연결에서 잠금을 잡고 트랜잭션 수행 (예외 시 롤백)"""
+        with span("db.write", "db"), BlogDB._lock:
+            conn = BlogDB._conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _fetchone(self, sql, params=()):
+        with BlogDB._lock:
+            return BlogDB._conn.execute(sql, params).fetchone()
+
+    @classmethod
+    def close(cls):
+        """프로그램 종료 시 WAL 체크포인트 후 연결 종료"""
+        with cls._lock:
+            if cls._conn is None:
+                return
+            try:
+                cls._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                cls._conn.close()
+            except Exception as e:
+                print(f"⚠️ DB 종료 중 오류: {e}")
+            cls._conn = None
 
     def _init_db(self):
         """데이터베이스 및 테이블 초기화"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
-            
+
             # 1. 이웃 댓글 관리 테이블 (기존 유지)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS neighbor_comments (
@@ -50,103 +139,414 @@ class BlogDB:
                     total_reply INTEGER DEFAULT 0
                 )
             ''')
-            conn.commit()
+
+            # 4. 랭킹 엔진: 가중치 테이블 + 트리거로 유지되는 score 컬럼 (인덱스 정렬)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS ranking_weights (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    w_comment REAL NOT NULL,
+                    w_reply REAL NOT NULL,
+                    w_like REAL NOT NULL
+                )
+            ''')
+            cursor.execute("INSERT OR IGNORE INTO ranking_weights (id, w_comment, w_reply, w_like) VALUES (1, 10, 3, 1)")
+
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(neighbor_stats)")]
+            if 'score' not in columns:
+                # 기존 DB 마이그레이션: 컬럼 추가 후 현재 가중치로 1회 전체 산출
+                cursor.execute("ALTER TABLE neighbor_stats ADD COLUMN score REAL NOT NULL DEFAULT 0")
+                cursor.execute(self._RESCORE_SQL)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_neighbor_stats_score ON neighbor_stats(score DESC)")
+
+            # 5. 알림 이벤트 로그 (추가 전용). 닉네임은 정수 id로 인터닝하여 행 크기를 최소화
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS neighbor_names (
+                    id INTEGER PRIMARY KEY,
+                    nickname TEXT NOT NULL UNIQUE
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS neighbor_events (
+                    id INTEGER PRIMARY KEY,
+                    name_id INTEGER NOT NULL,
+                    act INTEGER NOT NULL,
+                    ts INTEGER NOT NULL,
+                    title_fp INTEGER
+                )
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_neighbor_events_ts ON neighbor_events(ts)")
+
+            # neighbor_stats는 이벤트 로그 도입 이전 누적분 위에 이벤트 1건마다 해당 카운터 +1 (로그만으로 재구성하지 않음)
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_neighbor_events_aggregate
+                AFTER INSERT ON neighbor_events
+                BEGIN
+                    INSERT INTO neighbor_stats (nickname, total_likes, total_comments, total_reply)
+                    VALUES (
+                        (SELECT nickname FROM neighbor_names WHERE id = NEW.name_id),
+                        NEW.act = 0, NEW.act = 1, NEW.act = 2
+                    )
+                    ON CONFLICT(nickname) DO UPDATE SET
+                        total_likes = total_likes + (NEW.act = 0),
+                        total_comments = total_comments + (NEW.act = 1),
+                        total_reply = total_reply + (NEW.act = 2);
+                END
+            ''')
+
+            # 신규 이웃: 누적값 전체로 점수 산출
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_neighbor_stats_score_insert
+                AFTER INSERT ON neighbor_stats
+                BEGIN
+                    UPDATE neighbor_stats SET score =
+                        NEW.total_comments * (SELECT w_comment FROM ranking_weights WHERE id = 1) +
+                        NEW.total_reply * (SELECT w_reply FROM ranking_weights WHERE id = 1) +
+                        NEW.total_likes * (SELECT w_like FROM ranking_weights WHERE id = 1)
+                    WHERE nickname = NEW.nickname;
+                END
+            ''')
+            # 기존 이웃: 증가분만 더함 (감쇠가 적용된 점수를 유지한 채 누적)
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS trg_neighbor_stats_score_update
+                AFTER UPDATE OF total_likes, total_comments, total_reply ON neighbor_stats
+                BEGIN
+                    UPDATE neighbor_stats SET score = score +
+                        (NEW.total_comments - OLD.total_comments) * (SELECT w_comment FROM ranking_weights WHERE id = 1) +
+                        (NEW.total_reply - OLD.total_reply) * (SELECT w_reply FROM ranking_weights WHERE id = 1) +
+                        (NEW.total_likes - OLD.total_likes) * (SELECT w_like FROM ranking_weights WHERE id = 1)
+                    WHERE nickname = NEW.nickname;
+                END
+            ''')
+
+            # 6. 실행 기록 (작업 1회 = 1행, RunJournal 백그라운드 스레드가 기록)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS run_log (
+                    id INTEGER PRIMARY KEY,
+                    task TEXT NOT NULL,
+                    started_at REAL NOT NULL,
+                    ended_at REAL,
+                    status TEXT NOT NULL DEFAULT 'running',
+                    pages INTEGER NOT NULL DEFAULT 0,
+                    likes INTEGER NOT NULL DEFAULT 0,
+                    comments INTEGER NOT NULL DEFAULT 0,
+                    neighbors INTEGER NOT NULL DEFAULT 0,
+                    errors INTEGER NOT NULL DEFAULT 0,
+                    error_causes TEXT,
+                    phase_times TEXT
+                )
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_run_log_started ON run_log(started_at)")
+
+            # 7. AI 댓글 캐시 (key: 모델/프롬프트/게시글 발췌의 sha256, 같은 글 재방문 시 API 재호출 방지)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS ai_comment_cache (
+                    key TEXT PRIMARY KEY,
+                    comment TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_ai_comment_cache_used ON ai_comment_cache(last_used)")
+
+            # 8. 브라우저 실행 기록 (실행 1회 = 1행, 프로필 크기/정리량/시작 시간 추이 확인용)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS browser_launches (
+                    id INTEGER PRIMARY KEY,
+                    launched_at REAL NOT NULL,
+                    profile_bytes INTEGER NOT NULL DEFAULT 0,
+                    pruned_bytes INTEGER,
+                    cold_start REAL,
+                    first_load REAL,
+                    lean INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
 
     def can_I_comment(self, blog_id, interval_days):
         """설정한 방문 주기(Days)가 지났는지 확인"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT last_comment_date FROM neighbor_comments WHERE blog_id = ?", (blog_id,))
-            row = cursor.fetchone()
-            
-            if not row or not row[0]:
-                return True
-            
-            last_date_obj = datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S').date()
-            days_passed = (datetime.now().date() - last_date_obj).days
-            return days_passed >= interval_days
+        row = self._fetchone("SELECT last_comment_date FROM neighbor_comments WHERE blog_id = ?", (blog_id,))
+
+        if not row or not row[0]:
+            return True
+
+        last_date_obj = datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S').date()
+        days_passed = (datetime.now().date() - last_date_obj).days
+        return days_passed >= interval_days
 
     def save_comment_success(self, blog_id, nickname):
         """댓글 작성 성공 시 DB 업데이트"""
         now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
+        with self._transaction() as conn:
+            conn.execute('''
                 INSERT INTO neighbor_comments (blog_id, nickname, last_comment_date, total_count)
                 VALUES (?, ?, ?, 1)
-                ON CONFLICT(blog_id) DO UPDATE SET 
-                    last_comment_date = ?, 
+                ON CONFLICT(blog_id) DO UPDATE SET
+                    last_comment_date = ?,
                     total_count = total_count + 1
             ''', (blog_id, nickname, now_str, now_str))
-            conn.commit()
+
+    def get_neighbor_policy(self, interval_days, since_ts=None):
+        """
+        [정책] 이웃별 통계와 댓글 쿨다운 만료일을 한 번에 조회
+        - rows: (nickname, 댓글, 답글, 공감)
+        - cooldowns: {blog_id: 쿨다운 만료일 'YYYY-MM-DD'} (만료일 당일부터 다시 댓글 가능)
+          닉네임은 바뀌거나 겹칠 수 있으므로 쿨다운은 blog_id 기록으로만 판단
+        - since_ts: 지정 시 누적 통계 대신 해당 시점 이후 이벤트 집계를 사용 (기간 랭킹)
+        """
+        offset = f"+{int(interval_days)} days"
+        source = "neighbor_stats" if since_ts is None else f"({self._WINDOW_STATS_SQL})"
+        with BlogDB._lock:
+            rows = BlogDB._conn.execute(f'''
+                SELECT s.nickname, s.total_comments, s.total_reply, s.total_likes
+                FROM {source} s
+            ''', {'since': since_ts}).fetchall()
+            cooldowns = dict(BlogDB._conn.execute('''
+                SELECT blog_id, date(last_comment_date, ?) FROM neighbor_comments
+                WHERE last_comment_date IS NOT NULL
+            ''', (offset,)).fetchall())
+        return rows, cooldowns
 
     def get_last_scan_time(self):
         """sync_checkpoints에서 마지막 스캔 시간을 가져옴"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM sync_checkpoints WHERE key = 'last_scan_time'")
-            row = cursor.fetchone()
-            if row and row[0]:
-                try:
-                    return datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S')
-                except:
-                    return datetime.min
-            return datetime.min # 기록 없으면 아주 옛날(최초 실행)
+        row = self._fetchone("SELECT value FROM sync_checkpoints WHERE key = 'last_scan_time'")
+        if row and row[0]:
+            try:
+                return datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S')
+            except Exception:
+                return datetime.min
+        return datetime.min # 기록 없으면 아주 옛날(최초 실행)
 
     def update_last_scan_time(self, dt_obj):
         """현재 스캔 시작 시간을 sync_checkpoints에 저장"""
         time_str = dt_obj.strftime('%Y-%m-%d %H:%M:%S')
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._transaction() as conn:
             # 기존 값이 있으면 업데이트, 없으면 삽입
-            cursor.execute('''
+            conn.execute('''
                 INSERT INTO sync_checkpoints (key, value) VALUES ('last_scan_time', ?)
                 ON CONFLICT(key) DO UPDATE SET value = ?
             ''', (time_str, time_str))
-            conn.commit()
 
-    def update_neighbor_stats_only(self, stats_map):
-        """수집된 통계를 DB에 누적 업데이트 (UPSERT)"""
-        if not stats_map: return
+    def get_scan_fingerprints(self):
+        """sync_checkpoints에서 이전 스캔의 최신 카드 지문 로드 -> [[지문, 날짜 서수], ...] (알림 목록 순서 그대로)"""
+        row = self._fetchone("SELECT value FROM sync_checkpoints WHERE key = 'scan_fingerprints'")
+        if row and row[0]:
+            try:
+                return [[int(fp), int(day)] for fp, day in json.loads(row[0])]
+            except (ValueError, TypeError):
+                return []
+        return []
+
+    def update_scan_fingerprints(self, marks):
+        """이번 스캔의 최신 카드 지문 [[지문, 날짜 서수], ...]을 sync_checkpoints에 저장"""
+        value = json.dumps(marks, separators=(',', ':'))
+        with self._transaction() as conn:
+            conn.execute('''
+                INSERT INTO sync_checkpoints (key, value) VALUES ('scan_fingerprints', ?)
+                ON CONFLICT(key) DO UPDATE SET value = ?
+            ''', (value, value))
+
+    def record_neighbor_events(self, events):
+        """
+        [이벤트] 알림 이벤트를 추가 전용 로그에 기록 (neighbor_stats/score는 트리거가 자동 반영)
+        - events: [(nickname, act 코드, 발생 시각 epoch 초, 제목 지문), ...]
+        """
+        if not events: return
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                for nick, counts in stats_map.items():
-                    likes = counts.get('like', 0)
-                    comments = counts.get('comment', 0)
-                    replies = counts.get('reply', 0)
-                    
-                    cursor.execute('''
-                        INSERT INTO neighbor_stats (nickname, total_likes, total_comments, total_reply)
-                        VALUES (?, ?, ?, ?)
-                        ON CONFLICT(nickname) DO UPDATE SET 
-                            total_likes = total_likes + ?,
-                            total_comments = total_comments + ?,
-                            total_reply = total_reply + ?
-                    ''', (nick, likes, comments, replies, likes, comments, replies))
-                conn.commit()
+            with self._transaction() as conn:
+                conn.executemany("INSERT OR IGNORE INTO neighbor_names (nickname) VALUES (?)",
+                                 {(e[0],) for e in events})
+                conn.executemany('''
+                    INSERT INTO neighbor_events (name_id, act, ts, title_fp)
+                    VALUES ((SELECT id FROM neighbor_names WHERE nickname = ?), ?, ?, ?)
+                ''', events)
         except Exception as e:
-            print(f"❌ [DB 에러] 통계 업데이트 실패: {e}")
+            print(f"❌ [DB 에러] 이벤트 기록 실패: {e}")
+
+    def get_window_rankings(self, since_ts, limit=-1):
+        """[이벤트] 특정 시점 이후 이벤트만으로 랭킹 산출 (브라우저 작업 없이 로컬 쿼리만 수행)"""
+        with BlogDB._lock:
+            return BlogDB._conn.execute(f'''
+                SELECT s.nickname, s.total_comments, s.total_reply, s.total_likes,
+                       s.total_comments * w.w_comment + s.total_reply * w.w_reply + s.total_likes * w.w_like AS score
+                FROM ({self._WINDOW_STATS_SQL}) s, ranking_weights w
+                WHERE w.id = 1
+                ORDER BY score DESC LIMIT :limit
+            ''', {'since': since_ts, 'limit': limit}).fetchall()
+
+    def set_ranking_weights(self, w_comment, w_reply, w_like):
+        """[랭킹] 가중치 반영. 값이 바뀐 경우에만 전체 점수를 1회 재산출하고 True 반환"""
+        weights = (float(w_comment), float(w_reply), float(w_like))
+        with self._transaction() as conn:
+            current = conn.execute("SELECT w_comment, w_reply, w_like FROM ranking_weights WHERE id = 1").fetchone()
+            if current and tuple(current) == weights:
+                return False
+            conn.execute("UPDATE ranking_weights SET w_comment = ?, w_reply = ?, w_like = ? WHERE id = 1", weights)
+            conn.execute(self._RESCORE_SQL)
+            conn.execute("DELETE FROM sync_checkpoints WHERE key = 'score_decay_at'")
+        return True
+
+    def apply_score_decay(self, half_life_days):
+        """
+        [랭킹] 시간 감쇠 적용 (반감기 기준). 마지막 감쇠 시점 이후 경과 시간만큼 전체 점수에 동일 배율을 곱함
+        - 지수 감쇠는 배율이 곱셈으로 누적되므로, 트리거로 더해진 증가분과도 일관되게 유지됨
+        """
+        if not half_life_days or half_life_days <= 0:
+            return
+        now = datetime.now()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT value FROM sync_checkpoints WHERE key = 'score_decay_at'").fetchone()
+            if row and row[0]:
+                try:
+                    last = datetime.strptime(row[0], '%Y-%m-%d %H:%M:%S')
+                    elapsed_days = max((now - last).total_seconds() / 86400, 0)
+                    if elapsed_days > 0:
+                        conn.execute("UPDATE neighbor_stats SET score = score * ?", (0.5 ** (elapsed_days / half_life_days),))
+                except ValueError:
+                    pass
+            now_str = now.strftime('%Y-%m-%d %H:%M:%S')
+            conn.execute('''
+                INSERT INTO sync_checkpoints (key, value) VALUES ('score_decay_at', ?)
+                ON CONFLICT(key) DO UPDATE SET value = ?
+            ''', (now_str, now_str))
+
+    def get_top_rankings(self, limit=-1):
+        """[랭킹] score 인덱스 순서 그대로 상위 N명 조회 (limit=-1이면 전체)"""
+        with BlogDB._lock:
+            return BlogDB._conn.execute('''
+                SELECT nickname, total_comments, total_reply, total_likes, score
+                FROM neighbor_stats ORDER BY score DESC LIMIT ?
+            ''', (limit,)).fetchall()
 
     def get_all_neighbor_stats(self):
         """랭킹 산정을 위한 통계 전체 조회"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM neighbor_stats")
+        with BlogDB._lock:
+            cursor = BlogDB._conn.execute("SELECT * FROM neighbor_stats")
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def insert_run(self, task, started_at):
+        """[실행 기록] 작업 시작 행 추가 후 id 반환"""
+        with self._transaction() as conn:
+            return conn.execute(
+                "INSERT INTO run_log (task, started_at) VALUES (?, ?)", (task, started_at)
+            ).lastrowid
+
+    def finish_run(self, run_id, summary):
+        """[실행 기록] 작업 종료 시 집계값 기록 (summary: run_log 컬럼명 -> 값)"""
+        with self._transaction() as conn:
+            conn.execute('''
+                UPDATE run_log SET ended_at = :ended_at, status = :status, pages = :pages,
+                    likes = :likes, comments = :comments, neighbors = :neighbors, errors = :errors,
+                    error_causes = :error_causes, phase_times = :phase_times
+                WHERE id = :id
+            ''', dict(summary, id=run_id))
+
+    def get_recent_runs(self, limit=10, task=None):
+        """[실행 기록] 최근 N회 실행 (started_at 인덱스 역순)"""
+        with BlogDB._lock:
+            cursor = BlogDB._conn.execute('''
+                SELECT * FROM run_log WHERE (:task IS NULL OR task = :task)
+                ORDER BY started_at DESC LIMIT :limit
+            ''', {'task': task, 'limit': limit})
+            columns = [desc[0] for desc in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        for row in rows:
+            row['error_causes'] = json.loads(row['error_causes'] or '{}')
+            row['phase_times'] = json.loads(row['phase_times'] or '{}')
+        return rows
+
+    def get_daily_run_totals(self, days=7):
+        """[실행 기록] 최근 N일 일자/작업별 합계 (일자, 작업, 실행수, 공감, 댓글, 이웃신청, 실패, 총 소요초)"""
+        with BlogDB._lock:
+            return BlogDB._conn.execute('''
+                SELECT date(started_at, 'unixepoch', 'localtime') AS day, task, COUNT(*),
+                       SUM(likes), SUM(comments), SUM(neighbors), SUM(errors),
+                       ROUND(SUM(COALESCE(ended_at, started_at) - started_at), 1)
+                FROM run_log
+                WHERE started_at >= CAST(strftime('%s', 'now', 'localtime', 'start of day', ?, 'utc') AS REAL)
+                GROUP BY day, task ORDER BY day DESC, task
+            ''', (f'-{max(int(days) - 1, 0)} days',)).fetchall()
+
+    def insert_browser_launch(self, launched_at, profile_bytes, pruned_bytes, cold_start, lean):
+        """[브라우저 실행 기록] 실행 1회 기록 후 id 반환 (pruned_bytes: 정리하지 않았으면 None)"""
+        with self._transaction() as conn:
+            return conn.execute('''
+                INSERT INTO browser_launches (launched_at, profile_bytes, pruned_bytes, cold_start, lean)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (launched_at, profile_bytes, pruned_bytes, cold_start, int(lean))).lastrowid
+
+    def set_browser_first_load(self, launch_id, seconds):
+        """[브라우저 실행 기록] 첫 페이지(로그인 확인) 로딩 시간 기록"""
+        with self._transaction() as conn:
+            conn.execute("UPDATE browser_launches SET first_load = ? WHERE id = ?", (seconds, launch_id))
+
+    def get_recent_launches(self, limit=10):
+        """[브라우저 실행 기록] 최근 N회 실행 (최신순)"""
+        with BlogDB._lock:
+            cursor = BlogDB._conn.execute(
+                "SELECT * FROM browser_launches ORDER BY launched_at DESC LIMIT ?", (limit,)
+            )
             columns = [desc[0] for desc in cursor.description]
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
+    def get_last_profile_maintenance(self):
+        """[브라우저 실행 기록] 마지막 프로필 정리 시각 (기록 없으면 0)"""
+        row = self._fetchone("SELECT MAX(launched_at) FROM browser_launches WHERE pruned_bytes IS NOT NULL")
+        return row[0] if row and row[0] else 0.0
+
+    def get_cached_comment(self, key, ttl_seconds):
+        """[AI 캐시] 유효기간 내 저장된 댓글 조회 (적중 시 사용 시각/횟수 갱신, 없으면 None)"""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT comment FROM ai_comment_cache WHERE key = ? AND created_at >= ?",
+                (key, now - ttl_seconds)
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE ai_comment_cache SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        return row[0] if row else None
+
+    def put_cached_comment(self, key, comment, ttl_seconds, max_entries):
+        """[AI 캐시] 생성된 댓글 저장 + 만료 항목 삭제 + 최근 사용순 max_entries개만 유지"""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute('''
+                INSERT INTO ai_comment_cache (key, comment, created_at, last_used) VALUES (?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET comment = excluded.comment,
+                    created_at = excluded.created_at, last_used = excluded.last_used
+            ''', (key, comment, now, now))
+            conn.execute("DELETE FROM ai_comment_cache WHERE created_at < ?", (now - ttl_seconds,))
+            conn.execute('''
+                DELETE FROM ai_comment_cache WHERE key IN (
+                    SELECT key FROM ai_comment_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+            ''', (max_entries,))
+
+    def get_comment_cache_size(self):
+        """[AI 캐시] 저장된 항목 수"""
+        return self._fetchone("SELECT COUNT(*) FROM ai_comment_cache")[0]
+
     def reset_smart_data(self):
         """[추가] 스마트 이웃 관리 데이터(중단점, 통계) 완전 초기화"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._transaction() as conn:
                 # 1. 스캔 시점 초기화
-                cursor.execute("DELETE FROM sync_checkpoints")
+                conn.execute("DELETE FROM sync_checkpoints")
                 # 2. 통계 데이터 초기화
-                cursor.execute("DELETE FROM neighbor_stats")
-                conn.commit()
+                conn.execute("DELETE FROM neighbor_stats")
+                # 3. 이벤트 로그 초기화
+                conn.execute("DELETE FROM neighbor_events")
+                conn.execute("DELETE FROM neighbor_names")
             return True
         except Exception as e:
             print(f"❌ DB 초기화 실패: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def backup_to(self, path):
+        """[기록/재생] 현재 DB를 다른 파일로 복사 (SQLite 온라인 백업, 작업 중에도 일관된 사본)"""
+        with BlogDB._lock:
+            dest = sqlite3.connect(path)
+            try:
+                BlogDB._conn.backup(dest)
+            finally:
+                dest.close()
@@ -0,0 +1,54 @@
+# system/bot_class/feed_snapshot.py
+import config
+
+# 피드 스냅샷 스크립트: 페이지의 모든 게시글 정보를 한 번에 추출
+# 텍스트/속성은 JSON으로, 실제 작업에 쓸 요소(item, like_btn)는 참조로 같이 반환 (추가 왕복 없음)
+FEED_SNAPSHOT_SCRIPT = """
+const [itemSel, nickSel, authorSel, postSel, likeSel] = arguments;
+return Array.from(document.querySelectorAll(itemSel)).map((item, index) => {
+    const nickEl = item.querySelector(nickSel);
+    const authorEl = item.querySelector(authorSel);
+    const postEl = item.querySelector(postSel);
+    const likeEl = item.querySelector(likeSel);
+    return {
+        index: index,
+        nickname: nickEl ? nickEl.innerText.trim() : '',
+        author_href: authorEl ? (authorEl.href || '') : '',
+        url: postEl ? (postEl.href || '') : '',
+        liked: likeEl ? likeEl.getAttribute('aria-pressed') === 'true' : false,
+        item: item,
+        like_btn: likeEl
+    };
+});
+"""
+
+def capture_feed_snapshot(driver):
+    """
+    BlogHome.naver 피드의 모든 게시글을 스크립트 1회 실행으로 수집
+    - 반환: [{index, nickname, blog_id, url, liked, item, like_btn}, ...]
+    - 계획 단계는 이 값만 사용하고, 실제 클릭할 때만 item/like_btn 요소를 사용
+    """
+    sel = config.SELECTORS
+    try:
+        raw_entries = driver.execute_script(
+            FEED_SNAPSHOT_SCRIPT,
+            sel["feed_item_inner"], sel["feed_nickname"], sel["feed_author_link"],
+            sel["feed_post_link"], sel["feed_like_buttons"]
+        ) or []
+    except Exception as e:
+        print(f"   (⚠️ 피드 스냅샷 수집 실패 : {e})")
+        return []
+
+    snapshot = []
+    for entry in raw_entries:
+        author_href = (entry.get('author_href') or '').rstrip('/')
+        snapshot.append({
+            'index': entry.get('index'),
+            'nickname': entry.get('nickname', ''),
+            'blog_id': author_href.split('/')[-1] if author_href else '',
+            'url': entry.get('url', ''),
+            'liked': bool(entry.get('liked')),
+            'item': entry.get('item'),
+            'like_btn': entry.get('like_btn'),
+        })
+    return snapshot
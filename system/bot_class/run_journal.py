@@ -0,0 +1,120 @@
+# system/bot_class/run_journal.py
+import json
+import time
+import queue
+import threading
+from contextlib import contextmanager, nullcontext
+
+from bot_class.db_manager import BlogDB
+from bot_events import LikeDone, CommentDone, NeighborRequested, PageScanned, Error
+
+class RunJournal:
+    """
+    작업 1회의 실행 기록 (시작/종료 시각, 방문 페이지, 작업 수, 원인별 실패, 단계별 소요 시간)
+    - 작업 스레드는 메모리 집계와 큐 적재만 하고, 디스크 기록은 백그라운드 스레드가 전담
+    """
+    # 클래스 변수로 기록 큐/스레드를 공유 (프로그램 전체에서 기록 스레드는 1개)
+    _queue = queue.Queue()
+    _writer = None
+    _writer_lock = threading.Lock()
+
+    def __init__(self, task):
+        self.task = task
+        self.started_at = time.time()
+        self.pages = 0
+        self.likes = 0
+        self.comments = 0
+        self.neighbors = 0
+        self.error_causes = {}
+        self.phase_times = {}
+        # 시작 행 id는 기록 스레드가 채움 (종료 기록도 같은 큐 순서로 처리되므로 항상 먼저 설정됨)
+        self._row = {'id': None}
+        self._submit(self._write_start, self.task, self.started_at, self._row)
+
+    # ---------- 작업 스레드 쪽 (메모리 집계만) ----------
+    def on_event(self, event):
+        """bot_events 이벤트를 집계에 반영"""
+        if isinstance(event, PageScanned):
+            self.pages += 1
+        elif isinstance(event, LikeDone):
+            self.likes += 1
+        elif isinstance(event, CommentDone):
+            self.comments += 1
+        elif isinstance(event, NeighborRequested):
+            self.neighbors += 1
+        elif isinstance(event, Error):
+            self.error_causes[event.cause] = self.error_causes.get(event.cause, 0) + 1
+
+    @contextmanager
+    def phase(self, name):
+        """단계 소요 시간 측정 (같은 이름은 누적)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + (time.perf_counter() - start)
+
+    def finish(self, status):
+        """작업 종료 기록 요청 (status: 'done' | 'cancelled' | 'error')"""
+        summary = {
+            'ended_at': time.time(),
+            'status': status,
+            'pages': self.pages,
+            'likes': self.likes,
+            'comments': self.comments,
+            'neighbors': self.neighbors,
+            'errors': sum(self.error_causes.values()),
+            'error_causes': json.dumps(self.error_causes, ensure_ascii=False),
+            'phase_times': json.dumps({k: round(v, 2) for k, v in self.phase_times.items()}, ensure_ascii=False),
+        }
+        self._submit(self._write_finish, self._row, summary)
+        return summary
+
+    # ---------- 기록 스레드 쪽 ----------
+    @staticmethod
+    def _write_start(task, started_at, row):
+        row['id'] = BlogDB().insert_run(task, started_at)
+
+    @staticmethod
+    def _write_finish(row, summary):
+        if row['id'] is not None:
+            BlogDB().finish_run(row['id'], summary)
+
+    @classmethod
+    def _submit(cls, func, *args):
+        cls._ensure_writer()
+        cls._queue.put((func, args))
+
+    @classmethod
+    def _ensure_writer(cls):
+        with cls._writer_lock:
+            if cls._writer is None or not cls._writer.is_alive():
+                cls._writer = threading.Thread(target=cls._writer_loop, name="RunJournalWriter", daemon=True)
+                cls._writer.start()
+
+    @classmethod
+    def _writer_loop(cls):
+        while True:
+            item = cls._queue.get()
+            if item is None:
+                break
+            func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"⚠️ 실행 기록 저장 실패: {e}")
+
+    @classmethod
+    def shutdown(cls, timeout=3.0):
+        """프로그램 종료 시 남은 기록을 모두 쓰고 기록 스레드 종료 (DB 연결 종료 전에 호출)"""
+        with cls._writer_lock:
+            writer = cls._writer
+            cls._writer = None
+        if writer is not None and writer.is_alive():
+            cls._queue.put(None)
+            writer.join(timeout)
+
+def journal_phase(worker, name):
+    """봇에서 단계 시간 측정 (GUI 없이 실행하거나 기록이 없으면 아무것도 하지 않음)"""
+    journal = getattr(worker, 'journal', None) if worker is not None else None
+    return journal.phase(name) if journal is not None else nullcontext()
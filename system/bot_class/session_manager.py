@@ -2,23 +2,75 @@
 import os
 import sys
 import time
+import threading
+from urllib.parse import urlparse
 import config
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.command import Command
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 from utils import smart_sleep
+from driver_profiler import DriverProfiler
+from driver_replay import CommandRecorder
+from lean_browsing import (is_lean_enabled, apply_lean_options, apply_lean_cdp, blocked_url_patterns,
+                           apply_meter_options, PageLoadMeter)
+from profile_maintenance import maintain_profile, print_launch_trend
+from browser_governor import terminate_browser
+from bot_class.db_manager import BlogDB
+
+# 로그인 상태 (GUI 상태 표시 값과 동일)
+STATE_DISCONNECTED = 0
+STATE_LOGGED_OUT = 1
+STATE_LOGGED_IN = 2
+
+# 브라우저/드라이버가 죽었을 때 나오는 오류 문구
+_DEAD_DRIVER_MESSAGES = ("chrome not reachable", "disconnected", "no such session", "session deleted")
 
 class NaverSessionManager:
-    def __init__(self):
+    def __init__(self, force_maintenance=False):
             
         self.profile_path = os.path.join(config.user_data_dir, "naver_profile")        
         
         # 폴더가 없으면 생성 (권한 문제 방지)
         if not os.path.exists(self.profile_path):
             os.makedirs(self.profile_path)
-            
-        self.driver = self._init_driver()
 
-    def _init_driver(self):
+        # [핵심] 로그인 상태는 캐시 값으로 유지하고, 바뀔 때만 구독자에게 알림
+        # (작업 중에는 봇이 이미 받은 응답으로만 갱신 -> 상태 확인용 WebDriver 호출 없음)
+        self.login_state = STATE_DISCONNECTED
+        self._state_listeners = []
+        self._state_lock = threading.Lock()
+        # 작업 시작과 유휴 하트비트 확인을 직렬화 (작업 중 하트비트가 드라이버를 건드리지 않도록)
+        self._heartbeat_lock = threading.Lock()
+        self.busy = False
+
+        self._launch(force_maintenance)
+
+    def _launch(self, force_maintenance=False, carry_from=None):
+        """프로필 점검 후 브라우저 실행 + 실행 기록 (carry_from: 재시작 전 드라이버, 진단 도구를 이어받음)"""
+        # [추가] 시작 전 프로필 점검 (캐시가 쌓이면 크롬 시작/첫 페이지 로딩이 느려짐)
+        try:
+            profile_bytes, pruned = maintain_profile(self.profile_path, force=force_maintenance)
+        except Exception as e:
+            print(f"⚠️ 프로필 점검 실패: {e}")
+            profile_bytes, pruned = 0, None
+
+        start = time.perf_counter()
+        self.driver = self._init_driver(carry_from)
+        self.cold_start = time.perf_counter() - start
+        self._observe_driver(self.driver)
+
+        # 실행마다 시작 시간 기록 (느려지는 추세 확인용, 첫 페이지 로딩 시간은 ensure_login에서 추가)
+        self.launch_id = None
+        try:
+            self.launch_id = BlogDB().insert_browser_launch(
+                time.time(), profile_bytes, pruned, self.cold_start, is_lean_enabled())
+            print_launch_trend(self.cold_start)
+        except Exception as e:
+            print(f"⚠️ 브라우저 실행 기록 실패: {e}")
+
+    def _init_driver(self, carry_from=None):
         options = Options()
         # 사용자 데이터 디렉토리 설정 (로그인 정보 저장소)
         options.add_argument(f"user-data-dir={self.profile_path}")
@@ -32,27 +84,176 @@ class NaverSessionManager:
         # 창 크기 최대화 (요소 가림 방지)
         options.add_argument("--window-size=1200,900")
 
+        # [추가] 가벼운 탐색: eager 로딩 + 이미지/광고 호스트 차단 (setup_browser.txt)
+        lean = is_lean_enabled()
+        if lean:
+            apply_lean_options(options)
+        # 페이지 로딩 측정: 전송량은 크롬 성능 로그(CDP Network 이벤트)로 집계
+        page_meter = getattr(carry_from, 'page_meter', None)
+        if page_meter is not None or config.BROWSER_CONFIG["options"]["페이지로딩측정"]:
+            apply_meter_options(options)
+
         driver = webdriver.Chrome(options=options)
         driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
             "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         })
+        # 미디어/폰트 차단은 탭 단위 -> 패턴을 드라이버에 고정해 두고 새 창으로 전환할 때마다 다시 적용 (child_window)
+        driver.blocked_urls = blocked_url_patterns() if lean else []
+        if lean:
+            apply_lean_cdp(driver)
+            print("🪶 가벼운 탐색이 켜져 있습니다. (이미지/미디어/폰트/광고 로딩 생략)")
+        # 브라우저 재시작이면 진행 중인 작업의 측정/계측을 새 드라이버로 옮겨 이어감
+        profiler = getattr(carry_from, 'profiler', None)
+        # [진단] 계측이 켜져 있으면 모든 WebDriver 명령을 단계별로 집계 (driver.profiler)
+        if profiler is not None:
+            profiler.rebind(driver)
+        elif config.PROFILE_DRIVER:
+            DriverProfiler(driver)
+            print("📊 WebDriver 명령 계측이 켜져 있습니다. (작업 종료 시 user_data/reports 에 저장)")
+        # [진단] 페이지 로딩 시간/전송량 측정 (driver.page_meter)
+        # [수정] 계측기 바깥, 기록기 연결 전에 감싸야 전송량 로그 조회가 GET 시간/기록 스트림에 섞이지 않음
+        if page_meter is not None:
+            page_meter.rebind(driver)
+        elif config.BROWSER_CONFIG["options"]["페이지로딩측정"]:
+            PageLoadMeter(driver)
+        # [진단] 기록이 켜져 있으면 작업별 명령/응답 스트림 저장 (driver.recorder)
+        if config.RECORD_RUNS:
+            CommandRecorder(driver)
+            print("📼 WebDriver 명령 기록이 켜져 있습니다. (작업 종료 시 user_data/reports 에 저장)")
         return driver
 
+    def restart_driver(self):
+        """
+        같은 프로필로 브라우저 재시작 (정상 종료 시 쿠키가 프로필에 저장되므로 로그인 유지)
+        - 반환: 재시작 후 로그인 상태 여부
+        """
+        old = self.driver
+        # 재시작을 넘는 기록은 재생할 수 없으므로 여기까지만 저장
+        recorder = getattr(old, 'recorder', None)
+        if recorder is not None:
+            recorder.end_run()
+        if self.driver_lost:
+            # 응답 없는 브라우저는 강제 종료 (남은 크롬 프로세스가 프로필을 잠그지 않도록)
+            terminate_browser(old)
+        else:
+            try:
+                old.quit()
+            except Exception:
+                terminate_browser(old)
+        self._launch(carry_from=old)
+        try:
+            start = time.perf_counter()
+            self.driver.get(config.NAVER_URLS["main"])
+            self._record_first_load(time.perf_counter() - start)
+        except Exception as e:
+            print(f"⚠️ 재시작 후 첫 페이지 로딩 실패: {e}")
+        return self.check_login_status()
+
+    # ---------- 로그인 상태 캐시 ----------
+    def add_state_listener(self, callback):
+        """상태가 바뀔 때만 callback(state) 호출 (호출 스레드는 상태를 바꾼 스레드)"""
+        self._state_listeners.append(callback)
+
+    def _set_login_state(self, state):
+        with self._state_lock:
+            if state == self.login_state:
+                return
+            self.login_state = state
+        for callback in list(self._state_listeners):
+            try:
+                callback(state)
+            except Exception as e:
+                print(f"⚠️ 로그인 상태 알림 실패: {e}")
+
+    @property
+    def driver_lost(self):
+        """브라우저/드라이버 연결 끊김 (관찰 훅이 세션 소멸/연결 오류를 감지한 상태)"""
+        return self.login_state == STATE_DISCONNECTED
+
+    def mark_logged_in(self):
+        """작업 성공(공감/댓글/신청) = 로그인 상태가 유효하다는 증거"""
+        self._set_login_state(STATE_LOGGED_IN)
+
+    @staticmethod
+    def _has_login_cookies(cookies):
+        names = {c.get('name') for c in cookies or []}
+        return 'NID_AUT' in names and 'NID_SES' in names
+
+    def _observe_driver(self, driver):
+        """
+        봇이 이미 주고받는 WebDriver 응답에서 상태를 갱신 (추가 호출 없음)
+        - 쿠키 조회 결과 -> 로그인 여부 / 현재 URL이 로그인 페이지 -> 로그아웃
+        - 세션 소멸/연결 끊김 오류 -> 연결 끊김
+        """
+        execute = driver.execute
+        login_host = urlparse(config.NAVER_URLS["login"]).netloc
+
+        def observed_execute(driver_command, params=None):
+            try:
+                response = execute(driver_command, params)
+            except (InvalidSessionIdException, Urllib3HTTPError, ConnectionError):
+                self._set_login_state(STATE_DISCONNECTED)
+                raise
+            except WebDriverException as e:
+                if any(m in str(e).lower() for m in _DEAD_DRIVER_MESSAGES):
+                    self._set_login_state(STATE_DISCONNECTED)
+                raise
+            if driver_command == Command.GET_ALL_COOKIES:
+                value = response.get('value') if response else None
+                self._set_login_state(STATE_LOGGED_IN if self._has_login_cookies(value) else STATE_LOGGED_OUT)
+            elif driver_command == Command.GET_CURRENT_URL:
+                value = (response.get('value') if response else None) or ""
+                if urlparse(value).netloc == login_host:
+                    self._set_login_state(STATE_LOGGED_OUT)
+            return response
+
+        driver.execute = observed_execute
+
     def check_login_status(self):
-        """쿠키를 통해 로그인 여부 확인"""
+        """쿠키를 통해 로그인 여부 확인 (결과는 관찰 훅이 캐시에 반영)"""
         try:
-            cookies = self.driver.get_cookies()
-            nid_aut = any(c.get('name') == 'NID_AUT' for c in cookies)
-            nid_ses = any(c.get('name') == 'NID_SES' for c in cookies)
-            return nid_aut and nid_ses
-        except:
+            return self._has_login_cookies(self.driver.get_cookies())
+        except Exception:
+            self._set_login_state(STATE_DISCONNECTED)
             return False
 
+    def heartbeat(self):
+        """유휴 상태일 때만 가벼운 쿠키 확인 (작업 중이면 드라이버를 건드리지 않고 캐시 값 반환)"""
+        if self.busy or not self._heartbeat_lock.acquire(blocking=False):
+            return self.login_state
+        try:
+            if not self.busy:
+                self.check_login_status()
+        finally:
+            self._heartbeat_lock.release()
+        return self.login_state
+
+    def begin_task(self):
+        """작업 시작 (진행 중인 하트비트 확인이 끝날 때까지 대기 후 하트비트 중지)"""
+        with self._heartbeat_lock:
+            self.busy = True
+
+    def end_task(self):
+        self.busy = False
+
+    def _record_first_load(self, seconds):
+        """실행 후 첫 페이지 로딩 시간 기록 (실행당 1회)"""
+        if self.launch_id is None:
+            return
+        launch_id, self.launch_id = self.launch_id, None
+        print(f"⏱️ 첫 페이지 로딩 {seconds:.1f}초")
+        try:
+            BlogDB().set_browser_first_load(launch_id, seconds)
+        except Exception as e:
+            print(f"⚠️ 브라우저 실행 기록 실패: {e}")
+
     def ensure_login(self):
         print("\n[시스템] 로그인 상태를 확인합니다...")
         try:
-            self.driver.get("https://www.naver.com")
-        except:
+            start = time.perf_counter()
+            self.driver.get(config.NAVER_URLS["main"])
+            self._record_first_load(time.perf_counter() - start)
+        except Exception:
             print("❌ 브라우저 연결 실패. 다시 실행해주세요.")
             return False
             
@@ -63,7 +264,7 @@ class NaverSessionManager:
             return True
         
         print("ℹ️ 로그인 정보가 없습니다. 로그인 페이지로 이동합니다.")
-        self.driver.get("https://nid.naver.com/nidlogin.login")
+        self.driver.get(config.NAVER_URLS["login"])
         
         print("\n" + "="*60)
         print(" [로그인 요청] 브라우저에서 로그인을 완료해주세요.")
@@ -0,0 +1,65 @@
+# system/bot_events.py
+# 봇 -> GUI 구조화 이벤트 (문자열 로그를 다시 파싱하지 않도록 Qt 시그널로 객체를 그대로 전달)
+from typing import NamedTuple
+
+class LikeDone(NamedTuple):
+    """공감 완료 (source: 'like' | 'add' | 'smart')"""
+    source: str
+    nickname: str = ""
+    done: int = 0
+    target: int = 0
+
+class CommentDone(NamedTuple):
+    """댓글 등록 완료 (mode: 'AI' | 'NORMAL')"""
+    source: str
+    mode: str
+    nickname: str = ""
+    message: str = ""
+    done: int = 0
+    target: int = 0
+
+class NeighborRequested(NamedTuple):
+    """서로이웃 신청 완료"""
+    nickname: str = ""
+    done: int = 0
+    target: int = 0
+
+class PageScanned(NamedTuple):
+    """목록/피드 페이지 스캔 완료"""
+    source: str
+    page: int
+    items: int
+
+class Error(NamedTuple):
+    """작업 실패 (cause: 실패 원인 코드, detail: 사람이 읽는 상세 내용)"""
+    source: str
+    cause: str
+    detail: str = ""
+
+def describe(event):
+    """이벤트를 사람이 읽는 로그 문장으로 변환 (로그창은 이 함수를 쓰는 구독자 중 하나)"""
+    if isinstance(event, LikeDone):
+        if event.source == "like":
+            return f" > [{event.done}/{event.target}] ❤️ 공감 완료"
+        if event.source == "smart":
+            return f"✅ [스마트관리] 공감 성공 ❤️ ({event.nickname})"
+        return "   > 👍 공감 완료"
+    if isinstance(event, CommentDone):
+        if event.source == "smart":
+            return (f"✅ [스마트관리] {'AI' if event.mode == 'AI' else '일반'}댓글 성공 ({event.nickname})\n"
+                    f"   💬 내용: {event.message}")
+        return "   > ✅ 댓글 등록 완료"
+    if isinstance(event, NeighborRequested):
+        return "   > 🎉 이웃 신청 완료!"
+    if isinstance(event, PageScanned):
+        return f" > [{event.page}페이지] 게시글 {event.items}개 발견"
+    if isinstance(event, Error):
+        return f"   ⚠️ [{event.cause}] {event.detail}" if event.detail else f"   ⚠️ [{event.cause}]"
+    return str(event)
+
+def emit_event(worker, event):
+    """작업 스레드에서 이벤트 발행 (GUI 없이 실행 중이면 로그 문장으로 출력)"""
+    if worker is not None:
+        worker.emit_event(event)
+    else:
+        print(describe(event))
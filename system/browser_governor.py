@@ -0,0 +1,241 @@
+# system/browser_governor.py
+# 장시간 작업용 브라우저 자원 관리 (설정: setup_browser.txt 의 RESOURCE_GOVERNOR)
+# - child_window: 게시글/팝업 창을 여는 구간에서 새로 생긴 창을 예외가 나도 모두 닫고 원래 창으로 복귀
+# - ResourceGovernor: 봇의 체크포인트(페이지 경계)마다 진행 위치 기록, child_window 가 정리하지 못한 창이 있을 때만 남은 창 정리,
+#   크롬 메모리(RSS)가 한도를 넘으면 같은 프로필로 브라우저를 재시작 (쿠키가 프로필에 있으므로 로그인 유지)
+import time
+from contextlib import contextmanager
+
+import config
+from lean_browsing import apply_lean_cdp
+
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+MB = 1024 * 1024
+
+def chrome_rss(driver):
+    """chromedriver 프로세스 하위(브라우저/렌더러/GPU) 전체 RSS 바이트 (측정 불가 시 None)"""
+    if not HAS_PSUTIL:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        total = 0
+        for proc in [root] + root.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return total
+    except (AttributeError, psutil.Error):
+        return None
+
+def terminate_browser(driver):
+    """응답 없는 브라우저 강제 종료 (psutil 이 없으면 chromedriver 만 종료)"""
+    service = getattr(driver, 'service', None)
+    if service is None:
+        return
+    if HAS_PSUTIL:
+        try:
+            root = psutil.Process(service.process.pid)
+            procs = root.children(recursive=True) + [root]
+            for proc in procs:
+                try:
+                    proc.kill()
+                except psutil.Error:
+                    pass
+            psutil.wait_procs(procs, timeout=5)
+        except (AttributeError, psutil.Error):
+            pass
+    try:
+        service.stop()
+    except Exception:
+        pass
+
+class _ChildWindows:
+    """child_window 구간 정보 (진입 시 창 / 진입 시점 창 목록)"""
+    def __init__(self, driver):
+        self.driver = driver
+        self.home = driver.current_window_handle
+        self.before = set(driver.window_handles)
+
+    def switch_to_new(self):
+        """구간에서 새로 열린 창으로 전환 (없으면 False) + 가벼운 탐색이면 새 탭에도 미디어/폰트 차단 적용"""
+        new = [h for h in self.driver.window_handles if h not in self.before]
+        if not new:
+            return False
+        self.driver.switch_to.window(new[-1])
+        apply_lean_cdp(self.driver)
+        return True
+
+@contextmanager
+def child_window(driver):
+    """
+    새 창을 여는 구간 (중첩 가능: 블로그 창 안에서 팝업 창)
+    - 종료 시 구간에서 새로 생긴 창을 모두 닫고 진입 시 창으로 복귀 (봇이 이미 닫은 창은 건너뜀)
+    - 브라우저가 죽어 정리가 불가능하면 원래 예외를 그대로 전달 (남은 창은 다음 체크포인트에서 정리)
+    """
+    windows = _ChildWindows(driver)
+    try:
+        yield windows
+    finally:
+        closed = 0
+        leaked = False
+        try:
+            for handle in driver.window_handles:
+                if handle not in windows.before:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                    closed += 1
+            driver.switch_to.window(windows.home)
+        except Exception as e:
+            leaked = True
+            print(f"   > [창 정리 실패] {e}")
+        governor = ResourceGovernor._active
+        if governor is not None:
+            governor.windows_closed += closed
+            governor.window_leak = governor.window_leak or leaked
+
+def close_stray_windows(driver, refocus=False):
+    """첫 번째 창만 남기고 모두 닫기 -> 닫은 창 수 (refocus: 창이 하나여도 첫 창으로 전환)"""
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    if refocus or len(handles) > 1:
+        driver.switch_to.window(handles[0])
+    return len(handles) - 1
+
+class ResourceGovernor:
+    """
+    작업 1회 동안 브라우저 자원 관리 (ActionWorker가 생성, 봇은 checkpoint()로만 사용)
+    - position: 마지막 체크포인트의 진행 위치 (재시작 후 이어갈 지점)
+    """
+    # 현재 작업 중인 관리자 (child_window 가 창 수를 보고하는 대상)
+    _active = None
+    _psutil_notice_shown = False
+
+    def __init__(self, session):
+        self.session = session
+        self.task = None
+        self.position = None
+        self.recycles = 0
+        self.recoveries = 0
+        self.completed = 0      # 작업 목표로 세는 성공 수 (복구 후 남은 목표 계산, ActionWorker가 갱신)
+        self.windows_closed = 0
+        self.stray_closed = 0
+        self.window_leak = False    # child_window 정리 실패 -> 다음 체크포인트에서 남은 창 정리
+        self.peak_rss = 0
+        self._last_check = 0.0
+        self._launched = 0.0
+
+    def begin_run(self, task):
+        self.task = task
+        self._last_check = self._launched = time.monotonic()
+        ResourceGovernor._active = self
+        settings = config.BROWSER_CONFIG["governor"]
+        if settings["메모리한도MB"] and not HAS_PSUTIL and not ResourceGovernor._psutil_notice_shown:
+            ResourceGovernor._psutil_notice_shown = True
+            print("ℹ️ psutil 이 설치되어 있지 않아 브라우저 메모리 한도 점검은 생략합니다. (pip install psutil)")
+
+    def end_run(self):
+        ResourceGovernor._active = None
+        if not (self.recycles or self.recoveries or self.stray_closed or self.peak_rss):
+            return
+        peak = f" | 최대 메모리 {self.peak_rss / MB:.0f}MB" if self.peak_rss else ""
+        print(f"\n🧰 [브라우저 자원] 게시글/팝업 창 {self.windows_closed}개 정리 | 남은 창 정리 {self.stray_closed}개 | "
+              f"재시작 {self.recycles}회 | 장애 복구 {self.recoveries}회{peak}")
+
+    @property
+    def driver_lost(self):
+        return self.session.driver_lost
+
+    def checkpoint(self, position):
+        """
+        봇의 안전 지점(다음 페이지 로딩 직전)에서 호출: 위치 기록 + 주기적으로 자원 점검
+        - 남은 창 정리는 child_window 가 정리 실패를 보고했을 때만 (평소에는 드라이버 명령을 보내지 않음 -> 녹화/재생 흐름 유지)
+        - 반환: 사용할 드라이버 (재시작했으면 새 드라이버)
+        """
+        self.position = dict(position)
+        driver = self.session.driver
+        if self.window_leak:
+            self.window_leak = False
+            self.stray_closed += close_stray_windows(driver, refocus=True)
+
+        now = time.monotonic()
+        if now - self._last_check < config.BROWSER_CONFIG["governor"]["점검간격"]:
+            return driver
+        self._last_check = now
+        reason = self._recycle_reason(driver, now)
+        if reason:
+            return self.recycle(reason)
+        return driver
+
+    def _recycle_reason(self, driver, now):
+        settings = config.BROWSER_CONFIG["governor"]
+        limit_mb = settings["메모리한도MB"]
+        if limit_mb:
+            rss = chrome_rss(driver)
+            if rss is not None:
+                self.peak_rss = max(self.peak_rss, rss)
+                if rss > limit_mb * MB:
+                    return f"크롬 메모리 {rss / MB:.0f}MB > 한도 {limit_mb}MB"
+        minutes = settings["재시작주기"]
+        if minutes and now - self._launched > minutes * 60:
+            return f"실행 {minutes}분 경과"
+        return None
+
+    def recycle(self, reason):
+        """같은 프로필로 브라우저 재시작 -> 새 드라이버 (재시작 후 로그인이 풀려 있으면 RuntimeError)"""
+        print(f"\n♻️ [브라우저 재시작] {reason} -> {self.position} 지점부터 이어갑니다.")
+        logged_in = self.session.restart_driver()
+        self.recycles += 1
+        self._launched = time.monotonic()
+        if not logged_in:
+            raise RuntimeError("브라우저 재시작 후 로그인 상태가 아닙니다. 다시 로그인 후 실행해주세요.")
+        return self.session.driver
+
+    def recover(self):
+        """
+        [복구] 작업 중 브라우저/드라이버가 죽었을 때 같은 프로필로 재시작 -> 이어갈 위치 (마지막 체크포인트)
+        - 연결 오류가 일시적이었으면(드라이버가 다시 응답) 재시작 없이 이어감
+        - 최대 복구 횟수를 넘었거나 재시작 후 로그인이 풀려 있으면 RuntimeError
+        """
+        limit = config.BROWSER_CONFIG["governor"]["최대복구횟수"]
+        if self.recoveries >= limit:
+            raise RuntimeError(f"브라우저 복구를 {limit}회 시도했지만 계속 연결이 끊어집니다. 작업을 종료합니다.")
+        self.recoveries += 1
+        where = f"{self.position['page']}페이지" if self.position else "처음 페이지"
+
+        self.session.check_login_status()
+        if not self.driver_lost:
+            print(f"\nℹ️ [브라우저 복구] 브라우저가 다시 응답합니다. 재시작 없이 {where}부터 이어갑니다.")
+            return self.position
+
+        print(f"\n💥 [브라우저 복구 {self.recoveries}/{limit}] 같은 프로필로 브라우저를 다시 실행하고 {where}부터 이어갑니다.")
+        try:
+            logged_in = self.session.restart_driver()
+        except Exception as e:
+            raise RuntimeError(f"브라우저를 다시 실행하지 못했습니다. ({e})")
+        self._launched = time.monotonic()
+        if not logged_in:
+            raise RuntimeError("브라우저 복구 후 로그인 상태가 아닙니다. 다시 로그인 후 실행해주세요.")
+        return self.position
+
+def checkpoint(bot, **position):
+    """
+    봇에서 호출하는 체크포인트 (GUI 작업이 아니면 아무것도 하지 않음)
+    - 브라우저가 재시작되면 bot.driver / bot.wait 를 새 드라이버로 교체하고 True 반환
+    """
+    governor = getattr(getattr(bot, 'worker', None), 'governor', None)
+    if governor is None:
+        return False
+    driver = governor.checkpoint(position)
+    if driver is bot.driver:
+        return False
+    bot.driver = driver
+    bot.wait.rebind(driver)
+    return True
@@ -1,5 +1,7 @@
 import os
 import sys
+import ast
+import threading
 
 # 1. 실행 환경에 따른 루트 경로 결정
 if getattr(sys, 'frozen', False):
@@ -15,6 +17,7 @@ else:
 user_data_dir = os.path.join(base_path, 'user_data')
 settings_dir = os.path.join(user_data_dir, 'settings')
 profile_dir = os.path.join(user_data_dir, 'naver_profile')
+reports_dir = os.path.join(user_data_dir, 'reports')     # 진단 리포트 (WebDriver 계측 등)
 
 # 폴더 자동 생성
 os.makedirs(settings_dir, exist_ok=True)
@@ -28,19 +31,122 @@ path_neighbor_msg = os.path.join(settings_dir, 'setup_add_neighbor_messages.txt'
 path_comment_msg = os.path.join(settings_dir, 'setup_add_neighbor_comments.txt')
 path_gemini_setup = os.path.join(settings_dir, 'setup_gemini.txt')
 path_smart_neighbor_management_setup = os.path.join(settings_dir, "setup_smart_neighbor_management.txt")
+path_browser_setup = os.path.join(settings_dir, 'setup_browser.txt')
 
-def load_settings(file_path):
-    settings = {}
-    if os.path.exists(file_path):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                exec(f.read(), {}, settings)
-        except Exception as e:
-            print(f"⚠️ 로드 실패: {e}")
-    return settings
+# 4. 설정 스키마: 파일 -> {변수명: 기본값}
+# 파일에 없는 키는 기본값으로 채워지므로 봇 코드는 .get(키, 기본값) 없이 바로 인덱싱한다.
+# 기본값의 타입이 곧 검증 규칙 (튜플=(최소, 최대) 숫자 범위, 숫자, bool, 문자열, 문자열 리스트)
+LIKE_SETTINGS_SCHEMA = {
+    "LIKE_NEIGHBORS_DELAYS": {
+        '페이지로딩': (1.0, 2.5),
+        '클릭전대기': (0.1, 0.3),
+        '작업간대기': (0.2, 0.5),
+        '확인대기': (0.3, 0.5),
+        '페이지이동': (1.0, 2.5),
+        '재시도대기': (0.5, 1.0),
+        '클릭랜덤화': 2,
+    },
+    "LIKE_NEIGHBORS_CONDITIONS": {
+        '최대실패횟수': 5,
+    },
+}
 
-def load_gemini_settings(file_path):
-    default_prompt = """당신은 블로그에서 활발하게 소통하는 2030 이웃입니다. 
+ADD_SETTINGS_SCHEMA = {
+    "ADD_NEIGHBORS_DELAYS": {
+        '목록페이지로딩': (1.0, 2.5),
+        '팝업창대기': (1.0, 2.0),
+        '팝업초기대기': (0.2, 0.5),
+        '팝업작업대기': (0.2, 0.5),
+        '메시지창전환대기': (1.5, 2.0),
+        '메시지입력후대기': (0.2, 0.5),
+        '전송후대기': (1.0, 2.0),
+        '블로그간대기': (0.2, 0.5),
+        '스크롤최대비율': 0.5,
+        '스크롤대기': (0.5, 1.0),
+        '댓글창대기': (1.5, 2.0),
+        '재시도대기': (0.5, 1.0),
+        '클릭랜덤화': 3,
+    },
+    "ADD_NEIGHBORS_CONDITIONS": {
+        '최대공감수제한': 100,
+        '최대댓글수제한': 10,
+        '최대실패횟수': 10,
+    },
+}
+
+SMART_SETTINGS_SCHEMA = {
+    "SMART_MANAGEMENT_DELAYS": {
+        '페이지로딩': (2.0, 3.5),
+        '스크롤간격': (0.2, 0.3),
+        '블로그_접속_대기': (2.0, 3.0),
+        '프레임_전환_대기': (0.5, 1.0),
+        '중복_체크_대기': (0.1, 0.3),
+        '입력창_찾기_대기': (0.5, 0.8),
+        '입력창_클릭_대기': (0.2, 0.4),
+        '타이핑_후_대기': (0.2, 0.3),
+        '등록_완료_대기': (0.2, 0.5),
+    },
+    "SMART_MANAGEMENT_CONDITIONS": {
+        '스크롤보폭': 700,
+        '데이터수집스크롤간격': (0.2, 0.3),
+        '댓글목표': 30,
+        '시작페이지': 1,
+        '댓글주기': 7,
+        '랭킹기간': 0,     # 일 단위, 0이면 전체 누적 통계로 랭킹 산출
+        '알림갱신주기': 30, # 분 단위, 마지막 알림 수집 후 이 시간 이내면 1단계 생략 (0이면 매번 수집)
+        '페이지간알림갱신': False, # True면 답방 중 알림갱신주기가 지나면 페이지 사이에 증분 수집
+        'AI캐시유효시간': 72,    # 시간 단위, 같은 글에 대해 생성한 AI 댓글을 재사용하는 기간 (0이면 캐시 미사용)
+        'AI캐시최대개수': 500,   # 캐시 보관 최대 개수 (초과 시 오래 사용하지 않은 순으로 삭제)
+        'AI백엔드': 'gemini',   # gemini | template(네트워크 없이 제목 템플릿) | http(로컬 테스트 서버)
+        'AI응답제한시간': 8,     # 초 단위, 게시글당 AI 응답 최대 대기 시간
+        'AI느린응답기준': 5,     # 초 단위, 이보다 오래 걸린 응답은 실패와 같이 집계
+        'AI차단기준횟수': 3,     # 연속 실패/지연 횟수가 이 값에 도달하면 AI 호출 차단
+        'AI차단시간': 300,       # 초 단위, 차단 동안은 댓글 목록(COMMENT_MESSAGES) 사용
+        'AI테스트서버주소': 'http://127.0.0.1:8766/generate', # bench/fixture_server.py 기본 주소
+    },
+    "SMART_MANAGEMENT_WEIGHTS": {
+        '댓글점수': 10,
+        '답글점수': 3,
+        '공감점수': 1,
+        '점수반감기': 0,   # 일 단위, 0이면 시간 감쇠 없음
+    },
+}
+
+# 브라우저 옵션 (브라우저를 새로 연결할 때 적용)
+BROWSER_SETTINGS_SCHEMA = {
+    "BROWSER_OPTIONS": {
+        '가벼운탐색': False,      # True면 DOM만 준비되면 진행(eager) + 아래 항목 차단
+        '이미지차단': True,
+        '미디어차단': True,       # 동영상/음원 파일
+        '폰트차단': True,
+        '광고차단': True,         # BLOCKED_HOSTS 의 광고/통계 호스트
+        '페이지로딩측정': False,  # True면 페이지 이동마다 소요 시간/전송량 집계 (작업 종료 시 출력)
+    },
+    "PROFILE_MAINTENANCE": {
+        '자동정리': True,         # 브라우저 시작 전 캐시 정리 (쿠키/로그인 정보는 유지)
+        '정리기준MB': 300,        # 캐시가 이 크기를 넘으면 정리
+        '정리주기': 7,            # 일 단위, 마지막 정리 후 이 기간이 지나면 크기와 관계없이 정리
+    },
+    "RESOURCE_GOVERNOR": {
+        '메모리한도MB': 2500,     # 크롬 전체 메모리가 넘으면 페이지 사이에서 브라우저 재시작 (0이면 끔, psutil 필요)
+        '점검간격': 60,           # 초 단위, 메모리 점검 주기
+        '재시작주기': 0,          # 분 단위, 0보다 크면 메모리와 관계없이 이 간격마다 재시작
+        '최대복구횟수': 3,        # 작업 1회 동안 브라우저가 죽었을 때 자동으로 다시 실행하는 최대 횟수
+    },
+    "BLOCKED_HOSTS": [
+        "veta.naver.com", "*.veta.naver.com", "tivan.naver.com", "lcs.naver.com",
+        "*.doubleclick.net", "*.googlesyndication.com", "*.google-analytics.com",
+        "*.googletagmanager.com", "adservice.google.com",
+    ],
+}
+
+NEIGHBOR_MSG_SCHEMA = {"NEIGHBOR_MESSAGES": []}
+COMMENT_MSG_SCHEMA = {"COMMENT_MESSAGES": []}
+
+# 예전 파일에 남아 있는 오타 키 -> 정식 키
+SETTING_KEY_ALIASES = {'답글접수': '답글점수'}
+
+DEFAULT_GEMINI_PROMPT = """당신은 블로그에서 활발하게 소통하는 2030 이웃입니다. 
 영혼이 없거나 반말하지 않으며, 친절하고 다정한 말투로 댓글을 작성하세요.
 
 [작성 규칙]
@@ -50,106 +156,288 @@ def load_gemini_settings(file_path):
 4. 분석적인 말투는 금지하며, 이웃과 대화하듯 자연스럽게 작성할 것.
 5. 이모지는 제외하고, 채팅 이모티콘(ㅎㅎ, ^^, :), ㅠㅠ]"""
 
-    default_settings = {
-        "GEMINI_API_KEY": "",
-        "GEMINI_PROMPT": default_prompt
-    }
+GEMINI_SETTINGS_SCHEMA = {
+    "GEMINI_API_KEY": "",
+    "GEMINI_PROMPT": DEFAULT_GEMINI_PROMPT,
+}
+
+SETTINGS_SCHEMAS = {
+    path_like_setup: LIKE_SETTINGS_SCHEMA,
+    path_add_setup: ADD_SETTINGS_SCHEMA,
+    path_neighbor_msg: NEIGHBOR_MSG_SCHEMA,
+    path_comment_msg: COMMENT_MSG_SCHEMA,
+    path_gemini_setup: GEMINI_SETTINGS_SCHEMA,
+    path_smart_neighbor_management_setup: SMART_SETTINGS_SCHEMA,
+    path_browser_setup: BROWSER_SETTINGS_SCHEMA,
+}
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _coerce_setting(value, default):
+    """기본값의 타입 기준으로 값 검증/정규화 (맞지 않으면 ValueError)"""
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+    elif isinstance(default, tuple):
+        if isinstance(value, (tuple, list)) and len(value) == 2 and all(_is_number(v) for v in value):
+            low, high = sorted((float(value[0]), float(value[1])))
+            return (low, high)
+    elif _is_number(default):
+        if _is_number(value):
+            return value
+    elif isinstance(default, str):
+        if isinstance(value, str):
+            return value
+    elif isinstance(default, list):
+        if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+            return list(value)
+    raise ValueError(value)
+
+def _validate_setting(file_path, name, value, default):
+    """변수 1개 검증: dict는 기본값 위에 병합 (스키마 밖 키는 그대로 보존)"""
+    label = f"{os.path.basename(file_path)} {name}"
+    if value is None:
+        return dict(default) if isinstance(default, dict) else default
+    if isinstance(default, dict):
+        if not isinstance(value, dict):
+            print(f"⚠️ 설정 형식 오류: {label} 은(는) {{...}} 형태여야 합니다. 기본값을 사용합니다.")
+            return dict(default)
+        merged = dict(default)
+        for key, item in value.items():
+            key = SETTING_KEY_ALIASES.get(key, key)
+            if key not in default:
+                merged[key] = item
+                continue
+            try:
+                merged[key] = _coerce_setting(item, default[key])
+            except ValueError:
+                print(f"⚠️ 설정 값 오류: {label}['{key}'] = {item!r} -> {default[key]!r} 사용")
+        return merged
+    try:
+        return _coerce_setting(value, default)
+    except ValueError:
+        print(f"⚠️ 설정 값 오류: {label} = {value!r} -> 기본값 사용")
+        return default
+
+def parse_settings_text(source):
+    """
+    설정 파일 내용 해석: `이름 = 리터럴` 형태의 대입문만 허용 (코드는 실행하지 않음)
+    - 주석/빈 줄은 무시, 함수 호출 등 리터럴이 아닌 값은 ValueError
+    """
+    values = {}
+    for node in ast.parse(source).body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)):
+            raise ValueError(f"{node.lineno}번째 줄: '이름 = 값' 형태만 사용할 수 있습니다.")
+        values[node.targets[0].id] = ast.literal_eval(node.value)
+    return values
+
+def parse_setting_input(text):
+    """GUI 입력칸 문자열 -> 값 (숫자/튜플 등 리터럴이면 변환, 아니면 문자열 그대로)"""
+    text = text.strip()
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+def format_settings_text(values):
+    """설정 값 -> 파일 내용 (parse_settings_text로 다시 읽을 수 있는 리터럴 대입문)"""
+    blocks = []
+    for name, value in values.items():
+        if isinstance(value, dict):
+            lines = [f"{name} = {{"] + [f"    {k!r}: {v!r}," for k, v in value.items()] + ["}"]
+        elif isinstance(value, list):
+            lines = [f"{name} = ["] + [f"    {v!r}," for v in value] + ["]"]
+        else:
+            lines = [f"{name} = {value!r}"]
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+class ConfigStore:
+    """
+    설정 파일 캐시
+    - 파일 수정 시각(mtime)이 바뀐 파일만 다시 읽고 검증 (그 외에는 stat 1회)
+    - 저장은 같은 폴더의 임시 파일에 쓴 뒤 os.replace로 교체 (중간에 끊겨도 기존 파일 유지)
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._cache = {}  # path -> (mtime_ns, 검증된 값 dict)
 
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def is_stale(self, path):
+        """캐시가 없거나 파일이 바뀌었는지 (읽지는 않음)"""
+        with self._lock:
+            cached = self._cache.get(path)
+            return cached is None or cached[0] != self._mtime(path)
+
+    def load(self, path):
+        """(값 dict, 이번 호출에서 새로 읽었는지) 반환. 값 dict는 공유되므로 수정하지 말 것"""
+        schema = SETTINGS_SCHEMAS.get(path, {})
+        with self._lock:
+            mtime = self._mtime(path)
+            cached = self._cache.get(path)
+            if cached and cached[0] == mtime:
+                return cached[1], False
+
+            raw = {}
+            if mtime is not None:
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        raw = parse_settings_text(f.read())
+                except Exception as e:
+                    print(f"⚠️ 설정 파일 로드 실패 ({os.path.basename(path)}): {e}")
+                    if cached:
+                        # 편집 중 깨진 파일: 마지막 정상값 유지 (같은 내용으로 경고 반복 방지)
+                        self._cache[path] = (mtime, cached[1])
+                        return cached[1], False
+
+            values = {name: _validate_setting(path, name, raw.get(name), default) for name, default in schema.items()}
+            for name, value in raw.items():
+                values.setdefault(name, value)
+            self._cache[path] = (mtime, values)
+            return values, True
+
+    def save(self, path, updates):
+        """변수 단위 병합 후 검증하여 원자적으로 저장 (dict 변수는 키 단위로 병합)"""
+        schema = SETTINGS_SCHEMAS.get(path, {})
+        with self._lock:
+            current, _ = self.load(path)
+            merged = dict(current)
+            for name, value in updates.items():
+                if name in schema:
+                    # 잘못된 입력은 기본값이 아니라 현재 저장된 값을 유지
+                    merged[name] = _validate_setting(path, name, value, merged[name])
+                else:
+                    merged[name] = value
+
+            tmp_path = f"{path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(format_settings_text(merged))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except Exception as e:
+                print(f"❌ 저장 실패 ({os.path.basename(path)}): {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return False
+            self._cache[path] = (self._mtime(path), merged)
+            return True
+
+_store = ConfigStore()
+
+def load_settings(file_path):
+    """설정 파일의 검증된 값 (캐시 사용)"""
+    return _store.load(file_path)[0]
+
+def load_gemini_settings(file_path):
     # 1. 파일이 없으면 생성 (USE_GEMINI는 파일에 쓰지 않음)
     if not os.path.exists(file_path):
         try:
             # 사용자가 수정하기 편하게 포맷팅하여 저장
-            content = f"GEMINI_API_KEY = '  '\n\nGEMINI_PROMPT = \"\"\"{default_prompt}\"\"\"\n"
+            content = f"GEMINI_API_KEY = '  '\n\nGEMINI_PROMPT = \"\"\"{DEFAULT_GEMINI_PROMPT}\"\"\"\n"
             with open(file_path, 'w', encoding='utf-8') as f: 
                 f.write(content)
         except Exception as e:
             print(f"⚠️ 설정 파일 생성 실패: {e}")
             # 파일 생성 실패 시 기본값에 USE_GEMINI False 주입 후 반환
-            default_settings["USE_GEMINI"] = False
-            return default_settings
+            return dict(GEMINI_SETTINGS_SCHEMA, USE_GEMINI=False)
     
-    # 2. 파일 읽기 (사용자가 수정한 값을 가져옴)
-    loaded = {}
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f: 
-            exec(f.read(), {}, loaded)
-    except Exception as e: 
-        print(f"⚠️ 설정 파일 로드 실패: {e}")
-        default_settings["USE_GEMINI"] = False
-        return default_settings
-    
-    # 로드된 값 업데이트
-    default_settings.update(loaded)
-
-    # 3. [핵심] 메모리 변수 설정: 키와 프롬프트가 둘 다 있어야 True
-    api_key = default_settings.get("GEMINI_API_KEY", "").strip()
-    prompt = default_settings.get("GEMINI_PROMPT", "").strip()
+    # 2. 파일 읽기 (사용자가 수정한 값을 가져옴, 변경이 없으면 캐시)
+    settings = dict(load_settings(file_path))
 
-    if api_key and prompt:
-        default_settings["USE_GEMINI"] = True
-    else:
-        default_settings["USE_GEMINI"] = False
-
-    return default_settings
+    # 3. [핵심] 메모리 변수 설정: 키와 프롬프트가 둘 다 있어야 True (키가 필요 없는 로컬 백엔드는 프롬프트만)
+    api_key = settings["GEMINI_API_KEY"].strip()
+    prompt = settings["GEMINI_PROMPT"].strip()
+    backend = load_settings(path_smart_neighbor_management_setup)["SMART_MANAGEMENT_CONDITIONS"]["AI백엔드"]
+    settings["USE_GEMINI"] = bool(prompt and (api_key or backend in ("template", "http")))
+    return settings
 
 # 설정 변수 초기화
 LIKES_NEIGHBOR_CONFIG = {"delays": {}, "conditions": {}}
 ADD_NEIGHBOR_CONFIG = {"delays": {}, "conditions": {}, "messages": [], "comments": []}
 
 GEMINI_CONFIG = {}
-SMART_NEIGHBOR_CONFIG = {"delays": {}, "conditions": {}, "weights": {}}
+SMART_NEIGHBOR_CONFIG = {"delays": {}, "conditions": {}, "weights": {}, "messages": []}
+BROWSER_CONFIG = {"options": {}, "maintenance": {}, "governor": {}, "blocked_hosts": []}
 
 # [핵심] gui_main에서 호출할 설정 동기화 함수
 def sync_all_configs():
-    global LIKES_NEIGHBOR_CONFIG, ADD_NEIGHBOR_CONFIG, GEMINI_CONFIG, SMART_NEIGHBOR_CONFIG
-    
-    like_raw = load_settings(path_like_setup)
-    add_raw = load_settings(path_add_setup)
+    """
+    변경된 설정 파일만 다시 읽어 메모리 설정에 반영 (바뀐 파일이 없으면 stat만 수행)
+    - 반환: 다시 읽은 파일 경로 리스트
+    """
+    loaded = {path: _store.load(path) for path in SETTINGS_SCHEMAS if path != path_gemini_setup}
+    changed = [path for path, (_, is_new) in loaded.items() if is_new]
 
-    neighbor_msg_data = load_settings(path_neighbor_msg)
-    comment_msg_data = load_settings(path_comment_msg)
-    GEMINI_CONFIG = load_gemini_settings(path_gemini_setup)
-    smart_neighbor_management_raw = load_settings(path_smart_neighbor_management_setup)
+    like_raw = loaded[path_like_setup][0]
+    add_raw = loaded[path_add_setup][0]
+    neighbor_msg_data = loaded[path_neighbor_msg][0]
+    comment_msg_data = loaded[path_comment_msg][0]
+    smart_neighbor_management_raw = loaded[path_smart_neighbor_management_setup][0]
+    browser_raw = loaded[path_browser_setup][0]
 
-    LIKES_NEIGHBOR_CONFIG["delays"] = like_raw.get("LIKE_NEIGHBORS_DELAYS", {})
-    LIKES_NEIGHBOR_CONFIG["conditions"] = like_raw.get("LIKE_NEIGHBORS_CONDITIONS", {})
+    # Gemini: 파일이 바뀐 경우에만 갱신 (사용자가 GUI에서 끈 USE_GEMINI 상태 유지)
+    if not GEMINI_CONFIG or _store.is_stale(path_gemini_setup):
+        GEMINI_CONFIG.clear()
+        GEMINI_CONFIG.update(load_gemini_settings(path_gemini_setup))
+        changed.append(path_gemini_setup)
+
+    # 메모리 설정은 복사본으로 교체 (GUI가 값을 바꿔도 캐시는 오염되지 않음)
+    LIKES_NEIGHBOR_CONFIG["delays"] = dict(like_raw["LIKE_NEIGHBORS_DELAYS"])
+    LIKES_NEIGHBOR_CONFIG["conditions"] = dict(like_raw["LIKE_NEIGHBORS_CONDITIONS"])
     
-    ADD_NEIGHBOR_CONFIG["delays"] = add_raw.get("ADD_NEIGHBORS_DELAYS", {})
-    ADD_NEIGHBOR_CONFIG["conditions"] = add_raw.get("ADD_NEIGHBORS_CONDITIONS", {})
-    ADD_NEIGHBOR_CONFIG["messages"] = neighbor_msg_data.get("NEIGHBOR_MESSAGES", [])
-    ADD_NEIGHBOR_CONFIG["comments"] = comment_msg_data.get("COMMENT_MESSAGES", [])
+    ADD_NEIGHBOR_CONFIG["delays"] = dict(add_raw["ADD_NEIGHBORS_DELAYS"])
+    ADD_NEIGHBOR_CONFIG["conditions"] = dict(add_raw["ADD_NEIGHBORS_CONDITIONS"])
+    ADD_NEIGHBOR_CONFIG["messages"] = list(neighbor_msg_data["NEIGHBOR_MESSAGES"])
+    ADD_NEIGHBOR_CONFIG["comments"] = list(comment_msg_data["COMMENT_MESSAGES"])
     
-    SMART_NEIGHBOR_CONFIG["delays"] = smart_neighbor_management_raw.get("SMART_MANAGEMENT_DELAYS", {
-        '페이지로딩': (2.0, 3.5),
-        '스크롤간격': (0.2, 0.3),
-        '블로그_접속_대기': (2.0, 3.0),
-        '프레임_전환_대기': (0.5, 1.0),
-        '중복_체크_대기': (0.1, 0.3),
-        '입력창_찾기_대기': (0.5, 0.8),
-        '입력창_클릭_대기': (0.2, 0.4),
-        '타이핑_후_대기': (0.2, 0.3),
-        '등록_완료_대기': (0.2, 0.5),
-    })
-    SMART_NEIGHBOR_CONFIG["conditions"] = smart_neighbor_management_raw.get("SMART_MANAGEMENT_CONDITIONS", {
-        '스크롤보폭': 700,
-        '데이터수집스크롤간격': (0.2, 0.3),
-        '댓글목표': 30,    
-        '시작페이지': 1,
-        '댓글주기': 7,
-    })
-    
-    SMART_NEIGHBOR_CONFIG["weights"] = smart_neighbor_management_raw.get("SMART_MANAGEMENT_WEIGHTS", {
-        '댓글점수': 10,
-        '답글접수': 3,
-        '공감점수': 1
-    })
-    SMART_NEIGHBOR_CONFIG["messages"] = comment_msg_data.get("COMMENT_MESSAGES", [])
+    SMART_NEIGHBOR_CONFIG["delays"] = dict(smart_neighbor_management_raw["SMART_MANAGEMENT_DELAYS"])
+    SMART_NEIGHBOR_CONFIG["conditions"] = dict(smart_neighbor_management_raw["SMART_MANAGEMENT_CONDITIONS"])
+    SMART_NEIGHBOR_CONFIG["weights"] = dict(smart_neighbor_management_raw["SMART_MANAGEMENT_WEIGHTS"])
+    SMART_NEIGHBOR_CONFIG["messages"] = list(comment_msg_data["COMMENT_MESSAGES"])
+
+    BROWSER_CONFIG["options"] = dict(browser_raw["BROWSER_OPTIONS"])
+    BROWSER_CONFIG["maintenance"] = dict(browser_raw["PROFILE_MAINTENANCE"])
+    BROWSER_CONFIG["governor"] = dict(browser_raw["RESOURCE_GOVERNOR"])
+    BROWSER_CONFIG["blocked_hosts"] = list(browser_raw["BLOCKED_HOSTS"])
+    return changed
+
+def save_settings(file_path, updates):
+    """설정 파일 일부 갱신 (검증 + 원자적 저장) 후 메모리 설정에 반영"""
+    if not _store.save(file_path, updates):
+        return False
+    sync_all_configs()
+    return True
 
 # 프로그램 시작 시 최초 로드
 sync_all_configs()
 
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 
+# [진단] WebDriver 명령 계측 (단계별 왕복/시간 분석 리포트). 환경변수 NAVER_BOT_PROFILE=1 로 켬
+PROFILE_DRIVER = os.environ.get("NAVER_BOT_PROFILE", "") == "1"
+# [진단] 작업 타임라인(Chrome Trace Event JSON) 저장. 환경변수 NAVER_BOT_TRACE=1 로 켬
+TRACE_RUNS = os.environ.get("NAVER_BOT_TRACE", "") == "1"
+# [진단] WebDriver 명령/응답 기록 (브라우저 없이 재생하는 회귀 벤치마크용). 환경변수 NAVER_BOT_RECORD=1 로 켬
+RECORD_RUNS = os.environ.get("NAVER_BOT_RECORD", "") == "1"
+
+# 네이버 접속 주소 (벤치마크 등 로컬 fixture 서버로 교체할 수 있도록 한 곳에서 관리)
+NAVER_URLS = {
+    "section": "https://section.blog.naver.com",    # 블로그 홈 피드 / 주제별 보기
+    "mobile_blog": "https://m.blog.naver.com",      # 모바일 알림 센터
+    "blog": "https://blog.naver.com",               # 개별 블로그
+    "main": "https://www.naver.com",
+    "login": "https://nid.naver.com/nidlogin.login",
+}
+
 THEME_CATEGORIES = {
     1: {"name": "엔터테인먼트/예술", "sub": {0: "전체", 5: "문학/책", 6: "영화", 8: "미술/디자인", 7: "공연/전시", 11: "음악", 9: "드라마", 12: "스타/연예인", 13: "만화/애니", 10: "방송"}},
     2: {"name": "생활/노하우/쇼핑", "sub": {0: "전체", 14: "일상/생각", 15: "육아/결혼", 16: "반려동물", 17: "좋은글/이미지", 18: "패션/미용", 19: "인테리어/DIY", 20: "요리/레시피", 21: "상품리뷰", 36: "원예/재배"}},
@@ -159,6 +447,7 @@ THEME_CATEGORIES = {
 
 SELECTORS = {
     "feed_item_inner": "div.item_inner", "feed_author_link": "a.author", "feed_nickname": "em.name_author", "feed_reply_icon": "span.reply",
+    "feed_post_link": "a.desc_inner, a.title_post",
     "main_frame": "mainFrame", "my_write_nickname": "span.u_cbox_write_name", "comment_list_nicknames": "span.u_cbox_nick",
     "comment_open_button": ".btn_comment, a.area_comment", "comment_input_area": ".u_cbox_text.u_cbox_text_mention", "comment_submit_button": "button.u_cbox_btn_upload",
     "feed_like_buttons": "div.u_likeit_list_module .u_likeit_list_btn, .u_likeit_button", "post_view_like_button": "#floating_bottom .u_likeit_button",
@@ -0,0 +1,188 @@
+# system/driver_profiler.py
+# WebDriver 명령 계측 (선택 기능: config.PROFILE_DRIVER / 환경변수 NAVER_BOT_PROFILE=1)
+# - driver.execute 하나만 감싸므로 find_element/get_attribute/execute_script/get/ActionChains.perform 모두 집계됨
+# - 명령마다 현재 단계 태그(예: "phase1.scan", "phase2.plan", "add.popup")를 붙여 단계별로 분리
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import config
+from run_trace import Tracer, span
+
+class DriverProfiler:
+    """
+    작업 1회 동안 단계별 WebDriver 왕복 횟수/시간 집계
+    - 단계 벽시계 시간 = 의도적 대기(smart_sleep 등) + 브라우저 작업(명령 왕복 + 요소 대기 폴링) + 로컬 작업(나머지)
+    - 단계 시간은 가장 안쪽 단계에만 더함 (중첩된 단계 시간이 바깥 단계에 중복 집계되지 않음)
+    """
+    # 현재 계측 중인 프로파일러 (utils 대기 함수가 대기 시간을 보고하는 대상, 없으면 보고 생략)
+    _active = None
+
+    def __init__(self, driver):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.task = None
+        self._run_thread = None
+        self._reset()
+        self.rebind(driver)
+
+    def rebind(self, driver):
+        """드라이버에 계측 연결 (브라우저 재시작 시 새 드라이버로 옮겨 작업 집계를 이어감)"""
+        self._execute = driver.execute
+        # 인스턴스 속성으로 덮어쓰면 요소 메서드(WebElement._execute -> parent.execute)도 함께 계측됨
+        driver.execute = self._timed_execute
+        driver.profiler = self
+
+    def _reset(self):
+        self.started_at = time.time()
+        self.phases = {}    # 태그 -> {wall, delay, browser, round_trips, commands: {명령: [횟수, 시간]}}
+
+    def _phase_stats(self, tag):
+        stats = self.phases.get(tag)
+        if stats is None:
+            stats = self.phases[tag] = {'wall': 0.0, 'delay': 0.0, 'browser': 0.0, 'round_trips': 0, 'commands': {}}
+        return stats
+
+    def _current_tag(self):
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else "background"   # 작업 스레드 외(로그인 감시 등)의 명령
+
+    # ---------- 계측 ----------
+    def _timed_execute(self, driver_command, params=None):
+        if self.task is None:
+            return self._execute(driver_command, params)
+        start = time.perf_counter()
+        try:
+            return self._execute(driver_command, params)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stats = self._phase_stats(self._current_tag())
+                stats['round_trips'] += 1
+                stats['browser'] += elapsed
+                command = stats['commands'].setdefault(driver_command, [0, 0.0])
+                command[0] += 1
+                command[1] += elapsed
+
+    def add_wait(self, seconds, deliberate):
+        """utils._pause 보고: deliberate=True면 사람 흉내 대기, False면 요소 대기 폴링(브라우저 작업으로 분류)"""
+        if threading.current_thread() is not self._run_thread:
+            return
+        with self._lock:
+            stats = self._phase_stats(self._current_tag())
+            stats['delay' if deliberate else 'browser'] += seconds
+
+    def _switch(self):
+        """단계 전환 시점까지의 벽시계 시간을 직전(가장 안쪽) 단계에 반영"""
+        now = time.perf_counter()
+        elapsed = now - self._local.mark
+        self._local.mark = now
+        with self._lock:
+            self._phase_stats(self._local.stack[-1])['wall'] += elapsed
+
+    @contextmanager
+    def phase(self, tag):
+        """단계 태그 지정 (작업 스레드에서만 의미가 있음)"""
+        if self.task is None or threading.current_thread() is not self._run_thread:
+            yield
+            return
+        self._switch()
+        self._local.stack.append(tag)
+        try:
+            yield
+        finally:
+            self._switch()
+            self._local.stack.pop()
+
+    # ---------- 작업 단위 ----------
+    def begin_run(self, task):
+        """작업 시작 (호출한 스레드가 작업 스레드, 태그가 없는 구간은 task 이름으로 집계)"""
+        with self._lock:
+            self._reset()
+        self._run_thread = threading.current_thread()
+        self._local.stack = [task]
+        self._local.mark = time.perf_counter()
+        self.task = task
+        DriverProfiler._active = self
+
+    def end_run(self):
+        """작업 종료: 단계별 분석 결과를 출력하고 user_data/reports 에 JSON 저장 -> 저장 경로 반환"""
+        if self.task is None:
+            return None
+        self._switch()
+        task = self.task
+        self.task = None
+        self._local.stack = []
+        DriverProfiler._active = None
+        report = self.build_report(task)
+        self.print_report(report)
+        return self.save_report(report)
+
+    def build_report(self, task):
+        phases = {}
+        with self._lock:
+            for tag, s in self.phases.items():
+                local = max(0.0, s['wall'] - s['delay'] - s['browser']) if tag != "background" else 0.0
+                phases[tag] = {
+                    'round_trips': s['round_trips'],
+                    'wall': round(s['wall'], 3),
+                    'delay': round(s['delay'], 3),
+                    'browser': round(s['browser'], 3),
+                    'local': round(local, 3),
+                    'commands': {name: {'count': c, 'time': round(t, 3)}
+                                 for name, (c, t) in sorted(s['commands'].items(), key=lambda kv: -kv[1][1])},
+                }
+        return {
+            'task': task,
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+            'wall': round(sum(p['wall'] for p in phases.values()), 3),
+            'round_trips': sum(p['round_trips'] for p in phases.values()),
+            'phases': dict(sorted(phases.items(), key=lambda kv: -kv[1]['wall'])),
+        }
+
+    @staticmethod
+    def print_report(report):
+        print(f"\n📊 [WebDriver 계측] {report['task']} - 총 {report['wall']:.1f}초 / 왕복 {report['round_trips']}회")
+        print("-" * 85)
+        print(f" {'단계':<22}{'왕복':>7}{'전체(초)':>10}{'대기':>9}{'브라우저':>10}{'로컬':>9}   주요 명령")
+        for tag, p in report['phases'].items():
+            top = ", ".join(f"{name} {c['count']}" for name, c in list(p['commands'].items())[:3])
+            print(f" {tag:<22}{p['round_trips']:>7}{p['wall']:>10.2f}{p['delay']:>9.2f}"
+                  f"{p['browser']:>10.2f}{p['local']:>9.2f}   {top}")
+        print("-" * 85)
+
+    @staticmethod
+    def save_report(report):
+        try:
+            os.makedirs(config.reports_dir, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            path = os.path.join(config.reports_dir, f"driver_profile_{report['task']}_{stamp}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"💾 계측 결과 저장: {path}")
+            return path
+        except Exception as e:
+            print(f"⚠️ 계측 결과 저장 실패: {e}")
+            return None
+
+def report_wait(seconds, deliberate):
+    """utils 대기 함수에서 호출 (계측 중이 아니면 아무것도 하지 않음)"""
+    profiler = DriverProfiler._active
+    if profiler is not None:
+        profiler.add_wait(seconds, deliberate)
+
+def profile_phase(driver, tag):
+    """봇에서 단계 태그 지정 (계측/타임라인 추적이 모두 꺼져 있으면 아무것도 하지 않음)"""
+    profiler = getattr(driver, 'profiler', None) if driver is not None else None
+    if Tracer._active is None:
+        return profiler.phase(tag) if profiler is not None else nullcontext()
+    return _traced_phase(profiler, tag)
+
+@contextmanager
+def _traced_phase(profiler, tag):
+    """타임라인 추적 중이면 단계 태그를 그대로 추적 구간으로도 기록"""
+    with span(tag, "phase"), (profiler.phase(tag) if profiler is not None else nullcontext()):
+        yield
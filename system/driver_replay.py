@@ -0,0 +1,292 @@
+# system/driver_replay.py
+# WebDriver 기록/재생 (선택 기능: config.RECORD_RUNS / 환경변수 NAVER_BOT_RECORD=1)
+# - CommandRecorder: 실제 세션의 명령/응답 스트림(셀렉터, 텍스트, 속성, 창 핸들, 알림창 오류까지)을 gzip JSON으로 저장
+# - ReplayDriver: 저장된 응답을 순서대로 돌려주는 브라우저 없는 드라이버
+#   (셀레니움의 응답 해석/예외 처리 경로는 그대로 사용하므로 봇 코드는 실제와 같은 흐름으로 동작)
+# - 재생 중 기록에 없는 명령(추가 왕복)이나 순서가 다른 명령은 mismatches 에 남기고 ReplayMismatch 발생
+# - replayable: 브라우저 밖의 비결정적 입력(AI 댓글 등)도 기록해 두고 재생 때 같은 값을 돌려줌
+import os
+import gzip
+import json
+import time
+import random
+import threading
+from datetime import datetime, timedelta
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+import config
+from bot_class.db_manager import BlogDB
+
+RECORDING_VERSION = 2  # 2: 입력(inputs) 기록 + 사람 흉내 난수 분리
+
+# 기록 파일에 남길 파라미터 (응답을 고르는 데 필요한 값만, 세션 id/무작위 좌표 등은 제외)
+_MATCH_KEYS = ('id', 'using', 'value', 'url', 'script', 'name', 'handle', 'cmd')
+
+def _signature(command, params):
+    """명령 일치 판정 키 (입력 글자는 내용일 뿐 흐름이 아니므로 제외)"""
+    params = params or {}
+    if command == Command.SEND_KEYS_TO_ELEMENT:
+        return (command, params.get('id'))
+    return (command,) + tuple(json.dumps(params.get(k), sort_keys=True) for k in _MATCH_KEYS if k in params)
+
+def _compact_params(command, params):
+    params = params or {}
+    if command == Command.SEND_KEYS_TO_ELEMENT:
+        return {'id': params.get('id')}
+    return {k: params[k] for k in _MATCH_KEYS if k in params}
+
+class CommandRecorder:
+    """
+    실제 세션 기록기 (command_executor.execute를 감싸 원본 JSON 응답을 그대로 보관)
+    - 작업 스레드의 명령만 기록 (로그인 감시 등 다른 스레드 명령 제외)
+    - 작업 시작 시 random 시드를 고정하고 기록 -> 재생 때 같은 시드로 스크롤 단계 수/메시지 선택까지 재현
+    - 작업 시작 시각(created_at)을 기록 -> 재생 때 현재 시각을 '시작 시각 + 재생 시계'로 재현 (utils.current_time)
+    """
+    def __init__(self, driver):
+        self._driver = driver
+        self._executor = driver.command_executor
+        self._execute = self._executor.execute
+        self._executor.execute = self._recording_execute
+        self.commands = None
+        self.inputs = None
+        self.meta = None
+        self._run_thread = None
+        self._t0 = 0.0
+        driver.recorder = self
+
+    def _recording_execute(self, command, params=None):
+        response = self._execute(command, params)
+        if self.commands is not None and threading.current_thread() is self._run_thread:
+            # 응답은 셀레니움이 곧바로 요소 객체로 바꿔 쓰므로 JSON 사본으로 보관
+            self.commands.append([command, _compact_params(command, params), json.loads(json.dumps(response)),
+                                  round((time.monotonic() - self._t0) * 1000, 1)])
+        return response
+
+    def record_input(self, kind, value):
+        """replayable 입력 기록 (작업 스레드 값만)"""
+        if self.inputs is not None and threading.current_thread() is self._run_thread:
+            self.inputs.append([kind, value])
+
+    def begin_run(self, task, params=None):
+        seed = random.randrange(2 ** 31)
+        random.seed(seed)
+        self.meta = {
+            'version': RECORDING_VERSION,
+            'task': task,
+            'params': params,
+            'seed': seed,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'db_snapshot': None,
+            # 새 창마다 보내는 차단 명령 재현용 (가벼운 탐색 설정)
+            'blocked_urls': list(getattr(self._driver, 'blocked_urls', None) or []),
+        }
+        self._stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # 스마트 관리는 DB 상태(마지막 스캔/정책)에 따라 흐름이 달라지므로 시작 시점 DB 사본을 같이 저장
+        if task == "smart_neighbor_management_task":
+            try:
+                os.makedirs(config.reports_dir, exist_ok=True)
+                name = f"recording_{task}_{self._stamp}.db"
+                BlogDB().backup_to(os.path.join(config.reports_dir, name))
+                self.meta['db_snapshot'] = name
+            except Exception as e:
+                print(f"⚠️ 기록용 DB 사본 저장 실패: {e}")
+        self._run_thread = threading.current_thread()
+        self.meta['created_at'] = datetime.now().isoformat(timespec='milliseconds')
+        self._t0 = time.monotonic()
+        self.commands = []
+        self.inputs = []
+
+    def end_run(self):
+        """기록 종료 후 user_data/reports 에 저장 -> 저장 경로 반환"""
+        if self.commands is None:
+            return None
+        commands, self.commands = self.commands, None
+        inputs, self.inputs = self.inputs, None
+        try:
+            os.makedirs(config.reports_dir, exist_ok=True)
+            path = os.path.join(config.reports_dir, f"recording_{self.meta['task']}_{self._stamp}.json.gz")
+            save_recording(path, self.meta, commands, inputs)
+            print(f"📼 WebDriver 기록 저장: {path} (명령 {len(commands)}개)")
+            return path
+        except Exception as e:
+            print(f"⚠️ WebDriver 기록 저장 실패: {e}")
+            return None
+
+def save_recording(path, meta, commands, inputs=()):
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'commands': commands, 'inputs': list(inputs)}, f,
+                  ensure_ascii=False, separators=(',', ':'))
+
+def load_recording(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        data = json.load(f)
+    if data['meta'].get('version') != RECORDING_VERSION:
+        raise ValueError(f"지원하지 않는 기록 파일 버전입니다: {data['meta'].get('version')}")
+    return data
+
+class ReplayMismatch(WebDriverException):
+    """기록과 다른 명령 요청 (추가 왕복 / 순서 변경 / 기록 소진)"""
+
+class ReplayClock:
+    """
+    재생용 가상 시계: 마지막으로 돌려준 응답의 기록 시각
+    - monotonic: CancellableWait 시간 초과 판정을 기록과 같게 재현
+    - now: 기록 시작 시각 기준 현재 시각 (알림 갱신 주기/댓글 쿨다운 판정을 기록과 같게 재현)
+    """
+    def __init__(self, start=None):
+        self.start = start or datetime.now()
+        self.now_ms = 0.0
+
+    def monotonic(self):
+        return self.now_ms / 1000
+
+    def now(self):
+        return self.start + timedelta(milliseconds=self.now_ms)
+
+class _ReplayInputs:
+    """기록된 replayable 입력을 순서대로 반환 (종류가 다르거나 소진되면 ReplayMismatch)"""
+    def __init__(self, inputs, executor):
+        self._inputs = inputs
+        self._executor = executor
+        self.reset()
+
+    def reset(self):
+        self.position = 0
+
+    @property
+    def remaining(self):
+        return len(self._inputs) - self.position
+
+    def next(self, kind):
+        if self.position < len(self._inputs) and self._inputs[self.position][0] == kind:
+            value = self._inputs[self.position][1]
+            self.position += 1
+            return value
+        expected = self._inputs[self.position] if self.position < len(self._inputs) else "(기록 끝)"
+        detail = {'at': f"input {self.position}", 'requested': [kind], 'expected': expected}
+        self._executor.mismatches.append(detail)
+        self._executor._failed = True
+        raise ReplayMismatch(f"기록과 다른 입력 요청: {detail}")
+
+def replayable(driver, kind, produce):
+    """
+    비결정적 입력(AI 응답 등) 기록/재생: 재생 드라이버면 기록된 값, 아니면 produce() 결과 (기록 중이면 함께 저장)
+    - 값은 JSON으로 저장 가능해야 함
+    """
+    inputs = getattr(driver, 'replay_inputs', None)
+    if inputs is not None:
+        return inputs.next(kind)
+    value = produce()
+    recorder = getattr(driver, 'recorder', None)
+    if recorder is not None:
+        recorder.record_input(kind, value)
+    return value
+
+class _ReplayExecutor:
+    """command_executor 대체: 기록된 원본 응답을 순서대로 반환"""
+    _SESSION = {'value': {'sessionId': 'replay', 'capabilities': {'browserName': 'chrome'}}}
+    _NO_CONTENT = {'value': None}
+
+    def __init__(self, commands, clock, strict):
+        # (일치 키, 응답 JSON 문자열, 기록 시각) - 응답은 매번 새 객체로 풀어 줌 (셀레니움이 응답을 수정함)
+        self._commands = [(_signature(c, p), json.dumps(r), t) for c, p, r, t in commands]
+        self._commands_raw = commands
+        self._clock = clock
+        self.strict = strict
+        self.reset()
+
+    def reset(self):
+        self.position = 0
+        self.served = 0
+        self.extra_keys = 0     # 기록과 개수가 달랐던 입력(sendKeys) 명령 수
+        self.skipped = 0
+        self.mismatches = []
+        self._failed = False
+
+    @property
+    def remaining(self):
+        return len(self._commands) - self.position
+
+    def execute(self, command, params=None):
+        if command == Command.NEW_SESSION:
+            return json.loads(json.dumps(self._SESSION))
+        if command == Command.QUIT:
+            return dict(self._NO_CONTENT)
+
+        if self._failed and self.strict:
+            raise ReplayMismatch("이전 명령 불일치로 재생이 중단되었습니다.")
+
+        signature = _signature(command, params)
+        # 입력 글자 수가 기록과 다르면(AI 댓글 등) 남는/모자라는 sendKeys 는 흐름 차이로 보지 않음
+        if command == Command.SEND_KEYS_TO_ELEMENT:
+            index = self._find(signature, window=1)
+            if index is None:
+                self.extra_keys += 1
+                return dict(self._NO_CONTENT)
+        else:
+            while self.position < len(self._commands) and self._commands[self.position][0][0] == Command.SEND_KEYS_TO_ELEMENT:
+                self.position += 1
+                self.extra_keys += 1
+            # strict: 다음 명령만 허용 / 느슨한 재생: 최대 50개 앞까지 찾아 다시 맞춤 (건너뛴 수는 skipped)
+            index = self._find(signature, window=1 if self.strict else 50)
+            if index is None:
+                return self._mismatch(command, params)
+
+        self.skipped += index - self.position
+        _, response, t = self._commands[index]
+        self.position = index + 1
+        self.served += 1
+        self._clock.now_ms = t
+        return json.loads(response)
+
+    def _find(self, signature, window):
+        for index in range(self.position, min(self.position + window, len(self._commands))):
+            if self._commands[index][0] == signature:
+                return index
+        return None
+
+    def _mismatch(self, command, params):
+        if self.position < len(self._commands):
+            expected = self._commands_raw[self.position][:2]
+        else:
+            expected = "(기록 끝)"
+        detail = {'at': self.position, 'requested': [command, _compact_params(command, params)], 'expected': expected}
+        self.mismatches.append(detail)
+        self._failed = True
+        raise ReplayMismatch(f"기록과 다른 WebDriver 명령: {detail}")
+
+class ReplayDriver(RemoteWebDriver):
+    """
+    브라우저 없이 기록을 재생하는 드라이버 (봇 클래스에 실제 드라이버 대신 전달)
+    - strict=True: 기록과 한 명령이라도 다르면 ReplayMismatch (추가 왕복 회귀 검출용)
+    - replay_clock: CancellableWait 가 실제 대기 대신 기록 시각으로 시간 초과를 판정, 현재 시각도 기록 기준
+    - replay_inputs: replayable 입력(AI 댓글 등)을 기록 값으로 반환
+    """
+    def __init__(self, recording, strict=True):
+        self.recording = load_recording(recording) if isinstance(recording, str) else recording
+        self.replay_clock = ReplayClock(datetime.fromisoformat(self.meta['created_at']))
+        self.replay = _ReplayExecutor(self.recording['commands'], self.replay_clock, strict)
+        self.replay_inputs = _ReplayInputs(self.recording.get('inputs') or [], self.replay)
+        super().__init__(command_executor=self.replay, options=Options())
+        self.blocked_urls = self.meta.get('blocked_urls') or []
+
+    @property
+    def meta(self):
+        return self.recording['meta']
+
+    def rewind(self):
+        """처음부터 다시 재생 (random 시드도 기록 시점 값으로 복원)"""
+        self.replay.reset()
+        self.replay_inputs.reset()
+        self.replay_clock.now_ms = 0.0
+        random.seed(self.meta['seed'])
+
+    def replay_report(self):
+        r = self.replay
+        return {'served': r.served, 'remaining': r.remaining, 'skipped': r.skipped,
+                'extra_keys': r.extra_keys, 'inputs_remaining': self.replay_inputs.remaining,
+                'mismatches': list(r.mismatches)}
@@ -1,23 +1,29 @@
 import sys
 import os
-import time
+import threading
 import subprocess
+from collections import deque
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, 
-    QLabel, QTextEdit, QHBoxLayout, QPushButton, 
-    QStackedWidget, QButtonGroup, QFrame
+    QLabel, QPlainTextEdit, QHBoxLayout, QPushButton, 
+    QStackedWidget, QButtonGroup, QFrame, QProgressBar
 )
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer, QObject, Qt
-from PyQt6.QtGui import QTextCursor
+from PyQt6.QtCore import QThread, pyqtSignal, QTimer, QObject, Qt, QFileSystemWatcher
 
 import config
 from bot_class.session_manager import NaverSessionManager
 from bot_class.blog_likes_neighbor import BlogLikesNeighbor
 from bot_class.blog_add_neighbor import BlogAddNeighbor
 from bot_class.blog_smart_neighbor_management import BlogSmartNeighborManagement
+from bot_class.db_manager import BlogDB
+from bot_class.run_journal import RunJournal
+from run_trace import Tracer
+from browser_governor import ResourceGovernor, close_stray_windows
+from bot_events import LikeDone, CommentDone, NeighborRequested, Error, describe
 
 from gui_tabs import LikeTab, AddTab, SmartNeighborManagementTab
+from utils import CancelToken, TaskCancelled, bind_cancel_token
 
 class GuiLogger(QObject):
     log_signal = pyqtSignal(str)
@@ -29,71 +35,242 @@ class GuiLogger(QObject):
     def flush(self):
         pass
 
+class LogSink(QObject):
+    """
+    로그 줄을 버퍼에 모았다가 타이머로 한 번에 출력
+    - 줄마다 위젯을 갱신하지 않으므로 재배치 비용이 줄 수가 아닌 출력 횟수에 비례
+    - 위젯 최대 줄 수 + 버퍼 최대 길이 제한으로 장시간 실행에도 메모리 일정
+    """
+    def __init__(self, widget, max_lines=5000, interval_ms=100):
+        super().__init__(widget)
+        self.widget = widget
+        self.widget.setMaximumBlockCount(max_lines)
+        self.pending = deque(maxlen=max_lines)
+
+        # 로그가 들어올 때만 1회 동작 (유휴 상태에서는 타이머가 깨어나지 않음)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def write(self, text):
+        self.pending.append(text)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        if not self.pending:
+            return
+        scrollbar = self.widget.verticalScrollBar()
+        # 출력 전 스크롤이 '맨 아래'에 있었던 경우에만 자동 스크롤 (사용자가 위를 보고 있으면 유지)
+        is_at_bottom = (scrollbar.value() >= scrollbar.maximum() - 10)
+
+        text = "\n".join(self.pending)
+        self.pending.clear()
+        self.widget.appendPlainText(text)
+
+        if is_at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
 class SessionWatcher(QThread):
+    """
+    로그인 상태 표시 갱신 (세션의 캐시된 상태가 바뀔 때만 status_signal 발생)
+    - 작업 중에는 WebDriver를 건드리지 않음 (봇 응답/이벤트로 세션이 직접 갱신)
+    - 작업이 없을 때만 가벼운 하트비트로 쿠키 확인 (브라우저 종료/로그아웃 감지)
+    """
     status_signal = pyqtSignal(int)
+    HEARTBEAT_INTERVAL = 5.0
     
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
-        self.running = True
+        self._stop_event = threading.Event()
+
+    def watch(self, session):
+        """새 세션 구독 (상태 전환 시에만 알림) + 현재 캐시 값 1회 표시"""
+        session.add_state_listener(self.status_signal.emit)
+        self.status_signal.emit(session.login_state)
+
+    def stop(self):
+        self._stop_event.set()
         
     def run(self):
-        while self.running:
-            try:
-                if self.main_window.session and self.main_window.session.driver:
-                    if self.main_window.session.check_login_status():
-                        self.status_signal.emit(2)
-                    else:
-                        self.status_signal.emit(1)
-                else:
-                    self.status_signal.emit(0)
-            except:
-                self.status_signal.emit(0)
-            time.sleep(2)
+        while not self._stop_event.wait(self.HEARTBEAT_INTERVAL):
+            session = self.main_window.session
+            if session and session.driver:
+                session.heartbeat()
+
+# 작업별 목표 달성으로 세는 이벤트 (브라우저 복구 후 남은 목표 계산용)
+TARGET_EVENTS = {
+    "like_task": LikeDone,
+    "add_task": NeighborRequested,
+    "smart_neighbor_management_task": CommentDone,
+}
 
 class ActionWorker(QThread):
     finished_signal = pyqtSignal(object) 
     log_signal = pyqtSignal(str)         
     ranking_signal = pyqtSignal(list)
+    event_signal = pyqtSignal(object)    # bot_events 의 구조화 이벤트
     
     def __init__(self, action_type, session=None, params=None):
         super().__init__()
         self.action_type = action_type
         self.session = session
         self.params = params
-        self.is_stopped = False
+        # 중단 신호: 봇과 utils 대기 함수가 공유 (중단 시 진행 중인 대기도 즉시 깨어남)
+        self.cancel_token = CancelToken()
+        # 실행 기록 (봇 작업일 때만 생성, 디스크 기록은 백그라운드 스레드)
+        self.journal = None
+        self.governor = None
+
+    @property
+    def is_stopped(self):
+        """사용자 중단 또는 브라우저 연결 끊김 (끊김이면 봇은 멈추고 run이 복구 후 다시 실행)"""
+        if self.cancel_token.is_cancelled:
+            return True
+        return self.governor is not None and self.governor.driver_lost
+
+    def stop(self):
+        self.cancel_token.cancel()
+
+    def emit_event(self, event):
+        if self.journal is not None:
+            self.journal.on_event(event)
+        # 작업 성공 = 로그인 유효 (상태 확인용 WebDriver 호출 없이 캐시 갱신)
+        if isinstance(event, (LikeDone, CommentDone, NeighborRequested)) and self.session is not None:
+            self.session.mark_logged_in()
+        if self.governor is not None and isinstance(event, TARGET_EVENTS.get(self.action_type, ())):
+            self.governor.completed += 1
+        self.event_signal.emit(event)
         
     def run(self):
+        bind_cancel_token(self.cancel_token)
+        if self.action_type in ["like_task", "add_task", "smart_neighbor_management_task"]:
+            self.journal = RunJournal(self.action_type)
+        status = "done"
+        profiler = getattr(self.session.driver, 'profiler', None) if self.journal is not None else None
+        recorder = getattr(self.session.driver, 'recorder', None) if self.journal is not None else None
+        page_meter = getattr(self.session.driver, 'page_meter', None) if self.journal is not None else None
+        # 브라우저 자원 관리 (봇은 페이지 경계의 checkpoint로 사용, 재시작 시 새 드라이버로 교체)
+        self.governor = ResourceGovernor(self.session) if self.journal is not None else None
         try:
-            if self.action_type in ["like_task", "add_task", "smart_neighbor_management_task"]:
-                driver = self.session.driver
-                while len(driver.window_handles) > 1:
-                    driver.switch_to.window(driver.window_handles[-1])
-                    driver.close()
-                driver.switch_to.window(driver.window_handles[0])
+            if self.journal is not None:
+                self.session.begin_task()
+            if profiler is not None:
+                profiler.begin_run(self.action_type)
+            if page_meter is not None:
+                page_meter.begin_run()
+            if self.journal is not None:
+                Tracer.begin(self.action_type)
+                close_stray_windows(self.session.driver, refocus=True)
+                self.governor.begin_run(self.action_type)
+            # 기록은 창 정리 이후부터 (재생은 항상 창 1개 상태에서 시작)
+            if recorder is not None:
+                recorder.begin_run(self.action_type, self.params)
                 
             if self.action_type == "init_session":
                 session = NaverSessionManager()
                 session.ensure_login()
                 self.finished_signal.emit(session)
+            elif self.action_type == "maintain_profile":
+                # 크롬이 프로필을 사용 중이면 캐시를 지울 수 없으므로 브라우저를 닫고 정리 후 다시 실행
+                if self.session and self.session.driver:
+                    try:
+                        self.session.driver.quit()
+                    except Exception:
+                        pass
+                session = NaverSessionManager(force_maintenance=True)
+                session.ensure_login()
+                self.finished_signal.emit(session)
             elif self.action_type == "like_task":
-                bot = BlogLikesNeighbor(self.session.driver)
-                bot.worker = self
-                bot.run(self.params['cnt'], self.params['pg'])
+                self._run_with_recovery()
                 self.finished_signal.emit("✅ 이웃 공감 작업 종료")
             elif self.action_type == "add_task":
-                bot = BlogAddNeighbor(self.session.driver)
-                bot.worker = self
-                bot.run(self.params['main_id'], self.params['sub_id'], self.params['cnt'], self.params['pg'])
+                self._run_with_recovery()
                 self.finished_signal.emit("✅ 서이추 신청 작업 종료")
             elif self.action_type == "smart_neighbor_management_task":
-                bot = BlogSmartNeighborManagement(self.session.driver)
-                bot.worker = self
-                bot.run(self.params)
+                self._run_with_recovery()
                 self.finished_signal.emit("✅ 스마트 이웃 관리 작업 종료")
+        except TaskCancelled:
+            status = "cancelled"
+            self.finished_signal.emit("🛑 작업이 중단되었습니다.")
         except Exception as e:
+            status = "error"
+            if self.journal is not None:
+                self.journal.on_event(Error("worker", "exception", str(e)))
             self.log_signal.emit(f"❌ 오류: {str(e)}")
             self.finished_signal.emit(None)
+        finally:
+            if self.journal is not None:
+                if status == "done" and self.cancel_token.is_cancelled:
+                    status = "cancelled"
+                self.journal.finish(status)
+            if self.governor is not None:
+                self.governor.end_run()
+            if profiler is not None:
+                profiler.end_run()
+            if page_meter is not None:
+                page_meter.end_run()
+            if self.journal is not None:
+                Tracer.end()
+            if recorder is not None:
+                recorder.end_run()
+            if self.journal is not None:
+                self.session.end_task()
+
+    def _run_bot(self, params):
+        """봇 1회 실행 (복구 후에는 새 드라이버와 이어갈 위치로 다시 호출)"""
+        if self.action_type == "like_task":
+            bot = BlogLikesNeighbor(self.session.driver)
+            bot.worker = self
+            bot.run(params['cnt'], params['pg'])
+        elif self.action_type == "add_task":
+            bot = BlogAddNeighbor(self.session.driver)
+            bot.worker = self
+            bot.run(params['main_id'], params['sub_id'], params['cnt'], params['pg'])
+        elif self.action_type == "smart_neighbor_management_task":
+            bot = BlogSmartNeighborManagement(self.session.driver)
+            bot.worker = self
+            bot.run(params)
+
+    def _run_with_recovery(self):
+        """
+        [핵심] 브라우저/드라이버가 작업 중에 죽으면 같은 프로필로 재시작하고 마지막 체크포인트(페이지)부터 이어서 실행
+        - 봇은 연결이 끊기면 is_stopped 로 빠져나오고, 남은 목표 수만큼 새 봇으로 다시 실행 (최대 복구 횟수는 설정값)
+        """
+        params = self.params
+        while True:
+            try:
+                self._run_bot(params)
+            except TaskCancelled:
+                raise
+            except Exception:
+                if self.cancel_token.is_cancelled or not self.governor.driver_lost:
+                    raise
+            if self.cancel_token.is_cancelled or not self.governor.driver_lost:
+                return
+            self.emit_event(Error("session", "browser_crashed", "작업 중 브라우저 연결이 끊어졌습니다."))
+            params = self._resume_params(self.governor.recover())
+            if params is None:
+                print("✅ 복구 시점에 이미 목표를 달성했습니다.")
+                return
+
+    def _resume_params(self, position):
+        """이어갈 위치(체크포인트 페이지)와 남은 목표로 작업 파라미터 재구성 (남은 목표가 없으면 None)"""
+        params = dict(self.params)
+        target_key, page_key = {
+            "like_task": ('cnt', 'pg'),
+            "add_task": ('cnt', 'pg'),
+            "smart_neighbor_management_task": ('target_comment', 'start_pg'),
+        }[self.action_type]
+        remaining = params[target_key] - self.governor.completed
+        if remaining <= 0:
+            return None
+        params[target_key] = remaining
+        if position and position.get('page'):
+            params[page_key] = position['page']
+        return params
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -111,11 +288,19 @@ class MainWindow(QMainWindow):
         self.smart_ai_success = 0
         self.smart_normal_success = 0
         
+        # 봇 이벤트 구독자 (로그 출력도 구독자 중 하나)
+        self.event_subscribers = [self._log_event, self._count_event, self._progress_event]
+        
         self.gui_logger = GuiLogger()
         self.gui_logger.log_signal.connect(self.append_log)
         sys.stdout = self.gui_logger
         
         self.init_ui()
+
+        # 설정 파일 감시: 바뀐 파일만 다시 읽음 (작업 시작 시 sync_all_configs는 stat만 수행)
+        self.settings_watcher = QFileSystemWatcher([p for p in config.SETTINGS_SCHEMAS if os.path.exists(p)], self)
+        self.settings_watcher.fileChanged.connect(self.on_settings_file_changed)
+
         QTimer.singleShot(100, lambda: self.start_action("init_session"))
 
     def init_ui(self):
@@ -133,7 +318,7 @@ class MainWindow(QMainWindow):
                 color: #AAAAAA; 
                 padding-top: 10px; 
             }
-            QLineEdit, QComboBox, QTextEdit { 
+            QLineEdit, QComboBox, QTextEdit, QPlainTextEdit { 
                 background-color: #3C3C3C; 
                 border: 1px solid #555555; 
                 color: white; 
@@ -191,9 +376,22 @@ class MainWindow(QMainWindow):
         btn_reconnect.setFixedSize(110, 30)
         btn_reconnect.clicked.connect(lambda: self.start_action("init_session"))
 
+        btn_maintain = QPushButton("프로필 정리")
+        btn_maintain.setFixedSize(90, 30)
+        btn_maintain.setToolTip("브라우저를 닫고 캐시를 정리한 뒤 다시 실행합니다. (로그인 정보 유지)")
+        btn_maintain.clicked.connect(lambda: self.start_action("maintain_profile"))
+
         top_bar.addWidget(self.status_dot)
         top_bar.addWidget(self.status_label)
         top_bar.addStretch()
+
+        # 작업 진행바 (목표 수가 있는 작업에서만 표시)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedSize(220, 16)
+        self.progress_bar.setFormat("%v / %m")
+        self.progress_bar.hide()
+        top_bar.addWidget(self.progress_bar)
+        top_bar.addWidget(btn_maintain)
         top_bar.addWidget(btn_reconnect)
         main_layout.addLayout(top_bar)
 
@@ -230,10 +428,11 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(self.stack)
         content_layout.addWidget(left_panel, stretch=5)
 
-        # 로그창
-        self.log_text = QTextEdit()
+        # 로그창 (버퍼링 + 최대 줄 수 제한)
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setStyleSheet("background-color: #111; border: 1px solid #333; font-size: 11px;")
+        self.log_sink = LogSink(self.log_text)
         content_layout.addWidget(self.log_text, stretch=4)
         
         main_layout.addLayout(content_layout)
@@ -254,42 +453,55 @@ class MainWindow(QMainWindow):
             self.stack.setCurrentIndex(2)
 
     def append_log(self, text):
-        # 1. 현재 스크롤바 객체 가져오기
-        scrollbar = self.log_text.verticalScrollBar()
-        
-        # 2. 텍스트 추가 전, 스크롤이 '맨 아래'에 있는지 확인
-        # (현재 위치가 최대값 근처라면 바닥에 있는 것으로 간주)
-        is_at_bottom = (scrollbar.value() >= scrollbar.maximum() - 10)
-        
-        # 3. 로그 텍스트 추가
-        self.log_text.append(text)
-        
-        # 4. 아까 스크롤이 바닥에 있었던 경우에만, 커서를 맨 끝으로 이동 (오토 스크롤)
-        # 사용자가 위를 보고 있었다면(is_at_bottom == False), 이 부분이 실행되지 않아 스크롤이 유지됨
-        if is_at_bottom:
-            self.log_text.moveCursor(QTextCursor.MoveOperation.End)
-            
-        # UI 갱신 (반응성 유지)
-        QApplication.processEvents()
-        
-        # 로그 분석 및 탭 텍스트 실시간 업데이트
-        if "❤️ 공감 완료" in text:
-            self.total_like_success += 1
-            self.btn_tab1.setText(f"❤️ 이웃 공감 (+{self.total_like_success})")
-        elif "🎉 이웃 신청 완료!" in text:
+        # 로그는 버퍼에 넣고 타이머가 모아서 출력 (processEvents 재진입 없음)
+        self.log_sink.write(text)
+
+    def on_bot_event(self, event):
+        for subscriber in self.event_subscribers:
+            subscriber(event)
+
+    def _log_event(self, event):
+        self.append_log(describe(event))
+
+    def _count_event(self, event):
+        # 이벤트 타입으로 탭 카운터 갱신 (로그 문구가 바뀌어도 영향 없음)
+        if isinstance(event, LikeDone):
+            if event.source == "like":
+                self.total_like_success += 1
+                self.btn_tab1.setText(f"❤️ 이웃 공감 (+{self.total_like_success})")
+            elif event.source == "smart":
+                self.smart_like_success += 1
+                self.update_smart_tab_text()
+        elif isinstance(event, NeighborRequested):
             self.total_add_success += 1
             self.btn_tab2.setText(f"🤝 서이추 신청 (+{self.total_add_success})")
-        elif "✅ [스마트관리] 공감 성공" in text:
-            self.smart_like_success += 1
-            self.update_smart_tab_text()
-        elif "✅ [스마트관리] AI댓글 성공" in text:
-            self.smart_ai_success += 1
-            self.update_smart_tab_text()
-        elif "✅ [스마트관리] 일반댓글 성공" in text:
-            self.smart_normal_success += 1
+        elif isinstance(event, CommentDone) and event.source == "smart":
+            if event.mode == "AI":
+                self.smart_ai_success += 1
+            else:
+                self.smart_normal_success += 1
             self.update_smart_tab_text()
-            
-        QApplication.processEvents()
+
+    def _progress_event(self, event):
+        target = getattr(event, 'target', 0)
+        if target:
+            self.progress_bar.setMaximum(target)
+            self.progress_bar.setValue(min(event.done, target))
+            self.progress_bar.show()
+
+    def on_settings_file_changed(self, path):
+        # 메모장 등은 저장 시 파일을 교체하므로 감시 목록에서 빠진 경로를 다시 등록
+        if os.path.exists(path) and path not in self.settings_watcher.files():
+            self.settings_watcher.addPath(path)
+        changed = config.sync_all_configs()
+        if not changed:
+            return
+        self.append_log(f"🔄 설정 파일 변경 반영: {', '.join(os.path.basename(p) for p in changed)}")
+        if config.path_gemini_setup in changed:
+            self.smart_tab.ai_toggle.blockSignals(True)
+            self.smart_tab.ai_toggle.setChecked(config.GEMINI_CONFIG["USE_GEMINI"])
+            self.smart_tab.ai_toggle.blockSignals(False)
+            self.smart_tab.refresh_ai_ui_status()
 
     def update_smart_tab_text(self):
         self.btn_tab3.setText(f"⭐ 스마트 관리 (❤️+{self.smart_like_success}/🤖+{self.smart_ai_success}/💬+{self.smart_normal_success})")
@@ -300,48 +512,34 @@ class MainWindow(QMainWindow):
             else: subprocess.call(['open' if sys.platform == 'darwin' else 'xdg-open', path])
         except Exception as e: self.append_log(f"❌ 오류: {e}")
 
-    def sync_ui_to_config(self, inputs, target_cfg):
+    def _collect_ui_settings(self, inputs, prefix, target_cfg):
+        """입력칸 값을 설정 파일 변수 단위로 분류 (값 검증은 config 스키마가 담당)"""
+        updates = {f"{prefix}_DELAYS": {}, f"{prefix}_CONDITIONS": {}}
         for k, f in inputs.items():
             if isinstance(f, tuple):
-                target_cfg["delays"][k] = (float(f[0].text()), float(f[1].text()))
+                value = (config.parse_setting_input(f[0].text()), config.parse_setting_input(f[1].text()))
             else:
-                val = f.text()
-                if k in target_cfg["delays"]: 
-                    target_cfg["delays"][k] = float(val) if '.' in val else int(val)
-                else: 
-                    target_cfg["conditions"][k] = int(val) if val.isdigit() else val
-
-    def _write_txt(self, path, prefix, target_cfg):
-        try:
-            lines = [f"{prefix}_DELAYS = {{"]
-            for k, v in target_cfg["delays"].items():
-                lines.append(f"    '{k}': {v},")
-            lines.append("}\n")
-            lines.append(f"{prefix}_CONDITIONS = {{")
-            for k, v in target_cfg["conditions"].items():
-                lines.append(f"    '{k}': {v},")
-            lines.append("}")
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write("\n".join(lines))
+                value = config.parse_setting_input(f.text())
+            section = "DELAYS" if k in target_cfg["delays"] else "CONDITIONS"
+            updates[f"{prefix}_{section}"][k] = value
+        return updates
+
+    def _save_ui_settings(self, path, inputs, prefix, target_cfg):
+        # 검증 후 임시 파일에 쓰고 교체 (저장된 값은 메모리 설정에도 즉시 반영)
+        if config.save_settings(path, self._collect_ui_settings(inputs, prefix, target_cfg)):
             self.append_log(f"✅ 저장 완료: {os.path.basename(path)}")
-        except Exception as e:
-            self.append_log(f"❌ 저장 실패: {e}")
 
     def save_like_settings(self):
-        self.sync_ui_to_config(self.like_tab.inputs, config.LIKES_NEIGHBOR_CONFIG)
-        self._write_txt(config.path_like_setup, "LIKE_NEIGHBORS", config.LIKES_NEIGHBOR_CONFIG)
+        self._save_ui_settings(config.path_like_setup, self.like_tab.inputs, "LIKE_NEIGHBORS", config.LIKES_NEIGHBOR_CONFIG)
 
     def save_add_settings(self):
-        self.sync_ui_to_config(self.add_tab.inputs, config.ADD_NEIGHBOR_CONFIG)
-        self._write_txt(config.path_add_setup, "ADD_NEIGHBORS", config.ADD_NEIGHBOR_CONFIG)
+        self._save_ui_settings(config.path_add_setup, self.add_tab.inputs, "ADD_NEIGHBORS", config.ADD_NEIGHBOR_CONFIG)
 
     def save_smart_settings(self, state=None):
-        # 1. 일반 스마트 관리 설정(딜레이 등)은 UI에서 가져와 동기화
-        self.sync_ui_to_config(self.smart_tab.inputs, config.SMART_NEIGHBOR_CONFIG)
-        
-        # 2. 스마트 관리 설정 파일 저장 (setup_smart_neighbor_management.txt)
-        # 얘는 UI에 있는 값을 저장하는게 맞으므로 저장 수행
-        self._write_txt(config.path_smart_neighbor_management_setup, "SMART_MANAGEMENT", config.SMART_NEIGHBOR_CONFIG)
+        # 1~2. 스마트 관리 설정(UI 입력값)을 검증하여 setup_smart_neighbor_management.txt에 저장
+        # (파일의 다른 변수(가중치 등)는 그대로 유지)
+        self._save_ui_settings(config.path_smart_neighbor_management_setup, self.smart_tab.inputs,
+                               "SMART_MANAGEMENT", config.SMART_NEIGHBOR_CONFIG)
 
         # 3. [핵심 수정] AI 토글 처리 로직
         # 텍스트 파일을 덮어쓰지 않고, 오히려 파일을 '읽어서' 검증함
@@ -352,10 +550,7 @@ class MainWindow(QMainWindow):
             # (앱 실행 중 사용자가 메모장에서 키를 넣고 저장했을 수 있으므로)
             reloaded_gemini = config.load_gemini_settings(config.path_gemini_setup)
             
-            api_key = reloaded_gemini.get("GEMINI_API_KEY", "").strip()
-            prompt = reloaded_gemini.get("GEMINI_PROMPT", "").strip()
-            
-            if not api_key or not prompt:
+            if not reloaded_gemini["USE_GEMINI"]:
                 self.append_log("❌ [설정 오류] API Key 또는 프롬프트가 설정 파일에 없습니다.")
                 self.append_log("   (설정 파일 열기 버튼을 눌러 키를 입력하고 저장해주세요)")
                 
@@ -403,7 +598,7 @@ class MainWindow(QMainWindow):
 
     def stop_task(self):
         if hasattr(self, 'worker') and self.worker.isRunning():
-            self.worker.is_stopped = True
+            self.worker.stop()
             self.append_log("\n🛑 중단 요청됨...")
 
     def update_sub_combo(self):
@@ -414,13 +609,18 @@ class MainWindow(QMainWindow):
                 self.add_tab.combo_sub.addItem(sname, sid)
 
     def start_action(self, action_type, params=None):
-        if action_type != "init_session" and (not self.session or not self.session.driver):
+        if action_type not in ("init_session", "maintain_profile") and (not self.session or not self.session.driver):
             self.append_log("❌ 브라우저 미연결")
             return
+        if action_type == "maintain_profile" and getattr(self, 'worker', None) and self.worker.isRunning():
+            self.append_log("⚠️ 작업 중에는 프로필을 정리할 수 없습니다.")
+            return
         self.toggle_ui(False)
+        self.progress_bar.hide()
         self.worker = ActionWorker(action_type, self.session, params)
         self.worker.ranking_signal.connect(self.smart_tab.update_ranking_ui)
         self.worker.log_signal.connect(self.append_log)
+        self.worker.event_signal.connect(self.on_bot_event)
         self.worker.finished_signal.connect(self.on_action_finished)
         self.worker.start()
 
@@ -445,16 +645,19 @@ class MainWindow(QMainWindow):
                 self.watcher = SessionWatcher(self)
                 self.watcher.status_signal.connect(self.update_status_ui)
                 self.watcher.start()
+            self.watcher.watch(result)
         elif result:
             self.append_log(str(result))
         self.toggle_ui(True)
 
     def closeEvent(self, event):
         if self.watcher:
-            self.watcher.running = False
+            self.watcher.stop()
             self.watcher.wait()
         if self.session and self.session.driver:
             self.session.driver.quit()
+        RunJournal.shutdown()
+        BlogDB.close()
         event.accept()
 
 if __name__ == "__main__":
@@ -0,0 +1,146 @@
+# system/gui_ranking.py
+# 스마트 관리 탭 랭킹 표 (모델/뷰 방식: 화면에 보이는 행만 그리고, 갱신은 변경분만 반영)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtGui import QColor
+
+class RankingTableModel(QAbstractTableModel):
+    HEADERS = ["순위", "닉네임", "댓글", "답글", "공감", "점수"]
+    FETCH_BATCH = 200           # 스크롤 시 한 번에 노출할 행 수
+    RESET_RATIO = 0.5           # 절반 이상 삭제되면 개별 삭제 대신 전체 리셋
+
+    _SCORE_COLOR = QColor("#2DB400")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 행: [순위, 닉네임, 댓글, 답글, 공감, 점수] (컬럼 순서와 동일)
+        self._rows = []
+        self._loaded = 0        # 뷰에 노출된 행 수 (나머지는 fetchMore로 지연 노출)
+
+    # ---------- Qt 모델 인터페이스 ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        value = self._rows[index.row()][index.column()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return f"{value}위"
+            if col == 5:
+                return f"{value:g}"
+            return value if col == 1 else str(value)
+        if role == Qt.ItemDataRole.UserRole:
+            return value  # 정렬용 원본 값 (숫자는 숫자로 비교)
+        if role == Qt.ItemDataRole.ForegroundRole and col == 5:
+            return self._SCORE_COLOR
+        if role == Qt.ItemDataRole.TextAlignmentRole and col != 1:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    # ---------- 랭킹 갱신 (변경분만 반영) ----------
+    def apply_rankings(self, data):
+        """
+        ranking_signal 데이터 반영: [(닉네임, {'comment','reply','like','score'}), ...] (점수순)
+        - 사라진 닉네임만 삭제
+        - 순위 순서가 그대로면 값이 바뀐 행만 dataChanged, 새 닉네임은 끝에 추가
+        - 순위가 바뀌었으면 레이아웃 변경으로 재정렬 (지연 노출된 앞부분이 항상 상위 N명이 되도록)
+        """
+        incoming = {}
+        for rank, (nick, d) in enumerate(data or [], 1):
+            score = d.get('score', 0)
+            incoming[nick] = [rank, nick, d.get('comment', 0), d.get('reply', 0), d.get('like', 0),
+                              round(score, 1) if isinstance(score, float) else score]
+
+        if not incoming or not self._rows:
+            self._reset(list(incoming.values()))
+            return
+
+        removed = [i for i, row in enumerate(self._rows) if row[1] not in incoming]
+        if self._rows and len(removed) >= len(self._rows) * self.RESET_RATIO:
+            self._reset(list(incoming.values()))
+            return
+
+        # 1. 사라진 이웃 삭제 (뒤에서부터 삭제해 앞쪽 행 번호 유지)
+        for i in reversed(removed):
+            if i < self._loaded:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self._loaded -= 1
+                self.endRemoveRows()
+            else:
+                del self._rows[i]
+
+        ranked = list(incoming.values())
+        if [row[1] for row in self._rows] != [row[1] for row in ranked[:len(self._rows)]]:
+            # 2-a. 순위 변동 -> 점수순으로 재배치 (노출 행 수는 유지, 선택 등 영구 인덱스는 새 위치로 이동)
+            self._reorder(ranked)
+        else:
+            # 2-b. 순서 유지 -> 기존 이웃 값 갱신 (바뀐 행 범위만 알림)
+            first = last = None
+            for i, row in enumerate(self._rows):
+                new_row = ranked[i]
+                if new_row != row:
+                    self._rows[i] = new_row
+                    if i < self._loaded:
+                        first = i if first is None else first
+                        last = i
+            if first is not None:
+                self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.HEADERS) - 1))
+
+            # 3. 신규 이웃 추가 (노출은 fetchMore가 담당)
+            self._rows.extend(ranked[len(self._rows):])
+
+        if self._loaded < self.FETCH_BATCH and self.canFetchMore():
+            self.fetchMore()
+
+    def _reorder(self, rows):
+        self.layoutAboutToBeChanged.emit()
+        new_pos = {row[1]: i for i, row in enumerate(rows)}
+        old_nicks = [row[1] for row in self._rows]
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for idx in old_indexes:
+            row = new_pos[old_nicks[idx.row()]]
+            # 노출 범위 밖으로 밀려난 행은 무효 인덱스 (다시 스크롤하면 fetchMore로 노출)
+            new_indexes.append(self.index(row, idx.column()) if row < self._loaded else QModelIndex())
+        self._rows = rows
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _reset(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(self.FETCH_BATCH, len(rows))
+        self.endResetModel()
+
+class RankingFilterProxy(QSortFilterProxyModel):
+    """닉네임 필터 + 원본 값 기준 정렬"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(Qt.ItemDataRole.UserRole)
+        self.setFilterKeyColumn(1)
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setDynamicSortFilter(True)
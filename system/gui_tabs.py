@@ -1,12 +1,13 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QFormLayout, 
     QLineEdit, QComboBox, QHBoxLayout, 
-    QPushButton, QLabel, QCheckBox, QFrame, 
-    QScrollArea, QMessageBox
+    QPushButton, QLabel, QCheckBox, 
+    QMessageBox, QTableView, QHeaderView, QAbstractItemView
 )
 from PyQt6.QtCore import Qt
 import config
 from bot_class.db_manager import BlogDB
+from gui_ranking import RankingTableModel, RankingFilterProxy
 
 class LikeTab(QWidget):
     def __init__(self, parent_main):
@@ -115,9 +116,9 @@ class SmartNeighborManagementTab(QWidget):
         conf = config.SMART_NEIGHBOR_CONFIG
         self.s_base = QGroupBox("📌 제어")
         form = QFormLayout(self.s_base)
-        self.target_comment = QLineEdit(str(conf["conditions"].get("댓글목표", 20)))
-        self.start_pg = QLineEdit(str(conf["conditions"].get("시작페이지", 1)))
-        self.comment_interval = QLineEdit(str(conf["conditions"].get("댓글주기", 1)))
+        self.target_comment = QLineEdit(str(conf["conditions"]["댓글목표"]))
+        self.start_pg = QLineEdit(str(conf["conditions"]["시작페이지"]))
+        self.comment_interval = QLineEdit(str(conf["conditions"]["댓글주기"]))
         form.addRow("댓글 목표:", self.target_comment)
         form.addRow("시작 페이지:", self.start_pg)
         form.addRow("주기(일):", self.comment_interval)
@@ -126,14 +127,14 @@ class SmartNeighborManagementTab(QWidget):
         self.inputs = {
             "댓글목표": self.target_comment, 
             "시작페이지": self.start_pg, 
-            "방문주기": self.comment_interval
+            "댓글주기": self.comment_interval
         }
 
         self.s_adv = QGroupBox("⚙️ AI/설정")
         vbox = QVBoxLayout(self.s_adv)
         hb = QHBoxLayout()
         self.ai_toggle = QCheckBox("🤖 Gemini AI 사용")
-        self.ai_toggle.setChecked(config.GEMINI_CONFIG.get("USE_GEMINI", False))
+        self.ai_toggle.setChecked(config.GEMINI_CONFIG["USE_GEMINI"])
         self.ai_toggle.stateChanged.connect(self.main.save_smart_settings)
         self.ai_status_msg = QLabel()
         hb.addWidget(self.ai_toggle)
@@ -162,28 +163,34 @@ class SmartNeighborManagementTab(QWidget):
 
         self.s_ranking = QGroupBox("🏆 랭킹")
         rl = QVBoxLayout(self.s_ranking)
-        
-        # 헤더 섹션
-        header = QFrame()
-        header.setStyleSheet("background-color: #333; font-weight: bold; border-radius: 4px;")
-        hl = QHBoxLayout(header)
-        hl.setContentsMargins(5, 2, 5, 2)
-        hl.addWidget(QLabel("순위"), 1)
-        hl.addWidget(QLabel("닉네임"), 3)
-        hl.addWidget(QLabel("댓글"), 1)
-        hl.addWidget(QLabel("답글"), 1)
-        hl.addWidget(QLabel("공감"), 1)
-        hl.addWidget(QLabel("점수"), 1)
-        rl.addWidget(header)
-
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("background: #252526; border: none;")
-        self.scroll_content = QWidget()
-        self.ranking_vbox = QVBoxLayout(self.scroll_content)
-        self.ranking_vbox.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.scroll.setWidget(self.scroll_content)
-        rl.addWidget(self.scroll)
+
+        # 닉네임 필터
+        self.ranking_filter = QLineEdit()
+        self.ranking_filter.setPlaceholderText("🔍 닉네임 검색")
+        self.ranking_filter.setFixedHeight(24)
+        rl.addWidget(self.ranking_filter)
+
+        # 랭킹 표 (모델/뷰: 보이는 행만 렌더링, 헤더 클릭으로 정렬)
+        self.ranking_model = RankingTableModel(self)
+        self.ranking_proxy = RankingFilterProxy(self)
+        self.ranking_proxy.setSourceModel(self.ranking_model)
+        self.ranking_filter.textChanged.connect(self.ranking_proxy.setFilterFixedString)
+
+        self.ranking_view = QTableView()
+        self.ranking_view.setModel(self.ranking_proxy)
+        self.ranking_view.setSortingEnabled(True)
+        self.ranking_view.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        self.ranking_view.verticalHeader().setVisible(False)
+        self.ranking_view.verticalHeader().setDefaultSectionSize(22)
+        self.ranking_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.ranking_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.ranking_view.setShowGrid(False)
+        self.ranking_view.setStyleSheet("background: #252526; border: none;")
+        h_header = self.ranking_view.horizontalHeader()
+        h_header.setStyleSheet("QHeaderView::section { background-color: #333; font-weight: bold; }")
+        h_header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        h_header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        rl.addWidget(self.ranking_view)
         layout.addWidget(self.s_ranking)
 
         act = QHBoxLayout()
@@ -207,28 +214,14 @@ class SmartNeighborManagementTab(QWidget):
         self.ai_status_msg.setStyleSheet(f"color: {'#2DB400' if on else '#C13535'}; font-size: 10px;")
 
     def update_ranking_ui(self, data):
-        for i in reversed(range(self.ranking_vbox.count())):
-            self.ranking_vbox.itemAt(i).widget().setParent(None)
-        if not data: return
-        for i, (nick, d) in enumerate(data, 1):
-            row = QFrame()
-            row.setFixedHeight(22)
-            row.setStyleSheet("border-bottom: 1px solid #333;")
-            rl = QHBoxLayout(row)
-            rl.setContentsMargins(5, 0, 5, 0)
-            rl.addWidget(QLabel(f"{i}위"), 1)
-            rl.addWidget(QLabel(f"<b>{nick}</b>"), 3)
-            rl.addWidget(QLabel(str(d.get('comment', 0))), 1)
-            rl.addWidget(QLabel(str(d.get('reply', 0))), 1) # 답글 필드 추가
-            rl.addWidget(QLabel(str(d.get('like', 0))), 1)
-            rl.addWidget(QLabel(f"<span style='color:#2DB400;'>{d.get('score', 0)}</span>"), 1)
-            self.ranking_vbox.addWidget(row)
+        # 위젯을 다시 만들지 않고 모델에 변경분만 반영
+        self.ranking_model.apply_rankings(data)
 
     def reset_db(self):
         """이웃 점수 및 스캔 기록 초기화"""
         reply = QMessageBox.question(
             self, '초기화 경고', 
-            '이웃 점수 통계와 마지막 스캔 시점을 모두 삭제하시겠습니까?\n삭제된 데이터는 복구할 수 없습니다.',
+            '이웃 점수 통계, 알림 이벤트 기록과 마지막 스캔 시점을 모두 삭제하시겠습니까?\n삭제된 데이터는 복구할 수 없습니다.',
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
             QMessageBox.StandardButton.No
         )
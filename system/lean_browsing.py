@@ -0,0 +1,162 @@
+# system/lean_browsing.py
+# 가벼운 탐색 프로필 + 페이지 로딩 측정 (설정: setup_browser.txt 의 BROWSER_OPTIONS)
+# - 봇은 DOM 텍스트와 버튼 몇 개만 쓰므로 이미지/동영상/폰트/광고 스크립트를 기다릴 필요가 없음
+import json
+import time
+import threading
+
+import config
+from selenium.webdriver.remote.command import Command
+
+# 미디어/폰트 차단용 URL 패턴 (CDP Network.setBlockedURLs, '*' 와일드카드)
+MEDIA_URL_PATTERNS = ["*.mp4*", "*.m3u8*", "*.webm*", "*.mp3*", "*.m4a*"]
+FONT_URL_PATTERNS = ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"]
+
+def is_lean_enabled():
+    return config.BROWSER_CONFIG["options"]["가벼운탐색"]
+
+def apply_lean_options(options):
+    """브라우저 시작 옵션 적용 (모든 탭/팝업 창에 공통 적용되는 항목)"""
+    opts = config.BROWSER_CONFIG["options"]
+    # DOMContentLoaded 까지만 대기 (이미지/광고 로딩 완료를 기다리지 않음)
+    options.page_load_strategy = 'eager'
+    if opts["이미지차단"]:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if opts["미디어차단"]:
+        options.add_argument("--autoplay-policy=user-gesture-required")
+    if opts["광고차단"] and config.BROWSER_CONFIG["blocked_hosts"]:
+        # 호스트 이름 해석 단계에서 차단 -> 새 창/팝업에도 동일하게 적용
+        rules = ", ".join(f"MAP {host} ~NOTFOUND" for host in config.BROWSER_CONFIG["blocked_hosts"])
+        options.add_argument(f"--host-resolver-rules={rules}")
+
+def blocked_url_patterns():
+    """설정 기준 미디어/폰트 차단 URL 패턴 (브라우저 시작 시 driver.blocked_urls 로 고정)"""
+    opts = config.BROWSER_CONFIG["options"]
+    patterns = []
+    if opts["미디어차단"]:
+        patterns += MEDIA_URL_PATTERNS
+    if opts["폰트차단"]:
+        patterns += FONT_URL_PATTERNS
+    return patterns
+
+def apply_meter_options(options):
+    """
+    페이지 로딩 측정용 크롬 성능 로그 (CDP Network 이벤트) 활성화
+    - Network.loadingFinished.encodedDataLength 는 다른 출처(pstatic.net 이미지 등) 리소스까지 실제 전송량을 보고함
+    """
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+def apply_lean_cdp(driver):
+    """
+    현재 탭에 미디어/폰트 URL 차단 적용 (CDP, 탭 단위 -> 새 창/팝업으로 전환할 때마다 다시 호출)
+    - 패턴은 driver.blocked_urls (브라우저 시작 시 고정, 재생 드라이버는 기록 값을 사용)
+    """
+    patterns = getattr(driver, 'blocked_urls', None)
+    if not patterns:
+        return
+    try:
+        # execute_cdp_cmd 와 같은 명령 (재생 드라이버에서도 같은 왕복으로 재현되도록 execute 로 직접 전송)
+        driver.execute("executeCdpCommand", {'cmd': "Network.enable", 'params': {}})
+        driver.execute("executeCdpCommand", {'cmd': "Network.setBlockedURLs", 'params': {"urls": patterns}})
+    except Exception as e:
+        print(f"⚠️ 리소스 차단 설정 실패: {e}")
+
+class PageLoadMeter:
+    """
+    driver.get 마다 소요 시간과 전송량 집계
+    - 작업 단위로 begin_run/end_run, 종료 시 모드(가벼운 탐색 여부)와 함께 출력
+    - 전송량: 크롬 성능 로그(apply_meter_options)의 Network.loadingFinished 합계
+      (GET 직전에 로그를 비우며 직전 페이지 체류 중 전송량까지 집계 -> 지연 로딩 이미지 포함)
+    - 로그 조회는 command_executor 원본으로 직접 보내므로 명령 기록(CommandRecorder)/계측(DriverProfiler)에 잡히지 않음
+      -> 세션 생성 시 기록기보다 먼저, 계측기보다 나중에 연결해야 함 (GET 시간에 로그 조회 시간이 섞이지 않도록)
+    """
+    def __init__(self, driver):
+        self._lock = threading.Lock()
+        self._measuring = False
+        self._reset()
+        self.rebind(driver)
+
+    def rebind(self, driver):
+        """드라이버에 측정 연결 (브라우저 재시작 시 새 드라이버로 옮겨 작업 집계를 이어감)"""
+        self._execute = driver.execute
+        self._raw_execute = driver.command_executor.execute
+        self._driver = driver
+        driver.execute = self._measured_execute
+        driver.page_meter = self
+
+    def _reset(self):
+        self.pages = 0
+        self.load_time = 0.0
+        self.bytes = 0
+        self.resources = 0
+        self.slowest = (0.0, "")
+
+    def _drain_network_log(self):
+        """쌓인 성능 로그를 비우고 전송 완료된 리소스 (바이트, 개수) 반환 (측정 중이 아니어도 비워서 로그가 쌓이지 않게 함)"""
+        try:
+            result = self._raw_execute(Command.GET_LOG, {'sessionId': self._driver.session_id, 'type': 'performance'})
+        except Exception:
+            return 0, 0
+        total = count = 0
+        for entry in result.get('value') or []:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            if message.get('method') == 'Network.loadingFinished':
+                total += message.get('params', {}).get('encodedDataLength', 0) or 0
+                count += 1
+        return total, count
+
+    def _add_transfer(self):
+        page_bytes, resources = self._drain_network_log()
+        if self._measuring:
+            with self._lock:
+                self.bytes += page_bytes
+                self.resources += resources
+
+    def _measured_execute(self, driver_command, params=None):
+        if driver_command != Command.GET:
+            return self._execute(driver_command, params)
+        self._add_transfer()
+        if not self._measuring:
+            return self._execute(driver_command, params)
+        start = time.perf_counter()
+        response = self._execute(driver_command, params)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.pages += 1
+            self.load_time += elapsed
+            if elapsed > self.slowest[0]:
+                self.slowest = (elapsed, (params or {}).get('url', ''))
+        return response
+
+    def begin_run(self):
+        self._drain_network_log()  # 작업 전 로그는 집계하지 않음
+        with self._lock:
+            self._reset()
+        self._measuring = True
+
+    def end_run(self):
+        """작업 종료 시 집계 출력 -> 요약 dict 반환"""
+        self._add_transfer()  # 마지막 페이지 체류 중 전송량
+        self._measuring = False
+        with self._lock:
+            if not self.pages:
+                return None
+            summary = {
+                'lean': is_lean_enabled(),
+                'pages': self.pages,
+                'avg_load': self.load_time / self.pages,
+                'total_bytes': self.bytes,
+                'avg_bytes': self.bytes / self.pages,
+                'avg_resources': self.resources / self.pages,
+                'slowest': self.slowest,
+            }
+        mode = "가벼운 탐색" if summary['lean'] else "일반 탐색"
+        print(f"\n📶 [페이지 로딩 - {mode}] {summary['pages']}페이지 | 평균 {summary['avg_load']:.2f}초 | "
+              f"평균 {summary['avg_bytes'] / 1024:.0f}KB (리소스 {summary['avg_resources']:.0f}개) | "
+              f"총 {summary['total_bytes'] / 1024 / 1024:.1f}MB")
+        print(f"   가장 느린 페이지: {summary['slowest'][0]:.2f}초 {summary['slowest'][1]}")
+        return summary
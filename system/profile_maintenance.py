@@ -0,0 +1,126 @@
+# system/profile_maintenance.py
+# 크롬 프로필(user_data/naver_profile) 관리: 크기 보고 + 캐시 정리 (설정: setup_browser.txt 의 PROFILE_MAINTENANCE)
+# - 지우는 것: HTTP 캐시, 코드/GPU/셰이더 캐시, 서비스 워커 캐시 저장소 (다음 방문 때 다시 받아지는 데이터)
+# - 남기는 것: Cookies, Local Storage, Session Storage, IndexedDB, Login Data, Preferences (로그인 유지에 필요)
+# - 크롬이 프로필을 사용 중이면 정리하지 않음 (브라우저 시작 전에만 호출)
+import os
+import time
+import shutil
+import socket
+
+import config
+from bot_class.db_manager import BlogDB
+
+# 프로필 루트 기준 (브라우저 전체 공용 캐시)
+ROOT_CACHE_DIRS = [
+    "GrShaderCache", "ShaderCache", "GraphiteDawnCache", "component_crx_cache",
+    "extensions_crx_cache", "BrowserMetrics", "Crashpad",
+]
+# 각 사용자 프로필(Default, Profile 1 ...) 기준
+PROFILE_CACHE_DIRS = [
+    "Cache", "Code Cache", "GPUCache", "DawnCache", "DawnGraphiteCache", "DawnWebGPUCache",
+    "blob_storage", os.path.join("Service Worker", "CacheStorage"), os.path.join("Service Worker", "ScriptCache"),
+]
+
+MB = 1024 * 1024
+
+def _dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+def _user_profiles(profile_path):
+    """Default / Profile N 폴더 목록 (Preferences 파일이 있는 폴더)"""
+    try:
+        names = os.listdir(profile_path)
+    except OSError:
+        return []
+    return [os.path.join(profile_path, n) for n in names
+            if os.path.isfile(os.path.join(profile_path, n, "Preferences"))]
+
+def cache_dirs(profile_path):
+    """정리 대상 폴더 (존재하는 것만)"""
+    targets = [os.path.join(profile_path, d) for d in ROOT_CACHE_DIRS]
+    for user_profile in _user_profiles(profile_path):
+        targets += [os.path.join(user_profile, d) for d in PROFILE_CACHE_DIRS]
+    return [t for t in targets if os.path.isdir(t)]
+
+def profile_size(profile_path):
+    """프로필 크기 -> (전체 바이트, 캐시 바이트)"""
+    cache = sum(_dir_size(d) for d in cache_dirs(profile_path))
+    return _dir_size(profile_path), cache
+
+def is_profile_in_use(profile_path):
+    """
+    크롬이 프로필을 사용 중인지 확인
+    - mac/linux: SingletonLock 심볼릭 링크("호스트-PID")의 프로세스가 살아 있는지 확인 (비정상 종료로 남은 잠금은 무시)
+    - windows: lockfile 이 다른 프로세스에 열려 있으면 삭제 불가 -> 사용 중
+    """
+    singleton = os.path.join(profile_path, "SingletonLock")
+    if os.path.lexists(singleton):
+        try:
+            host, _, pid = os.readlink(singleton).rpartition("-")
+            if host and host != socket.gethostname():
+                return True
+            os.kill(int(pid), 0)
+            return True
+        except ProcessLookupError:
+            return False
+        except (OSError, ValueError):
+            return True
+    lockfile = os.path.join(profile_path, "lockfile")
+    if os.path.exists(lockfile):
+        try:
+            os.remove(lockfile)
+        except OSError:
+            return True
+    return False
+
+def prune_profile(profile_path):
+    """캐시 폴더 삭제 -> 확보한 바이트 (사용 중이면 None)"""
+    if is_profile_in_use(profile_path):
+        print("⚠️ 브라우저가 프로필을 사용 중이라 캐시를 정리하지 않았습니다.")
+        return None
+    freed = 0
+    for target in cache_dirs(profile_path):
+        size = _dir_size(target)
+        shutil.rmtree(target, ignore_errors=True)
+        freed += size - (_dir_size(target) if os.path.exists(target) else 0)
+    return freed
+
+def maintain_profile(profile_path, force=False):
+    """
+    브라우저 시작 전 프로필 점검 (설정 기준을 넘었거나 force=True면 캐시 정리)
+    - 반환: (정리 후 프로필 바이트, 확보한 바이트 또는 정리하지 않았으면 None)
+    """
+    settings = config.BROWSER_CONFIG["maintenance"]
+    total, cache = profile_size(profile_path)
+    print(f"🗂️ 브라우저 프로필 {total / MB:.0f}MB (캐시 {cache / MB:.0f}MB)")
+
+    if not force:
+        if not settings["자동정리"] or cache == 0:
+            return total, None
+        days_since = (time.time() - BlogDB().get_last_profile_maintenance()) / 86400
+        if cache < settings["정리기준MB"] * MB and days_since < settings["정리주기"]:
+            return total, None
+
+    freed = prune_profile(profile_path)
+    if freed is None:
+        return total, None
+    print(f"🧹 프로필 캐시 정리: {freed / MB:.0f}MB 확보 -> {(total - freed) / MB:.0f}MB (쿠키/로그인 정보 유지)")
+    return total - freed, freed
+
+def print_launch_trend(current, limit=10):
+    """이번 실행의 시작 시간을 최근 실행 평균과 비교 출력 (느려졌는지 확인용)"""
+    previous = [r['cold_start'] for r in BlogDB().get_recent_launches(limit + 1)[1:] if r['cold_start']]
+    if not previous:
+        print(f"⏱️ 브라우저 시작 {current:.1f}초")
+        return
+    average = sum(previous) / len(previous)
+    mark = " ⚠️ 평소보다 느림" if current > average * 1.5 and current - average > 1.0 else ""
+    print(f"⏱️ 브라우저 시작 {current:.1f}초 (최근 {len(previous)}회 평균 {average:.1f}초){mark}")
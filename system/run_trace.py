@@ -0,0 +1,111 @@
+# system/run_trace.py
+# 작업 타임라인 추적 (선택 기능: config.TRACE_RUNS / 환경변수 NAVER_BOT_TRACE=1)
+# - 작업 1회를 Chrome Trace Event JSON 으로 저장 -> chrome://tracing 또는 ui.perfetto.dev 에서 열어 확인
+# - 꺼져 있으면 span()은 공용 nullcontext를 돌려주고, traced 함수는 원래 함수를 바로 호출 (추가 비용 거의 없음)
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import config
+
+_NULL_SPAN = nullcontext()
+
+class Tracer:
+    """
+    중첩 구간(span) 기록기: 스레드별로 시작/종료 시각을 'X'(complete) 이벤트로 쌓아 두었다가 작업 종료 시 저장
+    - 같은 스레드의 구간은 시간 포함 관계로 자동 중첩 표시 (페이지 로딩 > 게시글 작업 > AI 호출/DB 기록/대기)
+    """
+    # 현재 기록 중인 추적기 (작업 스레드 외에 AI 호출/실행 기록 스레드도 같은 추적기에 기록)
+    _active = None
+    MAX_EVENTS = 200000   # 긴 세션에서 메모리가 무한히 늘지 않도록 상한 (초과분은 개수만 셈)
+
+    def __init__(self, task):
+        self.task = task
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._threads = {}
+        self.events = []
+        self.dropped = 0
+
+    @contextmanager
+    def span(self, name, cat="bot", args=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, cat, start, time.perf_counter(), args)
+
+    def _add(self, name, cat, start, end, args):
+        tid = threading.get_ident()
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'pid': os.getpid(), 'tid': tid,
+                 'ts': round((start - self._t0) * 1e6, 1), 'dur': round((end - start) * 1e6, 1)}
+        if args:
+            event['args'] = args
+        with self._lock:
+            if tid not in self._threads:
+                self._threads[tid] = threading.current_thread().name
+            if len(self.events) >= self.MAX_EVENTS:
+                self.dropped += 1
+                return
+            self.events.append(event)
+
+    @classmethod
+    def begin(cls, task):
+        """작업 시작 시 호출 (추적이 꺼져 있으면 None)"""
+        if not config.TRACE_RUNS:
+            return None
+        cls._active = cls(task)
+        return cls._active
+
+    @classmethod
+    def end(cls):
+        """작업 종료 시 호출: user_data/reports 에 저장 -> 저장 경로 반환"""
+        tracer, cls._active = cls._active, None
+        return tracer.save() if tracer is not None else None
+
+    def save(self):
+        pid = os.getpid()
+        with self._lock:
+            meta = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': f"naver-bot {self.task}"}}]
+            meta += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                     for tid, name in self._threads.items()]
+            trace = {
+                'traceEvents': meta + self.events,
+                'displayTimeUnit': 'ms',
+                'otherData': {'task': self.task, 'dropped_events': self.dropped,
+                              'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds')},
+            }
+        try:
+            os.makedirs(config.reports_dir, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            path = os.path.join(config.reports_dir, f"trace_{self.task}_{stamp}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(trace, f, ensure_ascii=False)
+            print(f"🧭 타임라인 저장: {path} ({len(self.events)}개 구간, chrome://tracing 에서 열기)")
+            return path
+        except Exception as e:
+            print(f"⚠️ 타임라인 저장 실패: {e}")
+            return None
+
+def span(name, cat="bot", args=None):
+    """추적 구간 (with 문으로 사용). 추적이 꺼져 있으면 아무것도 하지 않음"""
+    tracer = Tracer._active
+    return tracer.span(name, cat, args) if tracer is not None else _NULL_SPAN
+
+def traced(name, cat="bot"):
+    """메서드 전체를 추적 구간으로 감싸는 데코레이터 (꺼져 있으면 원래 함수를 바로 호출)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = Tracer._active
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
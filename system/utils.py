@@ -1,14 +1,124 @@
 # system/utils.py
 import time
 import random
+import threading
+from datetime import datetime
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
 import config
+from driver_profiler import report_wait
+from run_trace import span
 from PyQt6.QtWidgets import QApplication
 
+class TaskCancelled(BaseException):
+    """
+    중단 요청으로 대기가 끊겼을 때 발생
+    - KeyboardInterrupt 처럼 BaseException 계열: 봇의 except Exception 처리부에 삼켜지지 않고 작업 스레드(ActionWorker)까지 전달됨
+    """
+    def __init__(self):
+        super().__init__("사용자에 의해 작업이 중단되었습니다")
+
+class CancelToken:
+    """작업 중단 신호 (threading.Event 기반). 대기 중에도 중단 요청 즉시 깨어남"""
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def wait(self, timeout):
+        """최대 timeout초 대기. 중단 요청이 오면 즉시 True 반환"""
+        return self._event.wait(timeout)
+
+# ActionWorker가 작업 스레드에 바인딩한 중단 신호 (utils 헬퍼들이 공통으로 사용)
+_thread_state = threading.local()
+
+def bind_cancel_token(token):
+    """현재 스레드의 중단 신호 지정 (ActionWorker.run 시작 시 호출)"""
+    _thread_state.cancel_token = token
+
+def current_cancel_token():
+    return getattr(_thread_state, 'cancel_token', None)
+
+# 사람 흉내 대기 배율 (1.0 = 설정값 그대로, 벤치마크는 0으로 두어 대기 없이 실행 비용만 측정)
+_delay_scale = 1.0
+
+# 사람 흉내 대기/타이핑 전용 난수 (댓글 길이나 대기 횟수가 달라져도 스크롤 단계 수 등
+# 흐름을 정하는 전역 random 순서가 밀리지 않도록 분리 -> 기록 재생 시 같은 시드로 같은 흐름)
+_human_random = random.Random()
+
+def set_delay_scale(scale):
+    """smart_sleep/타이핑/스크롤 대기 배율 지정 (WebDriver 폴링 간격에는 적용하지 않음)"""
+    global _delay_scale
+    _delay_scale = max(0.0, float(scale))
+
+def _pause(seconds, scaled=True):
+    """중단 가능한 대기 (폴링 없이 Event.wait 1회). 중단 요청 시 TaskCancelled 발생"""
+    if scaled:
+        seconds *= _delay_scale
+    token = current_cancel_token()
+    start = time.perf_counter()
+    try:
+        if token is None:
+            time.sleep(seconds)
+        elif token.wait(seconds):
+            raise TaskCancelled()
+    finally:
+        # 계측 중이면 대기 시간 보고 (사람 흉내 대기 vs 요소 대기 폴링 구분)
+        report_wait(time.perf_counter() - start, deliberate=scaled)
+
+def current_time(driver=None):
+    """현재 시각 (재생 드라이버면 기록 시작 시각 + 재생 시계 -> 시간 기준 판단도 기록과 같게 재현)"""
+    replay_clock = getattr(driver, 'replay_clock', None)
+    return replay_clock.now() if replay_clock is not None else datetime.now()
+
+class CancellableWait(WebDriverWait):
+    """WebDriverWait과 동일한 사용법. 폴링 사이 대기를 중단 신호로 수행하여 중단 시 즉시 빠져나옴"""
+    def __init__(self, driver, timeout, poll_frequency=0.2, ignored_exceptions=None):
+        super().__init__(driver, timeout, poll_frequency, ignored_exceptions)
+
+    def rebind(self, driver):
+        """브라우저 재시작 후 새 드라이버로 교체 (대기 설정은 유지)"""
+        self._driver = driver
+
+    def _poll_until(self, predicate, message):
+        # 재생 드라이버(ReplayDriver)는 실제 대기 없이 기록 시각으로 시간 초과를 판정 (폴링 횟수까지 기록과 동일)
+        replay_clock = getattr(self._driver, 'replay_clock', None)
+        clock = replay_clock.monotonic if replay_clock is not None else time.monotonic
+        end_time = clock() + self._timeout
+        while True:
+            try:
+                value = predicate()
+                if value is not None:
+                    return value
+            except self._ignored_exceptions:
+                pass
+            if clock() > end_time:
+                break
+            if replay_clock is None:
+                _pause(self._poll, scaled=False)
+        raise TimeoutException(message)
+
+    def until(self, method, message=""):
+        def predicate():
+            value = method(self._driver)
+            return value if value else None
+        return self._poll_until(predicate, message)
+
+    def until_not(self, method, message=""):
+        def predicate():
+            return True if not method(self._driver) else None
+        return self._poll_until(predicate, message)
+
 def smart_sleep(range_tuple, reason):
-    """지정된 범위 내에서 랜덤하게 대기하며 사유를 출력 (GUI 먹통/발열 방지 버전)"""
+    """지정된 범위 내에서 랜덤하게 대기하며 사유를 출력 (중단 요청 시 즉시 TaskCancelled)"""
     min_sec, max_sec = range_tuple
-    wait_time = random.uniform(min_sec, max_sec)
+    wait_time = _human_random.uniform(min_sec, max_sec)
     
     exclude_reasons = [
         "메시지 작성 후 검토 대기", 
@@ -27,11 +137,10 @@ def smart_sleep(range_tuple, reason):
         if wait_time > 0.5:
             print(f"   (⏳ {reason}: {wait_time:.2f}초...)")
 
-    # [핵심] 통으로 time.sleep을 쓰면 중단 반응이 느려지므로
-    # 0.1초 단위로 쪼개서 대기 (GUI 프리징 없음 + 발열 방지)
-    start_time = time.time()
-    while time.time() - start_time < wait_time:
-        time.sleep(0.1) 
+    # [핵심] 0.1초 폴링 대신 중단 신호를 한 번만 기다림
+    # (중단 요청 시 즉시 깨어남 + 대기 중 불필요한 CPU 깨우기 없음)
+    with span("smart_sleep", "delay", {'reason': reason} if reason else None):
+        _pause(wait_time)
                 
 def smart_click(driver, element):
     """요소의 크기를 계산하여 중앙 기준 랜덤 좌표로 물리적 클릭 수행"""
@@ -43,7 +152,7 @@ def smart_click(driver, element):
 
         # [수정] config.DELAY_RANGE 대신 LIKES_NEIGHBOR_CONFIG의 클릭랜덤화 설정 참조
         # 기본적으로 LIKES 설정을 참조하되, 유연한 관리를 위해 분리된 구조를 사용합니다.
-        ratio = config.LIKES_NEIGHBOR_CONFIG["delays"].get("클릭랜덤화", 2)
+        ratio = config.LIKES_NEIGHBOR_CONFIG["delays"]["클릭랜덤화"]
         
         random_x = random.randint(int(-w/ratio), int(w/ratio))
         random_y = random.randint(int(-h/ratio), int(h/ratio))
@@ -61,7 +170,7 @@ def human_typing(element, text):
     for char in text:
         element.send_keys(char)
         # 글자 사이의 간격을 랜덤하게 줘서 기계적인 느낌을 없앰
-        time.sleep(random.uniform(0.05, 0.15))
+        _pause(_human_random.uniform(0.05, 0.15))
         
 def human_scroll_distance(driver, distance):
     """마우스 휠을 굴리는 물리 스크롤 (자바스크립트 X)"""
@@ -99,9 +208,11 @@ def human_scroll_element(driver, target_element):
         
         for _ in range(steps):
             actions.scroll_by_amount(0, int(distance_per_step)).perform()
-            time.sleep(random.uniform(0.1, 0.3)) # 휠 굴리는 사이의 짧은 대기
+            _pause(_human_random.uniform(0.1, 0.3)) # 휠 굴리는 사이의 짧은 대기
             
         return True
+    except TaskCancelled:
+        raise
     except Exception as e:
         print(f"   (⚠️ 물리 스크롤 실패 : {e})")
         return False
@@ -127,4 +238,4 @@ def human_scroll_to_ratio(driver, scroll_ratio):
         remaining = target_position - current_pos
         
         # 사람처럼 잠깐씩 쉬기
-        time.sleep(random.uniform(0.1, 0.3))
\ No newline at end of file
+        _pause(_human_random.uniform(0.1, 0.3))
\ No newline at end of file
@@ -0,0 +1,199 @@
+# tests/test_driver_replay.py
+# WebDriver 기록/재생(driver_replay) 회귀 테스트 (브라우저 없이 실행)
+# - recordings/synthetic_basic.json.gz : GET / findElement / text 최소 기록 (저장소에 포함된 합성 기록)
+# - 스마트 관리 댓글 흐름은 ScriptedExecutor(가짜 브라우저)로 기록한 뒤 strict 재생
+import os
+import sys
+import random
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "system"))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+import config
+import utils
+import ai_helper
+from bot_class.db_manager import BlogDB
+from driver_replay import (CommandRecorder, ReplayDriver, ReplayMismatch, load_recording, replayable,
+                           save_recording, RECORDING_VERSION)
+
+RECORDING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings")
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+@pytest.fixture(autouse=True)
+def isolated_db(tmp_path, monkeypatch):
+    """테스트마다 빈 DB / 보고서 폴더 사용 + 대기 없음"""
+    BlogDB.close()
+    monkeypatch.setattr(config, "path_db", str(tmp_path / "test.db"))
+    monkeypatch.setattr(config, "reports_dir", str(tmp_path / "reports"))
+    utils.set_delay_scale(0)
+    yield
+    BlogDB.close()
+    utils.set_delay_scale(1)
+
+def _basic_driver(strict=True):
+    return ReplayDriver(os.path.join(RECORDING_DIR, "synthetic_basic.json.gz"), strict=strict)
+
+def _run_basic(driver):
+    driver.get("https://blog.naver.com/fixture0001")
+    return driver.find_element(By.CSS_SELECTOR, ".se-title-text").text
+
+def test_synthetic_recording_replays():
+    driver = _basic_driver()
+    driver.rewind()
+    assert _run_basic(driver) == "fixture 제목"
+    report = driver.replay_report()
+    assert report['mismatches'] == [] and report['remaining'] == 0 and report['served'] == 3
+
+def test_rewind_replays_again_with_same_seed():
+    driver = _basic_driver()
+    driver.rewind()
+    first = random.random()
+    _run_basic(driver)
+    driver.rewind()
+    assert random.random() == first
+    assert _run_basic(driver) == "fixture 제목"
+
+def test_extra_command_is_mismatch():
+    driver = _basic_driver()
+    driver.rewind()
+    driver.get("https://blog.naver.com/fixture0001")
+    with pytest.raises(ReplayMismatch):
+        driver.find_element(By.CSS_SELECTOR, ".other")
+    assert driver.replay_report()['mismatches'][0]['at'] == 1
+    # strict: 불일치 이후 명령은 모두 거부
+    with pytest.raises(ReplayMismatch):
+        driver.find_element(By.CSS_SELECTOR, ".se-title-text")
+
+def test_replay_clock_follows_recording():
+    driver = _basic_driver()
+    driver.rewind()
+    start = datetime.fromisoformat(driver.meta['created_at'])
+    assert utils.current_time(driver) == start
+    _run_basic(driver)
+    elapsed = (utils.current_time(driver) - start).total_seconds() * 1000
+    assert elapsed == driver.recording['commands'][-1][3]
+
+def test_replayable_inputs():
+    recording = load_recording(os.path.join(RECORDING_DIR, "synthetic_basic.json.gz"))
+    recording['inputs'] = [["ai_comment", "기록된 댓글"]]
+    driver = ReplayDriver(recording)
+    driver.rewind()
+    assert replayable(driver, "ai_comment", lambda: pytest.fail("재생 중에는 생성하지 않음")) == "기록된 댓글"
+    with pytest.raises(ReplayMismatch):
+        replayable(driver, "ai_comment", lambda: "")
+    assert driver.replay_report()['mismatches']
+
+def test_human_delays_do_not_consume_flow_random():
+    """타이핑 글자 수/템플릿 선택이 흐름용 전역 random 순서를 바꾸지 않음"""
+    class Field:
+        def send_keys(self, _):
+            pass
+    random.seed(7)
+    state = random.getstate()
+    utils.human_typing(Field(), "글자 수가 달라도 전역 난수는 그대로")
+    utils.smart_sleep((0.1, 0.2), None)
+    ai_helper.TemplateBackend().generate("", "제목: 테스트")
+    assert random.getstate() == state
+
+# ---------- 스마트 관리 댓글 흐름 (가짜 브라우저로 기록 -> strict 재생) ----------
+class ScriptedExecutor:
+    """댓글 흐름에 필요한 명령만 흉내 내는 가짜 브라우저 (피드 창 + 댓글 아이콘 클릭 시 블로그 창 1개)"""
+    TEXTS = {
+        ".se-title-text": "fixture 제목",
+        ".se-main-container": "fixture 본문입니다. " * 10,
+    }
+
+    def __init__(self):
+        self.windows = ["feed"]
+        self.current = "feed"
+        self.elements = {}
+
+    def _element(self, selector):
+        element_id = f"el{len(self.elements)}"
+        self.elements[element_id] = selector
+        return {'value': {ELEMENT_KEY: element_id}}
+
+    def execute(self, command, params=None):
+        params = params or {}
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': 'scripted', 'capabilities': {'browserName': 'chrome'}}}
+        if command in (Command.FIND_ELEMENT, Command.FIND_CHILD_ELEMENT):
+            return self._element(params.get('value'))
+        if command == Command.GET_ELEMENT_TEXT:
+            return {'value': self.TEXTS.get(self.elements.get(params.get('id')), "")}
+        if command == Command.GET_ELEMENT_RECT:
+            return {'value': {'x': 10, 'y': 900, 'width': 120, 'height': 30}}
+        if command == Command.W3C_ACTIONS:
+            # 댓글 아이콘 클릭 -> 블로그 창 열림
+            if self.current == "feed" and len(self.windows) == 1:
+                self.windows.append("blog")
+            return {'value': None}
+        if command == Command.W3C_GET_WINDOW_HANDLES:
+            return {'value': list(self.windows)}
+        if command == Command.W3C_GET_CURRENT_WINDOW_HANDLE:
+            return {'value': self.current}
+        if command == Command.SWITCH_TO_WINDOW:
+            self.current = params['handle']
+            return {'value': None}
+        if command == Command.CLOSE:
+            self.windows.remove(self.current)
+            return {'value': list(self.windows)}
+        if command == Command.W3C_EXECUTE_SCRIPT:
+            script = params.get('script', '')
+            if "innerHeight" in script:
+                return {'value': 800}
+            if "pageYOffset" in script:
+                return {'value': 0}
+            return {'value': None}
+        return {'value': None}
+
+def _comment_flow(driver):
+    """AI 댓글 1건 후 다음 게시글 공감 버튼으로 스크롤 (스크롤 단계 수는 흐름용 전역 random)"""
+    from bot_class.blog_smart_neighbor_management import BlogSmartNeighborManagement
+    bot = BlogSmartNeighborManagement(driver)
+    item = driver.create_web_element("feed-item")
+    ok = bot._execute_comment_logic(item, "fixture0001", "하늘여행", ["일반 댓글입니다"], "AI_COMMENT")
+    utils.human_scroll_element(driver, driver.create_web_element("like-btn"))
+    return ok
+
+def test_comment_flow_replays_strictly(monkeypatch):
+    monkeypatch.setitem(config.SMART_NEIGHBOR_CONFIG["conditions"], "AI백엔드", "template")
+    monkeypatch.setitem(config.SMART_NEIGHBOR_CONFIG["conditions"], "AI캐시유효시간", 0)
+
+    driver = RemoteWebDriver(command_executor=ScriptedExecutor(), options=Options())
+    recorder = CommandRecorder(driver)
+    recorder.begin_run("smart_neighbor_management_task", {})
+    assert _comment_flow(driver)
+    path = recorder.end_run()
+    recording = load_recording(path)
+    assert [kind for kind, _ in recording['inputs']] == ["ai_ready", "ai_comment"]
+
+    # 재생 시에는 AI 백엔드를 쓰지 않음 (키 없는 gemini 설정 + 다른 난수 상태여도 같은 흐름)
+    monkeypatch.setitem(config.SMART_NEIGHBOR_CONFIG["conditions"], "AI백엔드", "gemini")
+    monkeypatch.setitem(config.GEMINI_CONFIG, "GEMINI_API_KEY", "")
+    ai_helper.TemplateBackend._random.seed(99)
+    utils._human_random.seed(99)
+    BlogDB.close()
+    os.remove(config.path_db)
+
+    replay = ReplayDriver(recording)
+    replay.rewind()
+    assert _comment_flow(replay)
+    report = replay.replay_report()
+    assert report['mismatches'] == []
+    assert report['remaining'] == 0 and report['inputs_remaining'] == 0 and report['extra_keys'] == 0
+
+def test_recording_version_is_checked(tmp_path):
+    path = str(tmp_path / "old.json.gz")
+    save_recording(path, {'version': RECORDING_VERSION - 1}, [])
+    with pytest.raises(ValueError):
+        load_recording(path)